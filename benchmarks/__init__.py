@@ -0,0 +1,10 @@
+import os
+import sys
+
+# The emulator lives in src/ and is not necessarily installed, so make it
+# importable when run as `python -m benchmarks` from the repository root
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC = os.path.join(ROOT, 'src')
+
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
@@ -0,0 +1,81 @@
+import argparse
+import os
+import sys
+import time
+
+from benchmarks import ROOT, compare, runner, scenarios
+
+def default_output() -> str:
+    return os.path.join(ROOT, 'benchmarks', 'results', time.strftime('%Y%m%d-%H%M%S') + '.json')
+
+def run_main(argv):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks',
+                                     description='Headless emulator throughput benchmarks. '
+                                                 'See also: python -m benchmarks compare -h')
+    parser.add_argument('scenarios', nargs='*',
+                        help=f'scenarios to run (default: all available): {", ".join(scenarios.SCENARIOS)}')
+    parser.add_argument('--frames', type=int, default=60, help='frames per scenario')
+    parser.add_argument('--engine', choices=('interpreter', 'translator'), default='interpreter')
+    parser.add_argument('--no-opcodes', dest='opcodes', action='store_false',
+                        help='skip the per-opcode timings')
+    parser.add_argument('--iterations', type=int, default=2000,
+                        help='calls per handler for the per-opcode timings')
+    parser.add_argument('--samples', type=int, default=5, help='timed samples per case')
+    parser.add_argument('--warmup', type=int, default=1, help='untimed samples per case')
+    parser.add_argument('--output', help='JSON results path (default: benchmarks/results/<time>.json)')
+    args = parser.parse_args(argv)
+
+    unknown = set(args.scenarios) - set(scenarios.SCENARIOS)
+    if unknown:
+        parser.error(f'unknown scenarios: {", ".join(sorted(unknown))}')
+
+    names = args.scenarios or scenarios.available()
+    results = runner.run(names, args.frames, args.engine, args.opcodes,
+                         args.iterations, args.samples, args.warmup)
+
+    output = args.output or default_output()
+    runner.save(results, output)
+
+    print(runner.report(results))
+    print(f'\nSaved {output}')
+    return 0
+
+def compare_main(argv):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks compare',
+                                     description='Compare two result sets and exit with status 1 '
+                                                 'if anything regressed')
+    parser.add_argument('base', help='baseline results JSON')
+    parser.add_argument('new', nargs='?',
+                        help='results JSON to check (default: run the current tree with the '
+                             "baseline's settings)")
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='relative slowdown that counts as a regression (default: 0.1)')
+    parser.add_argument('--verbose', action='store_true', help='list every case')
+    parser.add_argument('--output', help='where to save the results of a fresh run')
+    args = parser.parse_args(argv)
+
+    base = runner.load(args.base)
+    if args.new:
+        new = runner.load(args.new)
+    else:
+        meta = base['meta']
+        new = runner.run(list(base['scenarios']), meta['frames'], meta['engine'],
+                         'opcodes' in base, meta['iterations'], meta['samples'], meta['warmup'])
+        output = args.output or default_output()
+        runner.save(new, output)
+        print(f'Saved {output}')
+
+    print(f"{base['meta']['commit']} -> {new['meta']['commit']}")
+    rows = compare.compare(base, new, args.threshold)
+    print(compare.report(rows, args.threshold, args.verbose))
+
+    return 1 if any(row[4] == 'regressed' for row in rows) else 0
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ['compare']:
+        return compare_main(argv[1:])
+    return run_main(argv)
+
+if __name__ == '__main__':
+    sys.exit(main())
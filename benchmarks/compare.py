@@ -0,0 +1,53 @@
+from benchmarks import stats
+from benchmarks.runner import handler_name
+
+# Compares two result sets case by case. Every case is a list of samples of
+# something where lower is better: ns per emulated cycle for a scenario, ns
+# per handler call for an opcode. A case regresses when its mean got slower by more than the
+# threshold and the confidence intervals do not overlap, so a noisy but
+# unchanged case is not reported.
+
+def cases(results: dict) -> dict:
+    out = {}
+    for name, scenario in results.get('scenarios', {}).items():
+        # ns per emulated cycle, so runs of different lengths compare
+        samples = scenario.get('samples') or [scenario['seconds']]
+        out[f'scenario {name}'] = [s / scenario['cycles'] * 1e9 for s in samples]
+    for key, samples in results.get('opcodes', {}).items():
+        # Results saved before samples were recorded hold a single mean
+        out[f'opcode {key} {handler_name(key)}'] = samples if isinstance(samples, list) else [samples]
+    return out
+
+def compare(base: dict, new: dict, threshold=0.1) -> list:
+    # Returns (case, base mean, new mean, change, status) rows, status one of
+    # 'regressed', 'improved' or 'same'
+    base_cases, new_cases = cases(base), cases(new)
+    rows = []
+
+    for case in base_cases.keys() & new_cases.keys():
+        before, after = base_cases[case], new_cases[case]
+        before_mean, after_mean = stats.mean(before), stats.mean(after)
+        before_low, before_high = stats.interval(before)
+        after_low, after_high = stats.interval(after)
+
+        change = after_mean / before_mean - 1 if before_mean else 0.0
+        if change > threshold and after_low > before_high:
+            status = 'regressed'
+        elif change < -threshold and after_high < before_low:
+            status = 'improved'
+        else:
+            status = 'same'
+        rows.append((case, before_mean, after_mean, change, status))
+
+    return sorted(rows, key=lambda row: row[3], reverse=True)
+
+def report(rows: list, threshold: float, verbose=False) -> str:
+    regressed = [row for row in rows if row[4] == 'regressed']
+    improved = [row for row in rows if row[4] == 'improved']
+
+    lines = [f'{len(rows)} cases, threshold {threshold:.0%}: '
+             f'{len(regressed)} regressed, {len(improved)} improved']
+    shown = rows if verbose else regressed + improved
+    for case, before, after, change, status in shown:
+        lines.append(f'  {status:<9} {case:<28} {before:>12.6g} -> {after:<12.6g} {change:+.1%}')
+    return '\n'.join(lines)
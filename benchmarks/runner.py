@@ -0,0 +1,179 @@
+import json
+import os
+import platform
+import subprocess
+import time
+from itertools import repeat
+
+from benchmarks import ROOT, stats
+from benchmarks.scenarios import SCENARIOS
+
+from processor import op_codes
+from processor.cpu import CLOCK_HZ, CYCLES_PER_FRAME, CPU
+
+# Layout used when timing handlers in isolation: the instruction and its
+# operands at CODE, with HL, BC, DE and SP pointing at scratch RAM
+CODE = 0xc000
+OPERANDS = (0x00, 0xc1)
+SCRATCH = 0xc100
+STACK = 0xd000
+
+def new_cpu(scenario: str, engine: str) -> CPU:
+    cpu = CPU(engine=engine)
+    SCENARIOS[scenario](cpu)
+    return cpu
+
+def count_instructions(scenario: str, frames: int) -> tuple:
+    # Untimed interpreter pass over the same frames with counting handlers,
+    # so idle loop iterations and HALTs that were skipped are not counted.
+    # Returns (instructions, cycles).
+    cpu = new_cpu(scenario, 'interpreter')
+    counter = [0]
+    def counting(handler):
+        def wrapper(cpu, mem):
+            counter[0] += 1
+            return handler(cpu, mem)
+        return wrapper
+    cpu.ops = tuple(counting(h) for h in cpu.ops)
+
+    for _ in range(frames):
+        cpu.run_frame()
+    return counter[0], cpu.cycles
+
+def _time_frames(scenario: str, frames: int, engine: str) -> tuple:
+    cpu = new_cpu(scenario, engine)
+
+    start = time.perf_counter()
+    for _ in range(frames):
+        cpu.run_frame()
+    return time.perf_counter() - start, cpu.cycles
+
+def run_scenario(scenario: str, frames: int, engine='interpreter', samples=1, warmup=0) -> dict:
+    # Each sample runs the scenario from a fresh CPU; warmup samples are
+    # discarded. Rates are from the mean time.
+    times = []
+    for i in range(warmup + samples):
+        seconds, cycles = _time_frames(scenario, frames, engine)
+        if i >= warmup:
+            times.append(seconds)
+
+    seconds = sum(times) / len(times)
+    # The programs are deterministic, so the interpreter stops where a timed
+    # interpreter run did; other engines can overshoot a frame by a little
+    # more, which is scaled for
+    counted, counted_cycles = count_instructions(scenario, frames)
+    instructions = round(counted * cycles / counted_cycles)
+    hz = cycles / seconds
+
+    return {
+        'frames': frames,
+        'cycles': cycles,
+        'instructions': instructions,
+        'seconds': seconds,
+        'samples': times,
+        'instructions_per_second': instructions / seconds,
+        'emulated_mhz': hz / 1e6,
+        'realtime': hz / CLOCK_HZ,
+        'frames_per_second': cycles / CYCLES_PER_FRAME / seconds,
+    }
+
+def _empty(cpu, mem):
+    return 4
+
+def _time_calls(handler, cpu, mem, iterations: int) -> float:
+    perf_counter = time.perf_counter
+    start = perf_counter()
+    for _ in repeat(None, iterations):
+        cpu._pc = CODE
+        cpu._sp = STACK
+        handler(cpu, mem)
+    return perf_counter() - start
+
+def time_opcodes(iterations=2000, samples=1, warmup=0) -> dict:
+    # ns per call samples of every implemented handler, less the cost of
+    # the timing loop itself. CB-prefixed handlers are keyed 0xcbNN. Each
+    # sample is one pass over all handlers, so drift affects them equally.
+    cpu = CPU()
+    mem = cpu.M
+
+    handlers = [(f'{op:#04x}', op, (), h) for op, h in enumerate(cpu.ops)
+                if h is not op_codes.unimplemented and op != 0xcb]
+    handlers += [(f'0xcb{op:02x}', 0xcb, (op,), h) for op, h in enumerate(cpu.cb_ops)]
+
+    results = {key: [] for key, *_ in handlers}
+    for i in range(warmup + samples):
+        overhead = _time_calls(_empty, cpu, mem, iterations)
+        for key, opcode, prefix, handler in handlers:
+            cpu.load(CODE, bytes([opcode, *prefix, *OPERANDS]))
+            cpu.HL = cpu.BC = cpu.DE = SCRATCH
+            elapsed = _time_calls(handler, cpu, mem, iterations)
+            if i >= warmup:
+                results[key].append(max(elapsed - overhead, 0.0) / iterations * 1e9)
+
+    return results
+
+def _commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run(scenarios: list, frames: int, engine='interpreter', opcodes=True,
+        iterations=2000, samples=1, warmup=0) -> dict:
+    results = {
+        'meta': {
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'commit': _commit(),
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': platform.platform(),
+            'engine': engine,
+            'frames': frames,
+            'iterations': iterations,
+            'samples': samples,
+            'warmup': warmup,
+        },
+        'scenarios': {name: run_scenario(name, frames, engine, samples, warmup)
+                      for name in scenarios},
+    }
+    if opcodes:
+        results['opcodes'] = time_opcodes(iterations, samples, warmup)
+    return results
+
+def save(results: dict, path: str):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(results, f, indent=2)
+
+def load(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)
+
+def handler_name(key: str) -> str:
+    # '0x3c' -> 'inc_a', '0xcb37' -> 'swap_a'
+    if len(key) == 6:
+        return op_codes.CB_OPS[int(key[4:], 16)].__name__
+    return op_codes.OPS[int(key, 16)].__name__
+
+def report(results: dict) -> str:
+    meta = results['meta']
+    lines = [f"{meta['commit'] or 'unknown commit'}  {meta['implementation']} {meta['python']}  "
+             f"engine={meta['engine']}", '']
+
+    lines.append(f"{'scenario':<14} {'instr/s':>12} {'MHz':>8} {'x real':>8} {'frames/s':>9}")
+    for name, r in results['scenarios'].items():
+        lines.append(f"{name:<14} {r['instructions_per_second']:>12,.0f} {r['emulated_mhz']:>8.2f} "
+                     f"{r['realtime']:>8.2f} {r['frames_per_second']:>9.1f}")
+
+    opcodes = results.get('opcodes')
+    if opcodes:
+        opcodes = {key: stats.mean(samples) for key, samples in opcodes.items()}
+        ranked = sorted(opcodes.items(), key=lambda item: item[1], reverse=True)
+        mean = sum(opcodes.values()) / len(opcodes)
+        lines += ['', f'{len(opcodes)} handlers, mean {mean:.0f} ns/op. Slowest:']
+        lines += [f'  {key:<8} {handler_name(key):<14} {ns:>8.0f} ns' for key, ns in ranked[:10]]
+
+    return '\n'.join(lines)
@@ -0,0 +1,80 @@
+import os
+
+from benchmarks import ROOT
+
+from graphics import PPU
+from processor.timer import Timer
+
+# Each scenario loads a program into a fresh CPU and points PC at it. The
+# programs loop forever so they can be run for any number of frames.
+
+BOOT_ROM = os.path.join(ROOT, 'etc', 'roms', 'bootrom.bin')
+
+def nop_sled(cpu):
+    # NOP x 0x3ffd; JP 0x0000
+    cpu.load(0x0000, bytes(0x3ffd) + bytes([0xc3, 0x00, 0x00]))
+
+def alu_loop(cpu):
+    # LD B, 0x00; LD C, 0x07
+    # loop: ADD A, B; ADC A, C; SUB B; SBC A, C; AND C; XOR B; OR C; CP B;
+    #       INC A; DEC C; SWAP A; RLA; DEC B; JR NZ, loop
+    # JR 0x0000
+    cpu.load(0x0000, bytes([
+        0x06, 0x00,
+        0x0e, 0x07,
+        0x80, 0x89, 0x90, 0x99, 0xa1, 0xa8, 0xb1, 0xb8,
+        0x3c, 0x0d, 0xcb, 0x37, 0x17, 0x05,
+        0x20, 0xf0,
+        0x18, 0xea,
+    ]))
+
+def memory_copy(cpu):
+    # LD HL, 0x0100; LD DE, 0xC000; LD BC, 0x0100
+    # loop: LD A, (HL+); LD (DE), A; INC DE; DEC BC; LD A, B; OR C; JR NZ, loop
+    # JP 0x0000
+    cpu.load(0x0000, bytes([
+        0x21, 0x00, 0x01,
+        0x11, 0x00, 0xc0,
+        0x01, 0x00, 0x01,
+        0x2a, 0x12, 0x13, 0x0b, 0x78, 0xb1,
+        0x20, 0xf8,
+        0xc3, 0x00, 0x00,
+    ]))
+    cpu.load(0x0100, bytes(range(0x100)))
+
+def branch_heavy(cpu):
+    # LD SP, 0xFFFE; LD B, 0x00
+    # loop: DEC B; JR Z, done; CALL sub; JP NZ, loop
+    # done: JP 0x0000
+    # sub (0x0020): CP B; RET Z; CP 0x80; RET C; RET
+    cpu.load(0x0000, bytes([
+        0x31, 0xfe, 0xff,
+        0x06, 0x00,
+        0x05,
+        0x28, 0x06,
+        0xcd, 0x20, 0x00,
+        0xc2, 0x05, 0x00,
+        0xc3, 0x00, 0x00,
+    ]))
+    cpu.load(0x0020, bytes([0xb8, 0xc8, 0xfe, 0x80, 0xd8, 0xc9]))
+
+def boot_rom(cpu, path=BOOT_ROM):
+    # The hardware the emulator itself runs it on: without a PPU LY never
+    # moves and the ROM's LY polls would be skipped as idle loops
+    cpu.bus.map_dmg()
+    Timer(cpu)
+    PPU(cpu)
+    with open(path, 'rb') as f:
+        cpu.load(0x0000, f.read())
+
+SCENARIOS = {
+    'nop_sled': nop_sled,
+    'alu_loop': alu_loop,
+    'memory_copy': memory_copy,
+    'branch_heavy': branch_heavy,
+    'boot_rom': boot_rom,
+}
+
+def available() -> list:
+    # The boot ROM is not distributed with the repository
+    return [name for name in SCENARIOS if name != 'boot_rom' or os.path.exists(BOOT_ROM)]
@@ -0,0 +1,30 @@
+import math
+
+# Two-sided 95% critical values of Student's t for 1-30 degrees of freedom;
+# beyond that the normal value is close enough
+T_95 = (
+    12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+    2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+    2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042,
+)
+Z_95 = 1.960
+
+def mean(samples: list) -> float:
+    return sum(samples) / len(samples)
+
+def stdev(samples: list) -> float:
+    if len(samples) < 2:
+        return 0.0
+    m = mean(samples)
+    return math.sqrt(sum((x - m) ** 2 for x in samples) / (len(samples) - 1))
+
+def interval(samples: list) -> tuple:
+    # 95% confidence interval for the mean, (low, high). A single sample
+    # gives a zero-width interval.
+    m = mean(samples)
+    n = len(samples)
+    if n < 2:
+        return m, m
+    t = T_95[n - 2] if n - 1 <= len(T_95) else Z_95
+    half = t * stdev(samples) / math.sqrt(n)
+    return m - half, m + half
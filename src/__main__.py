@@ -1,13 +1,32 @@
+import argparse
+
+from graphics import PPU
 from processor.cpu import CPU
+from processor.timer import Timer
+
+parser = argparse.ArgumentParser(description='A simple GameBoy emulator')
+parser.add_argument('--headless', type=int, metavar='FRAMES',
+                    help='run this many frames without a window and exit')
+parser.add_argument('--scale', type=int, default=3, help='window size in multiples of 160x144')
+parser.add_argument('--frameskip', type=int, default=2,
+                    help='most frames in a row left undrawn when running late (default: 2)')
+parser.add_argument('--threaded', action='store_true',
+                    help='emulate on a separate thread from the window')
+parser.add_argument('--rendering', choices=('scanline', 'catch-up'), default='scanline')
+args = parser.parse_args()
 
- # Debug. Fill up memory with NOP instructions
 cpu = CPU()
+cpu.bus.map_dmg()
+Timer(cpu)
+ppu = PPU(cpu, args.rendering)
 
 with open(f"etc/roms/bootrom.bin", "rb") as f:
-        for i,b in enumerate(f.read()):
-            cpu.M[i] = b
-            print(f'b = {b:08b} {hex(b)} {b}')  
+        cpu.load(0x0000, f.read())
 
-cpu.start()
+if args.headless is not None:
+    cpu.start(frames=args.headless)
+else:
+    from frontend.window import Window
+    Window(cpu, ppu, args.scale, args.frameskip, threaded=args.threaded).run()
 
-print('Completed')
\ No newline at end of file
+print('Completed')
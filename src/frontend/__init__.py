@@ -0,0 +1 @@
+from .pacing import Pacer
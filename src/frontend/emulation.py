@@ -0,0 +1,77 @@
+import threading
+
+import numpy as np
+
+from frontend.pacing import Pacer
+
+class FrameRing:
+    # Hands frames from the emulation thread to the display without copying
+    # them, through three buffers: the PPU draws into back, ready holds the
+    # newest finished frame and front is the one being shown. publish() and
+    # take() each swap two of them under a lock held for just that. A ready
+    # frame nobody took is drawn over, which is what drops stale frames.
+    __slots__ = ('lock', 'back', 'ready', 'front', 'fresh', 'dropped')
+
+    def __init__(self, back: np.ndarray):
+        self.lock = threading.Lock()
+        self.back = back
+        self.ready = np.zeros_like(back)
+        self.front = np.zeros_like(back)
+        self.fresh = False          # ready holds a frame not taken yet
+        self.dropped = 0            # Frames published over one not taken
+
+    def publish(self) -> np.ndarray:
+        # back is finished; returns the buffer to draw the next frame into
+        with self.lock:
+            if self.fresh:
+                self.dropped += 1
+            self.back, self.ready = self.ready, self.back
+            self.fresh = True
+            return self.back
+
+    def take(self):
+        # The newest finished frame, or None if there is nothing new. It
+        # stays untouched until the next take().
+        with self.lock:
+            if not self.fresh:
+                return None
+            self.front, self.ready = self.ready, self.front
+            self.fresh = False
+            return self.front
+
+class Emulation:
+    # Runs the emulator on its own thread, paced by its own Pacer, and
+    # publishes each frame into a FrameRing at VBlank. Set
+    # pacer.fast_forward to run uncapped. An exception stops the thread and
+    # is kept in error.
+    __slots__ = ('cpu', 'ppu', 'ring', 'pacer', 'thread', 'running', 'error')
+
+    def __init__(self, cpu, ppu):
+        self.cpu = cpu
+        self.ppu = ppu
+        self.ring = FrameRing(ppu.frame)
+        self.pacer = Pacer(0)
+        self.thread = None
+        self.running = False
+        self.error = None
+        ppu.on_frame = self.ring.publish
+
+    def start(self):
+        self.running = True
+        self.thread = threading.Thread(target=self._run, name='emulation', daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.running = False
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def _run(self):
+        try:
+            while self.running:
+                self.cpu.run_frame()
+                self.pacer.wait()
+        except Exception as error:
+            self.error = error
+            self.running = False
@@ -0,0 +1,60 @@
+import time
+
+from processor.cpu import CYCLES_PER_FRAME
+
+# 4194304 Hz / 70224 cycles per frame = 59.73 frames a second
+FRAME_RATE = 4194304 / CYCLES_PER_FRAME
+
+# Further behind than this (a stall, a breakpoint) the schedule restarts
+# from now instead of racing to catch up
+MAX_LAG = 0.25
+
+class Pacer:
+    # Keeps emulated frames to FRAME_RATE on perf_counter. Before each frame
+    # draw() says whether to draw it, so that a skipped one is not even
+    # rendered: after a frame that finished late the next is emulated but
+    # not drawn, up to frameskip in a row. wait() then sleeps
+    # until the frame is due, blocking rather than spinning so the other
+    # thread keeps the GIL; deadlines are absolute, so waking a little late
+    # does not add up. With fast_forward set nothing waits and frames are
+    # drawn at most once a period.
+    __slots__ = ('period', 'frameskip', 'fast_forward', 'clock', 'sleep', 'deadline', 'late',
+                 'shown', 'skipped')
+
+    def __init__(self, frameskip: int = 2, rate: float = FRAME_RATE, clock=time.perf_counter,
+                 sleep=time.sleep):
+        self.period = 1 / rate
+        self.frameskip = frameskip
+        self.fast_forward = False
+        self.clock = clock
+        self.sleep = sleep
+        self.deadline = clock() + self.period   # When the current frame is due
+        self.late = False                       # The last frame finished after it was due
+        self.shown = 0.0                        # When a frame was last drawn
+        self.skipped = 0                        # Frames skipped in a row
+
+    def draw(self) -> bool:
+        now = self.clock()
+        if self.fast_forward:
+            show = now - self.shown >= self.period
+        else:
+            show = not self.late or self.skipped >= self.frameskip
+        if show:
+            self.shown = now
+            self.skipped = 0
+        else:
+            self.skipped += 1
+        return show
+
+    def wait(self):
+        now = self.clock()
+        self.late = False
+        if self.fast_forward:
+            self.deadline = now
+        elif now < self.deadline:
+            self.sleep(self.deadline - now)
+        elif now - self.deadline > MAX_LAG:
+            self.deadline = now
+        else:
+            self.late = True
+        self.deadline += self.period
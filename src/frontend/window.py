@@ -0,0 +1,98 @@
+import os
+
+os.environ.setdefault('PYGAME_HIDE_SUPPORT_PROMPT', '1')
+import pygame
+
+import numpy as np
+
+from frontend.emulation import Emulation
+from frontend.pacing import Pacer
+from graphics.colours import Colours
+from graphics.ppu import HEIGHT, WIDTH
+
+# Held down to run as fast as possible
+FAST_FORWARD = pygame.K_TAB
+
+class Window:
+    # Runs the emulator a frame at a time and shows the PPU's frames,
+    # converted to RGB, blitted whole to a native-size surface and scaled to
+    # the window in one call each. Pacing and frame skipping are up to a
+    # Pacer, asked before each frame so that the PPU skips rendering frames
+    # that will not be shown. The PPU draws into back and swaps it for shown
+    # at VBlank, so what is drawn is always the last whole frame, wherever
+    # run_frame() happened to stop, and only once.
+    #
+    # With threaded=True the emulator runs on an Emulation thread at its own
+    # pace instead, and the window just shows the newest frame it finished
+    # once a period, so a slow blit no longer holds emulation up.
+    __slots__ = ('cpu', 'ppu', 'colours', 'pacer', 'emulation', 'back', 'shown', 'fresh', 'display',
+                 'surface', 'running')
+
+    def __init__(self, cpu, ppu, scale: int = 3, frameskip: int = 2, colours=None, threaded=False):
+        self.cpu = cpu
+        self.ppu = ppu
+        self.colours = colours or Colours()
+        self.pacer = Pacer(frameskip)
+        self.emulation = Emulation(cpu, ppu) if threaded else None
+        self.back = ppu.frame
+        self.shown = np.zeros_like(self.back)
+        self.fresh = False          # shown holds a frame not drawn yet
+        if not threaded:
+            ppu.on_frame = self._finished
+
+        pygame.display.init()
+        pygame.display.set_caption('gameboy-py')
+        self.display = pygame.display.set_mode((WIDTH * scale, HEIGHT * scale))
+        self.surface = pygame.Surface((WIDTH, HEIGHT), 0, self.display)
+        self.running = False
+
+    def run(self, frames=None):
+        # Until the window is closed, or for a number of frames (periods
+        # when threaded)
+        self.running = True
+        frame = 0
+        emulation = self.emulation
+        try:
+            if emulation is not None:
+                emulation.start()
+            while self.running and (frames is None or frame < frames):
+                fast_forward = self.events()
+                frame += 1
+                if emulation is None:
+                    self.pacer.fast_forward = fast_forward
+                    # Taken up at the next line 0, by the frame this starts
+                    self.ppu.skip = not self.pacer.draw()
+                    self.cpu.run_frame()
+                    if self.fresh:
+                        self.fresh = False
+                        self.draw(self.shown)
+                else:
+                    emulation.pacer.fast_forward = fast_forward
+                    if emulation.error is not None:
+                        raise emulation.error
+                    shown = emulation.ring.take()
+                    if shown is not None:
+                        self.draw(shown)
+                self.pacer.wait()
+        finally:
+            if emulation is not None:
+                emulation.stop()
+            pygame.display.quit()
+
+    def events(self) -> bool:
+        # Handles window events; returns whether fast forward is held
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT or event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                self.running = False
+        return pygame.key.get_pressed()[FAST_FORWARD]
+
+    def _finished(self):
+        # VBlank: back holds a whole frame
+        self.back, self.shown = self.shown, self.back
+        self.fresh = True
+        return self.back
+
+    def draw(self, frame):
+        pygame.surfarray.blit_array(self.surface, self.colours.convert(frame))
+        pygame.transform.scale(self.surface, self.display.get_size(), self.display)
+        pygame.display.flip()
@@ -0,0 +1,2 @@
+from .colours import Colours
+from .ppu import PPU
@@ -0,0 +1,64 @@
+import numpy as np
+
+# Tile maps 0x9800-0x9BFF and 0x9C00-0x9FFF: 32x32 tile numbers each
+TILE_MAPS = (0x9800, 0xa000)
+SIZE = 256
+
+# Tile cache index of each tile number when LCDC bit 4 is clear and tile
+# numbers are signed offsets from 0x9000
+SIGNED = np.array([n + 0x100 if n < 0x80 else n for n in range(0x100)], dtype=np.intp)
+
+def wrap(layer: np.ndarray, top: int, left: int, height: int, width: int) -> np.ndarray:
+    # height x width pixels of a layer from (top, left), wrapping round its
+    # edges. A view unless it wraps.
+    rows = layer[top:top + height] if top + height <= SIZE else \
+        np.concatenate((layer[top:], layer[:top + height - SIZE]))
+    if left + width <= SIZE:
+        return rows[:, left:left + width]
+    return np.concatenate((rows[:, left:], rows[:, :left + width - SIZE]), axis=1)
+
+class Background:
+    # Both tile maps drawn out in full as layers[map, y, x] colour numbers,
+    # so drawing a line of background or window is a slice. The layers own
+    # the map pages for writes like TileCache owns the tile data, and
+    # update() redraws only the 8x8 cells whose map entry changed or whose
+    # tile did.
+    __slots__ = ('memory', 'maps', 'tiles', 'layers', 'cells', 'dirty', 'signed')
+
+    def __init__(self, bus, memory: np.ndarray, tiles):
+        self.memory = bus.memory
+        self.maps = memory[TILE_MAPS[0]:TILE_MAPS[1]].reshape(2, 32, 32)
+        self.tiles = tiles
+        self.layers = np.zeros((2, SIZE, SIZE), dtype=np.uint8)
+        # The same memory as layers[map, cell y, cell x, y, x]
+        self.cells = self.layers.reshape(2, 32, 8, 32, 8).transpose(0, 1, 3, 2, 4)
+        self.dirty = np.ones((2, 32, 32), dtype=bool)
+        self.signed = None          # LCDC bit 4 clear when the layers were drawn
+        bus.map(*TILE_MAPS, self, read=False)
+        bus.watchers.append(self)
+
+    def write(self, address: int, value: int):
+        self.memory[address] = value
+        self.dirty.flat[address - TILE_MAPS[0]] = True
+
+    def loaded(self, start: int, end: int):
+        start, end = max(start, TILE_MAPS[0]), min(end, TILE_MAPS[1])
+        if start < end:
+            self.dirty.flat[start - TILE_MAPS[0]:end - TILE_MAPS[0]] = True
+
+    def update(self, lcdc: int):
+        # Brings both layers up to date for the tile data LCDC selects
+        changed = self.tiles.update()
+        signed = not lcdc & 0x10
+        indices = SIGNED[self.maps] if signed else self.maps.astype(np.intp)
+        dirty = self.dirty
+        if signed != self.signed:
+            self.signed = signed
+            dirty[...] = True
+        elif len(changed):
+            dirty |= np.isin(indices, changed)
+        if not dirty.any():
+            return
+
+        self.cells[dirty] = self.tiles.tiles[indices[dirty]]
+        dirty[...] = False
@@ -0,0 +1,33 @@
+import numpy as np
+
+from graphics.ppu import HEIGHT, WIDTH
+
+# RGB for shades 0 (lightest) to 3
+GREYS = ((0xff, 0xff, 0xff), (0xaa, 0xaa, 0xaa), (0x55, 0x55, 0x55), (0x00, 0x00, 0x00))
+GREEN = ((0xe0, 0xf8, 0xd0), (0x88, 0xc0, 0x70), (0x34, 0x68, 0x56), (0x08, 0x18, 0x20))
+
+class Colours:
+    # Turns PPU frames of shades into RGB, or RGBA with alpha=True, by
+    # looking each shade up in a 4-entry table. The table is only rebuilt
+    # by set(). Every convert() writes into the same buffer, which is laid
+    # out x-major as pygame.surfarray expects; image is the same memory as
+    # image[y, x, channel].
+    __slots__ = ('alpha', 'table', 'buffer', 'image')
+
+    def __init__(self, colours=GREEN, alpha=False):
+        self.alpha = alpha
+        self.table = None
+        self.buffer = np.zeros((WIDTH, HEIGHT, 4 if alpha else 3), dtype=np.uint8)
+        self.image = self.buffer.transpose(1, 0, 2)
+        self.set(colours)
+
+    def set(self, colours):
+        table = np.array(colours, dtype=np.uint8).reshape(4, 3)
+        if self.alpha:
+            table = np.concatenate((table, np.full((4, 1), 0xff, dtype=np.uint8)), axis=1)
+        self.table = table
+
+    def convert(self, frame: np.ndarray) -> np.ndarray:
+        # frame is HEIGHT x WIDTH shades; returns buffer
+        np.take(self.table, frame.T, axis=0, out=self.buffer, mode='clip')
+        return self.buffer
@@ -0,0 +1,74 @@
+from processor.scheduler import Event
+
+# Writing the high byte of a source address here copies 160 bytes from it
+# to OAM
+DMA = 0xff46
+OAM = (0xfe00, 0xfea0)
+
+# One byte every 4 cycles
+DMA_CYCLES = 640
+
+class Blocked:
+    # Stands in for every page but 0xFF while a transfer runs: the CPU only
+    # reaches HRAM (and here the I/O registers, which share its page)
+    __slots__ = ()
+
+    def read(self, address: int) -> int:
+        return 0xff
+
+    def write(self, address: int, value: int):
+        pass
+
+BLOCKED = Blocked()
+
+class OAMDMA:
+    # The whole transfer is one slice copy when it is started. The bus
+    # swaps in page tables that block everything outside page 0xFF until a
+    # scheduled event at the end of the transfer puts the real ones back.
+    __slots__ = ('cpu', 'ppu', 'saved', 'event')
+
+    def __init__(self, cpu, ppu):
+        self.cpu = cpu
+        self.ppu = ppu
+        self.saved = None           # The real (read_pages, write_pages) during a transfer
+        self.event = Event(self.end)
+        cpu.bus.io.hook(DMA, write=self.write)
+
+    @property
+    def active(self) -> bool:
+        return self.saved is not None
+
+    def write(self, value: int):
+        cpu = self.cpu
+        mem = cpu.M
+        mem[DMA] = value
+        source = value << 8
+        if source >= 0xe000:
+            source -= 0x2000
+
+        # Drawing up to now still sees the old OAM
+        self.ppu.catch_up()
+        mem[OAM[0]:OAM[1]] = mem[source:source + OAM[1] - OAM[0]]
+        cpu.bus.loaded(*OAM)
+
+        if self.saved is None:
+            bus = cpu.bus
+            self.saved = bus.read_pages, bus.write_pages
+            bus.read_pages = [BLOCKED] * 0xff + bus.read_pages[0xff:]
+            bus.write_pages = [BLOCKED] * 0xff + bus.write_pages[0xff:]
+        cpu.scheduler.reschedule(self.event, cpu.cycles + DMA_CYCLES)
+
+    def end(self, cycle: int):
+        bus = self.cpu.bus
+        reads, writes = self.saved
+        self.saved = None
+        # The translator may have installed or removed a CodeWatch meanwhile.
+        # Ones installed over a blocked page go on top of the real handler.
+        for real, swapped in ((reads, bus.read_pages), (writes, bus.write_pages)):
+            for page, handler in enumerate(swapped[:0xff]):
+                if handler is not BLOCKED:
+                    if getattr(handler, 'previous', None) is BLOCKED:
+                        handler.previous = real[page]
+                    real[page] = handler
+            real[0xff] = swapped[0xff]
+        bus.read_pages, bus.write_pages = reads, writes
@@ -0,0 +1,378 @@
+import numpy as np
+
+from graphics.background import Background, wrap
+from graphics.dma import OAMDMA
+from graphics.sprites import Sprites
+from graphics.tiles import TileCache
+from processor.cpu import STAT as STAT_INTERRUPT, VBLANK as VBLANK_INTERRUPT
+from processor.scheduler import Event
+
+# 0xFF40-0xFF4B
+LCDC = 0xff40
+STAT = 0xff41
+SCY = 0xff42
+SCX = 0xff43
+LY = 0xff44
+LYC = 0xff45
+BGP = 0xff47
+OBP0 = 0xff48
+OBP1 = 0xff49
+WY = 0xff4a
+WX = 0xff4b
+
+# Registers that change what is drawn, as logged in catch-up mode
+REGISTERS = 0xff40
+DRAWING = (LCDC, SCY, SCX, BGP, OBP0, OBP1, WY, WX)
+
+WIDTH = 160
+HEIGHT = 144
+
+# STAT modes and how long each lasts. Lines 0-143 go through OAM scan,
+# drawing and HBlank; lines 144-153 are VBlank.
+MODE_HBLANK = 0
+MODE_VBLANK = 1
+MODE_OAM = 2
+MODE_DRAW = 3
+OAM_CYCLES = 80
+DRAW_CYCLES = 172
+HBLANK_CYCLES = 204
+LINE_CYCLES = 456
+LINES = 154
+
+# Shade 0-3 for each colour number under every BGP/OBP0/OBP1 value
+PALETTES = (np.arange(0x100, dtype=np.uint8)[:, None] >> np.arange(0, 8, 2, dtype=np.uint8)) & 3
+
+def palette(value: int) -> np.ndarray:
+    return PALETTES[value]
+
+class CatchUp:
+    # Write handler put in front of VRAM and OAM in catch-up mode. Drawing
+    # reads both directly, so everything up to now is drawn before a write
+    # lands. Writes then go on to whatever owned the page before.
+    __slots__ = ('ppu', 'previous', 'memory')
+
+    def __init__(self, ppu, previous, memory):
+        self.ppu = ppu
+        self.previous = previous
+        self.memory = memory
+
+    def write(self, address: int, value: int):
+        self.ppu.catch_up()
+        if self.previous is None:
+            self.memory[address] = value
+        else:
+            self.previous.write(address, value)
+
+class PPU:
+    # The registers live in memory, so reads need no hooks and code polling
+    # LY or STAT sees them change only on the events below, one per mode
+    # change. Lines are drawn as shades 0 (white) to 3 (black), from tiles
+    # decoded by a TileCache, maps kept drawn out by a Background and sprites
+    # looked up by line in Sprites. Needs the CPU's default bytearray memory,
+    # which VRAM and OAM are viewed from without copying.
+    #
+    # rendering='scanline' draws each line when its drawing mode ends, with
+    # the registers as they are then. rendering='catch-up' draws nothing
+    # until it has to: at VBlank, before a VRAM or OAM write, or when frame
+    # is read. Writes to the drawing registers are logged with their cycle
+    # in the meantime, and replayed so that each one takes effect from the
+    # pixel being output when it was made. Lines without a write in between
+    # are drawn together.
+    #
+    # Setting skip leaves the frames starting from the next line 0 undrawn,
+    # for a frontend that will not show them. Timing, LY, STAT and the
+    # interrupts carry on as ever; on_frame is only called for drawn frames.
+    __slots__ = ('cpu', 'memory', 'vram', 'oam', 'tiles', 'background', 'sprites', 'dma',
+                 'catch_up_mode', 'registers', 'log', 'frame_start', 'drawn', '_frame', 'on_frame',
+                 'skip', 'skipping', 'frames', 'mode', 'window_line', 'stat_line', 'event')
+
+    def __init__(self, cpu, rendering='scanline'):
+        if rendering not in ('scanline', 'catch-up'):
+            raise ValueError(f'Unknown rendering {rendering!r}')
+
+        self.cpu = cpu
+        self.memory = np.frombuffer(cpu.M, dtype=np.uint8)
+        self.vram = self.memory[0x8000:0xa000]
+        self.oam = self.memory[0xfe00:0xfea0].reshape(40, 4)
+        self.tiles = TileCache(cpu.bus, self.memory)
+        self.background = Background(cpu.bus, self.memory, self.tiles)
+        self.sprites = Sprites(cpu.bus, self.memory)
+        self.dma = OAMDMA(cpu, self)
+
+        # Drawing reads 0xFF40-0xFF4B from here rather than from memory
+        self.catch_up_mode = rendering == 'catch-up'
+        self.registers = bytearray(cpu.M[REGISTERS:REGISTERS + 12])
+        self.log = []               # (cycle, address, value) not drawn yet
+        self.frame_start = 0        # Cycle line 0 of this frame started at
+        self.drawn = 0              # Pixels of this frame drawn, row by row
+
+        self._frame = np.zeros((HEIGHT, WIDTH), dtype=np.uint8)
+        self.on_frame = None        # Called at VBlank, returns the array to draw the next frame into
+        self.skip = False           # Leave frames from the next line 0 undrawn
+        self.skipping = False       # skip as it was at this frame's line 0
+        self.frames = 0             # Frames completed, counted at VBlank
+        self.mode = MODE_HBLANK
+        self.window_line = 0        # Window lines drawn so far this frame
+        self.stat_line = False      # STAT interrupt condition, which fires on its rising edge
+        self.event = Event(self._step)
+
+        io = cpu.bus.io
+        io.hook(LCDC, write=self.write_lcdc)
+        io.hook(STAT, write=self.write_stat)
+        io.hook(LY, write=self.write_ly)
+        io.hook(LYC, write=self.write_lyc)
+        if self.catch_up_mode:
+            for address in DRAWING[1:]:
+                io.hook(address, write=lambda value, address=address: self.write_register(address, value))
+            bus = cpu.bus
+            for page in (*range(0x80, 0xa0), 0xfe):
+                bus.write_pages[page] = CatchUp(self, bus.write_pages[page], cpu.M)
+
+        cpu.M[LY] = 0
+        if cpu.M[LCDC] & 0x80:
+            self._start()
+        self._update_stat()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.cpu.M[LCDC] & 0x80)
+
+    @property
+    def frame(self) -> np.ndarray:
+        # 144x160 shades, drawn up to now
+        self.catch_up()
+        return self._frame
+
+    def _start(self):
+        # LCD switched on: line 0 starts straight away
+        self._new_frame(self.cpu.cycles)
+        self.mode = MODE_OAM
+        self.cpu.scheduler.reschedule(self.event, self.cpu.cycles + OAM_CYCLES)
+
+    def _new_frame(self, cycle: int):
+        self.frame_start = cycle
+        self.drawn = 0
+        self.window_line = 0
+        self.skipping = self.skip
+
+    def _step(self, cycle: int):
+        # Ends the current mode at cycle and schedules the end of the next
+        mem = self.cpu.M
+        ly = mem[LY]
+
+        if self.mode == MODE_OAM:
+            self.mode = MODE_DRAW
+            cycle += DRAW_CYCLES
+        elif self.mode == MODE_DRAW:
+            if not self.catch_up_mode and not self.skipping:
+                self.render_line(ly)
+            self.mode = MODE_HBLANK
+            cycle += HBLANK_CYCLES
+        else:
+            ly = (ly + 1) % LINES
+            mem[LY] = ly
+            if ly == HEIGHT:
+                self.catch_up(cycle)
+                if self.on_frame is not None and not self.skipping:
+                    self._frame = self.on_frame()
+                self.mode = MODE_VBLANK
+                self.frames += 1
+                self.cpu.request_interrupt(VBLANK_INTERRUPT)
+            elif ly < HEIGHT:
+                if ly == 0:
+                    self._new_frame(cycle)
+                self.mode = MODE_OAM
+            cycle += LINE_CYCLES if self.mode == MODE_VBLANK else OAM_CYCLES
+
+        self._update_stat()
+        self.cpu.scheduler.reschedule(self.event, cycle)
+
+    def _update_stat(self):
+        # Mirrors the mode and LY == LYC into STAT and requests the STAT
+        # interrupt when any enabled condition becomes true
+        mem = self.cpu.M
+        stat = mem[STAT]
+        if not mem[LCDC] & 0x80:
+            mem[STAT] = 0x80 | stat & 0x78
+            self.stat_line = False
+            return
+
+        coincidence = mem[LY] == mem[LYC]
+        mode = self.mode
+        mem[STAT] = 0x80 | stat & 0x78 | (0x04 if coincidence else 0) | mode
+
+        line = bool(stat & 0x40 and coincidence
+                    or stat & 0x20 and mode == MODE_OAM
+                    or stat & 0x10 and mode == MODE_VBLANK
+                    or stat & 0x08 and mode == MODE_HBLANK)
+        if line and not self.stat_line:
+            self.cpu.request_interrupt(STAT_INTERRUPT)
+        self.stat_line = line
+
+    def write_lcdc(self, value: int):
+        mem = self.cpu.M
+        was_enabled = mem[LCDC] & 0x80
+        if self.catch_up_mode:
+            if (value ^ mem[LCDC]) & 0x80:
+                self.catch_up()
+                self.registers[LCDC - REGISTERS] = value
+            else:
+                self.log.append((self.cpu.cycles, LCDC, value))
+        mem[LCDC] = value
+
+        if was_enabled and not value & 0x80:
+            # Switched off: LY stays at 0 until it is switched on again
+            self.cpu.scheduler.cancel(self.event)
+            self.mode = MODE_HBLANK
+            mem[LY] = 0
+        elif value & 0x80 and not was_enabled:
+            self._start()
+        self._update_stat()
+
+    def write_stat(self, value: int):
+        # Only the interrupt enables are writable
+        mem = self.cpu.M
+        mem[STAT] = mem[STAT] & 0x07 | value & 0x78
+        self._update_stat()
+
+    def write_ly(self, value: int):
+        pass
+
+    def write_lyc(self, value: int):
+        self.cpu.M[LYC] = value
+        self._update_stat()
+
+    def write_register(self, address: int, value: int):
+        # Catch-up mode: the write is visible to the CPU straight away, and
+        # to drawing once the log gets to it
+        self.cpu.M[address] = value
+        self.log.append((self.cpu.cycles, address, value))
+
+    def _pixel(self, cycle: int) -> int:
+        # Pixels of this frame output before cycle, counted row by row.
+        # Pixel x of a line goes out OAM_CYCLES + x cycles into it.
+        if not self.enabled:
+            return self.drawn
+        line, dot = divmod(cycle - self.frame_start, LINE_CYCLES)
+        if line < 0:
+            return 0
+        if line >= HEIGHT:
+            return HEIGHT * WIDTH
+        return line * WIDTH + min(max(dot - OAM_CYCLES, 0), WIDTH)
+
+    def catch_up(self, cycle: int = None):
+        # Draws everything output before cycle (default now), applying the
+        # logged register writes on the way
+        if not self.catch_up_mode:
+            return
+        if cycle is None:
+            cycle = self.cpu.cycles
+
+        log, registers = self.log, self.registers
+        for count, (time, address, value) in enumerate(log):
+            if time > cycle:
+                del log[:count]
+                break
+            self._draw_pixels(self._pixel(time))
+            registers[address - REGISTERS] = value
+        else:
+            log.clear()
+        self._draw_pixels(self._pixel(cycle))
+
+    def _draw_pixels(self, end: int):
+        # Draws pixels drawn..end, as whole lines where possible
+        start = self.drawn
+        if start >= end:
+            return
+        self.drawn = end
+        if self.skipping:
+            return
+        line, x = divmod(start, WIDTH)
+        last, last_x = divmod(end, WIDTH)
+
+        if line == last:
+            self._draw(line, line + 1, x, last_x)
+            return
+        if x:
+            self._draw(line, line + 1, x, WIDTH)
+            line += 1
+        if line < last:
+            self._draw(line, last)
+        if last_x:
+            self._draw(last, last + 1, 0, last_x)
+
+    def render_line(self, ly: int):
+        # Draws line ly with the registers as they are in memory now
+        self.registers[:] = self.cpu.M[REGISTERS:REGISTERS + 12]
+        self._draw(ly, ly + 1)
+
+    def _draw(self, first: int, last: int, x0: int = 0, x1: int = WIDTH):
+        # Draws columns x0..x1 of lines first..last with self.registers
+        registers = self.registers
+        lcdc = registers[LCDC - REGISTERS]
+        self.background.update(lcdc)
+        layers = self.background.layers
+        height, width = last - first, x1 - x0
+
+        # Background and window colour numbers, kept for sprite priority
+        if lcdc & 0x01:
+            bg = wrap(layers[lcdc >> 3 & 1], (first + registers[SCY - REGISTERS]) & 0xff,
+                      (x0 + registers[SCX - REGISTERS]) & 0xff, height, width).copy()
+
+            wx = registers[WX - REGISTERS] - 7
+            top = max(registers[WY - REGISTERS] - first, 0)
+            if lcdc & 0x20 and wx < x1 and top < height:
+                left = max(wx, x0)
+                shown = height - top
+                bg[top:, left - x0:] = layers[lcdc >> 6 & 1, self.window_line:self.window_line + shown,
+                                              left - wx:x1 - wx]
+                # Counted once the line is finished
+                if x1 == WIDTH:
+                    self.window_line += shown
+        else:
+            bg = np.zeros((height, width), dtype=np.uint8)
+
+        shades = np.take(PALETTES[registers[BGP - REGISTERS]], bg)
+        if lcdc & 0x02:
+            self.sprites.update(16 if lcdc & 0x04 else 8)
+            for row, ly in enumerate(range(first, last)):
+                self._draw_sprites(shades[row], bg[row], ly, lcdc, x0, x1)
+        self._frame[first:last, x0:x1] = shades
+
+    def _draw_sprites(self, line, bg, ly: int, lcdc: int, x0: int, x1: int):
+        # line and bg hold columns x0..x1 of line ly
+        order = self.sprites.lines[ly]
+        if not len(order):
+            return
+
+        height = self.sprites.height
+        registers = self.registers
+        palettes = (palette(registers[OBP0 - REGISTERS]), palette(registers[OBP1 - REGISTERS]))
+        # Columns already won by a higher priority sprite's opaque pixel
+        taken = np.zeros(x1 - x0, dtype=bool)
+
+        for y, x, tile, attributes in self.oam[order].astype(np.intp):
+            row = ly - (y - 16)
+            if attributes & 0x40:
+                row = height - 1 - row
+            if height == 16:
+                tile &= 0xfe
+            colours = self.tiles.tiles[tile + (row >> 3), row & 7]
+            if attributes & 0x20:
+                colours = colours[::-1]
+
+            left = x - 8
+            start, end = max(left, x0), min(left + 8, x1)
+            if start >= end:
+                continue
+            colours = colours[start - left:end - left]
+
+            # Colour 0 is transparent. Each column goes to the first opaque
+            # pixel, which then hides any sprite under it even where bit 7
+            # puts it behind background colours 1-3.
+            opaque = colours != 0
+            mask = opaque & ~taken[start - x0:end - x0]
+            taken[start - x0:end - x0] |= opaque
+            if attributes & 0x80:
+                mask &= bg[start - x0:end - x0] == 0
+            line[start - x0:end - x0][mask] = palettes[attributes >> 4 & 1][colours[mask]]
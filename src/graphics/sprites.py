@@ -0,0 +1,49 @@
+import numpy as np
+
+# OAM: 40 sprites of Y + 16, X + 8, tile number and attributes
+OAM = (0xfe00, 0xfea0)
+SPRITES = 40
+PER_LINE = 10
+LINES = 144
+
+class Sprites:
+    # Which sprites each line shows, as lines[ly]: OAM indices of at most
+    # 10 sprites in priority order, highest first. Built from all of
+    # OAM at once, and rebuilt only after OAM changes or the sprite height
+    # does. Owns the OAM page for writes like TileCache owns the tile data.
+    __slots__ = ('memory', 'oam', 'lines', 'height', 'dirty')
+
+    def __init__(self, bus, memory: np.ndarray):
+        self.memory = bus.memory
+        self.oam = memory[OAM[0]:OAM[1]].reshape(SPRITES, 4)
+        self.lines = None
+        self.height = None
+        self.dirty = True
+        bus.map(*OAM, self, read=False)
+        bus.watchers.append(self)
+
+    def write(self, address: int, value: int):
+        self.memory[address] = value
+        self.dirty = True
+
+    def loaded(self, start: int, end: int):
+        if start < OAM[1] and end > OAM[0]:
+            self.dirty = True
+
+    def update(self, height: int):
+        if not self.dirty and height == self.height:
+            return
+        self.dirty = False
+        self.height = height
+
+        oam = self.oam.astype(np.intp)
+        top = oam[:, 0] - 16
+        ly = np.arange(LINES)[:, None]
+        on_line = (top <= ly) & (ly < top + height)
+        # Only the first 10 in OAM order are shown
+        on_line &= np.cumsum(on_line, axis=1) <= PER_LINE
+
+        # On DMG the sprite with the lower X wins, then the lower OAM index
+        order = np.lexsort((np.arange(SPRITES), oam[:, 1]))
+        on_line = on_line[:, order]
+        self.lines = [order[shown] for shown in on_line]
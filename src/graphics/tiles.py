@@ -0,0 +1,53 @@
+import numpy as np
+
+# Tile data is 0x8000-0x97FF: 384 tiles of 8 rows, each row two bytes
+TILE_DATA = (0x8000, 0x9800)
+TILES = 384
+
+# Bit 7 of each byte is pixel 0, so a row decodes by shifting both bytes
+# right by these amounts
+_SHIFTS = np.arange(7, -1, -1, dtype=np.uint8)
+
+def decode_rows(low, high) -> np.ndarray:
+    # Colour numbers 0-3 of the tile rows made of bytes low and high, with
+    # the 8 pixels along a new last axis
+    low, high = np.asarray(low)[..., None], np.asarray(high)[..., None]
+    return (low >> _SHIFTS) & 1 | ((high >> _SHIFTS) & 1) << 1
+
+# Every possible row, indexed by [low byte, high byte]
+DECODE = decode_rows(np.arange(0x100)[:, None], np.arange(0x100)[None, :]).astype(np.uint8)
+
+_NONE = np.zeros(0, dtype=np.intp)
+
+class TileCache:
+    # All 384 tiles decoded, as tiles[index, y, x]. The cache owns the tile
+    # data pages on the bus for writes, so every write marks its tile dirty
+    # on the way to memory; reads stay direct. update() re-decodes only the
+    # dirty tiles and returns their indices.
+    __slots__ = ('memory', 'data', 'tiles', 'dirty')
+
+    def __init__(self, bus, memory: np.ndarray):
+        self.memory = bus.memory
+        self.data = memory[TILE_DATA[0]:TILE_DATA[1]].reshape(TILES, 8, 2)
+        self.tiles = np.zeros((TILES, 8, 8), dtype=np.uint8)
+        self.dirty = set(range(TILES))
+        bus.map(*TILE_DATA, self, read=False)
+        bus.watchers.append(self)
+
+    def write(self, address: int, value: int):
+        self.memory[address] = value
+        self.dirty.add((address - TILE_DATA[0]) >> 4)
+
+    def loaded(self, start: int, end: int):
+        start, end = max(start, TILE_DATA[0]), min(end, TILE_DATA[1])
+        if start < end:
+            self.dirty.update(range((start - TILE_DATA[0]) >> 4, ((end - 1 - TILE_DATA[0]) >> 4) + 1))
+
+    def update(self) -> np.ndarray:
+        if not self.dirty:
+            return _NONE
+        index = np.fromiter(self.dirty, dtype=np.intp, count=len(self.dirty))
+        self.dirty.clear()
+        rows = self.data[index]
+        self.tiles[index] = DECODE[rows[..., 0], rows[..., 1]]
+        return index
@@ -0,0 +1,131 @@
+from processor.memory import ROM0, ROMX, ECHO
+
+class Bus:
+    # Every 256-byte page has an entry in a read and a write page table.
+    # None means the page is plain memory and is accessed directly; anything
+    # else is a handler object with read(address) and/or write(address, value)
+    # that owns the page (ROM, echo RAM, I/O registers, MBC registers...).
+    __slots__ = ('memory', 'read_pages', 'write_pages', 'io', 'rom_bank', 'watchers')
+
+    def __init__(self, memory):
+        self.memory = memory
+        self.read_pages = [None] * 0x100
+        self.write_pages = [None] * 0x100
+
+        # Bank mapped at 0x4000-0x7FFF, kept up to date by MBC handlers
+        self.rom_bank = 1
+
+        # Objects with loaded(start, end), told about bulk copies into
+        # memory that bypass the write handlers
+        self.watchers = []
+
+        # I/O registers and HRAM. Until a device hooks a register this
+        # behaves exactly like plain memory.
+        self.io = IORegisters(memory)
+        self.map(0xff00, 0x10000, self.io)
+
+    def map(self, start: int, end: int, handler, read=True, write=True):
+        # Maps the pages covering [start, end) to handler. Passing None
+        # restores direct access.
+        for page in range(start >> 8, ((end - 1) >> 8) + 1):
+            if read: self.read_pages[page] = handler
+            if write: self.write_pages[page] = handler
+
+    def map_dmg(self):
+        # Cartridge ROM is read-only and 0xE000-0xFDFF mirrors work RAM
+        self.map(ROM0[0], ROMX[1], ReadOnly(), read=False)
+        self.map(ECHO[0], ECHO[1], Echo(self))
+
+    def read8(self, address: int) -> int:
+        handler = self.read_pages[address >> 8]
+        if handler is None:
+            return self.memory[address]
+        return handler.read(address)
+
+    def write8(self, address: int, value: int):
+        handler = self.write_pages[address >> 8]
+        if handler is None:
+            self.memory[address] = value
+        else:
+            handler.write(address, value)
+
+    def loaded(self, start: int, end: int):
+        for watcher in self.watchers:
+            watcher.loaded(start, end)
+
+    def direct(self, address: int) -> bool:
+        # True if a read returns whatever was last stored at address, so
+        # that the value can only change when something writes it
+        handler = self.read_pages[address >> 8]
+        if handler is None:
+            return True
+        if isinstance(handler, IORegisters):
+            return handler.readers[address & 0xff] is None
+        if isinstance(handler, Echo):
+            return self.direct(address - 0x2000)
+        return False
+
+    def read16(self, address: int) -> int:
+        high = (address + 1) & 0xffff
+        handler = self.read_pages[high >> 8]
+        if handler is None:
+            high = self.memory[high]
+        else:
+            high = handler.read(high)
+        return (high << 8) | self.read8(address)
+
+    def write16(self, address: int, value: int):
+        self.write8(address, value & 0xff)
+        high = (address + 1) & 0xffff
+        handler = self.write_pages[high >> 8]
+        if handler is None:
+            self.memory[high] = (value >> 8) & 0xff
+        else:
+            handler.write(high, (value >> 8) & 0xff)
+
+class ReadOnly:
+    # Writes are dropped. Reads stay on the direct path.
+    __slots__ = ()
+
+    def write(self, address: int, value: int):
+        pass
+
+class Echo:
+    __slots__ = ('bus',)
+
+    def __init__(self, bus: Bus):
+        self.bus = bus
+
+    def read(self, address: int) -> int:
+        return self.bus.read8(address - 0x2000)
+
+    def write(self, address: int, value: int):
+        self.bus.write8(address - 0x2000, value)
+
+class IORegisters:
+    # Handler for page 0xFF. Devices hook individual registers with a
+    # read() and/or write(value) callable; unhooked addresses fall through
+    # to memory.
+    __slots__ = ('memory', 'readers', 'writers')
+
+    def __init__(self, memory):
+        self.memory = memory
+        self.readers = [None] * 0x100
+        self.writers = [None] * 0x100
+
+    def hook(self, address: int, read=None, write=None):
+        if read is not None: self.readers[address & 0xff] = read
+        if write is not None: self.writers[address & 0xff] = write
+
+    def read(self, address: int) -> int:
+        reader = self.readers[address & 0xff]
+        if reader is None:
+            return self.memory[address]
+        return reader()
+
+    def write(self, address: int, value: int):
+        writer = self.writers[address & 0xff]
+        if writer is None:
+            self.memory[address] = value
+        else:
+            writer(value)
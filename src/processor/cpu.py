@@ -1,14 +1,61 @@
 from processor import op_codes
+from processor.bus import Bus
+from processor.idle import analyse
+from processor.memory import REGIONS, new_memory
+from processor.scheduler import Scheduler
+from processor.translator import Translator
+
+# 4194304 cycles per second (4.194304 MHz)
+# 154 scanlines * 456 cycles = 70224 cycles per frame (~59.73 fps)
+CLOCK_HZ = 4194304
+CYCLES_PER_FRAME = 70224
+
+# Interrupt enable and request registers
+IE = 0xffff
+IF = 0xff0f
+
+# Interrupt bits in IE and IF, highest priority first, and their vectors
+VBLANK = 0x01
+STAT = 0x02
+TIMER = 0x04
+SERIAL = 0x08
+JOYPAD = 0x10
+VECTORS = {VBLANK: 0x0040, STAT: 0x0048, TIMER: 0x0050, SERIAL: 0x0058, JOYPAD: 0x0060}
+
+# Low-power states, set by HALT and STOP. HALT lasts until any enabled
+# interrupt is requested, STOP until a joypad one is.
+HALTED = 1
+STOPPED = 2
 
 class CPU:
-    def __init__(self, memory=None):
+    # Registers live in slots rather than an instance dict: this keeps each
+    # CPU small and makes attribute access cheaper. The properties below are
+    # the checked public API; operations read and write the underscored
+    # slots directly and do their own masking.
+    __slots__ = (
+        'M', 'bus', 'read8', 'write8', 'read16', 'write16', 'ops', 'cb_ops',
+        '_a', '_f', '_b', '_c', '_d', '_e', '_h', '_l', '_sp', '_pc',
+        'ime', '_ei', '_irq', 'halted', 'cycles', 'deadline', 'scheduler', '_frame_overshoot', 'translator',
+        'idle_loops', 'busy_loops', '_loop', '_loop_reads', '_idle',
+    )
+
+    def __init__(self, memory=None, engine='interpreter'):
         
-        # Memory
-        self.M = memory if memory is not None else [0x0] * 0x10001
+        # Memory. A bytearray by default; an injected list is used as-is
+        self.M = memory if memory is not None else new_memory()
+
+        # Data accesses go through the bus; the primitives are bound once
+        # here so a handler pays a single call per access
+        self.bus = Bus(self.M)
+        self.read8, self.write8 = self.bus.read8, self.bus.write8
+        self.read16, self.write16 = self.bus.read16, self.bus.write16
         
         self._a = 0x0               # Accumulator
         self._f = 0x0               # Flags
 
+        # Dispatch tables, held per CPU so they can be swapped or wrapped
+        self.ops, self.cb_ops = op_codes.OPS, op_codes.CB_OPS
+
         self._b = 0x0               # 8-bit registers
         self._c = 0x0
         self._d = 0x0
@@ -20,6 +67,42 @@ class CPU:
         self._sp = 0x0              # Stack Pointer
         self._pc = 0x0              # Program Counter
 
+        self.ime = 0                # Interrupt master enable
+        self._ei = 0                # EI executed, IME not set yet
+        self._irq = 0               # IE, IF or IME changed since the last check
+        self.halted = 0             # HALTED or STOPPED, see above
+
+        # Pending interrupts are only looked for when something changes, so
+        # IE and IF writes are watched rather than polled
+        self.bus.io.hook(IE, write=self._write_ie)
+        self.bus.io.hook(IF, write=self._write_if)
+
+        self.cycles = 0             # Total cycles executed
+        self.deadline = 0           # Cycle the current batch runs up to
+
+        # Timed hardware registers events here rather than being ticked
+        # after every instruction
+        self.scheduler = Scheduler(self)
+        self._frame_overshoot = 0   # Cycles run_frame ran past the last frame
+
+        # Idle loops closed by a JR, found by processor.idle when the JR is
+        # first taken backwards: PC of the JR -> idle.Loop, or in
+        # busy_loops if it is not one
+        self.idle_loops = {}
+        self.busy_loops = set()
+        self._loop = None           # Idle loop that last went round undisturbed
+        self._loop_reads = None     # and the memory it read then
+        self._idle = None           # Idle loop the CPU is known to be stuck in
+
+        # Execution engine used by run(): the plain interpreter, or the
+        # translator which compiles guest code into cached Python blocks
+        if engine == 'interpreter':
+            self.translator = None
+        elif engine == 'translator':
+            self.translator = Translator(self)
+        else:
+            raise ValueError(f'Unknown engine {engine!r}')
+
 
     @property
     def A(self): return self._a
@@ -87,43 +170,254 @@ class CPU:
     @SP.setter
     def SP(self, value): self._sp = value & 0xffff
     
+    @property
+    def F(self): return self._f
+    @F.setter
+    def F(self, value): self._f = value & 0xf0
+
     @property
     def F_Z(self): return ((1 << 7) & self._f) >> 7
     @F_Z.setter
-    def F_Z(self, value): self._f = (1 & value) << 7 | self._f
+    def F_Z(self, value): self._f = (1 & value) << 7 | (self._f & 0x7f)
     
     @property
     def F_N(self): return ((1 << 6) & self._f) >> 6
     @F_N.setter
-    def F_N(self, value): self._f = (1 & value) << 6 | self._f
+    def F_N(self, value): self._f = (1 & value) << 6 | (self._f & 0xbf)
     
     @property
     def F_H(self): return ((1 << 5) & self._f) >> 5
     @F_H.setter
-    def F_H(self, value): self._f = (1 & value) << 5 | self._f
+    def F_H(self, value): self._f = (1 & value) << 5 | (self._f & 0xdf)
     
     @property
     def F_C(self): return ((1 << 4) & self._f) >> 4
     @F_C.setter
-    def F_C(self, value): self._f = (1 & value) << 4 | self._f
+    def F_C(self, value): self._f = (1 & value) << 4 | (self._f & 0xef)
     
-    def execute_next_instruction(self) -> int:
-        o = self.M[self.PC]
-        cycles = op_codes.process(o, self)
+    def load(self, address: int, data):
+        # Bulk copy, e.g. a ROM image, in a single slice assignment
+        self.M[address:address+len(data)] = data
+        self.bus.loaded(address, address + len(data))
+        self.idle_loops.clear()
+        self.busy_loops.clear()
+        if self.translator is not None:
+            self.translator.invalidate(address, address + len(data))
+
+    def view(self, region: str) -> memoryview:
+        # Zero-copy view of a named region, e.g. cpu.view('vram')
+        start, end = REGIONS[region]
+        return memoryview(self.M)[start:end]
+
+    def snapshot(self) -> bytes:
+        return bytes(self.M)
+
+    def restore(self, snapshot: bytes):
+        self.M[:] = snapshot
+        self.bus.loaded(0, len(self.M))
+        self.idle_loops.clear()
+        self.busy_loops.clear()
+        if self.translator is not None:
+            self.translator.flush()
+
+    def _write_ie(self, value: int):
+        if value != self.M[IE]:
+            self.M[IE] = value
+            self._irq = 1
+            self.deadline = 0
+
+    def _write_if(self, value: int):
+        if value != self.M[IF]:
+            self.M[IF] = value
+            self._irq = 1
+            self.deadline = 0
+
+    def request_interrupt(self, bit: int):
+        self._write_if(self.M[IF] | bit)
+
+    def _enable_interrupts(self) -> int:
+        # EI takes effect once the instruction after it has run, unless
+        # that instruction is DI. Returns the cycles it took.
+        cycles = self.ops[self.M[self._pc]](self, self.M)
+        if self._ei:
+            self._ei = 0
+            self.ime = 1
+            self._irq = 1
         return cycles
+
+    def _interrupt(self) -> int:
+        # Wakes the CPU if it is halted and an interrupt is pending, then
+        # services the highest priority one, if any: IME and its IF bit
+        # are cleared, PC is pushed and execution continues at the vector.
+        # Returns the cycles taken.
+        self._irq = 0
+        if not self.ime and not self.halted:
+            return 0
+        requested = self.M[IF] & 0x1f
+        pending = self.M[IE] & requested
+        if self.halted and (pending if self.halted == HALTED else requested & JOYPAD):
+            self.halted = 0
+
+        if self.halted or not self.ime or not pending:
+            return 0
+
+        bit = pending & -pending
+        self.M[IF] &= ~bit
+        self.ime = 0
+        self._loop = self._idle = None
+        self._sp = (self._sp - 2) & 0xffff
+        self.write16(self._sp, self._pc)
+        self._pc = VECTORS[bit]
+        return 20
+
+    def idle_loop(self, pc: int):
+        # Called by a JR at pc when it jumps backwards. Once an idle loop
+        # has gone round a complete iteration without anything it reads
+        # changing, the batch is ended so that run() can skip ahead.
+        bank = self.bus.rom_bank if 0x4000 <= pc < 0x8000 else 0
+        loop = self.idle_loops.get(pc)
+        if loop is None or loop.bank != bank:
+            # Code in RAM can be rewritten at any time, so only ROM is looked at
+            loop = analyse(self.M, pc, bank) if pc < 0x8000 else None
+            if loop is None:
+                self.busy_loops.add(pc)
+                return
+            self.idle_loops[pc] = loop
+
+        if self._loop is not loop:
+            self._loop, self._loop_reads = loop, loop.values(self)
+        elif loop.stable(self):
+            self._idle = loop
+            self.deadline = 0
+
+    def execute_next_instruction(self) -> int:
+        return self.ops[self.M[self._pc]](self, self.M)
     
-    def start(self):
-        
-        # 4194304 cycles per second (4.194304 MHz)
-        # 60 fps = 4194304/60 = 69905 (0.069905MHz)
-        # Every 69905 cycles, refresh
-        
-        MAX_CYCLES, cycles = 69905, 0
-    
-        while cycles < MAX_CYCLES:
-            c = self.execute_next_instruction()
-            cycles += c
+    def run(self, cycles: int) -> int:
+        # Runs batches of instructions up to the next scheduled event (or
+        # the end of the run), firing due events between batches. Dispatch
+        # table, memory and cycle count are kept in locals so the loop body
+        # is one table lookup and one call per instruction. Anything can end
+        # a batch early by lowering self.deadline; EI, RETI and IE/IF writes
+        # do, so interrupts are looked at between batches only when they
+        # may have become pending. While halted or stuck in an idle loop no
+        # instructions run at all and time jumps straight to the next event.
+        # Returns the cycles actually consumed, including any overshoot from
+        # the last instruction.
+        ops, mem = self.ops, self.M
+        scheduler, translator = self.scheduler, self.translator
+        start = now = self.cycles
+        end = start + cycles
+
+        # IME may have been changed from outside since the last run, and
+        # memory too, so an idle loop has to go round again before skipping
+        self._irq = 1
+        self._loop = self._idle = None
+
+        while now < end:
+            if self._ei:
+                now += self._enable_interrupts()
+                self.cycles = now
+            if self._irq:
+                now += self._interrupt()
+                self.cycles = now
+
+            if self.halted:
+                now = self._skip_halted(now, end)
+                continue
+
+            self.deadline = end if scheduler.next > end else scheduler.next
+
+            if self._idle is not None:
+                now = self._skip_idle(now)
+            elif translator is not None:
+                now = translator.run()
+            else:
+                while now < self.deadline:
+                    now += ops[mem[self._pc]](self, mem)
+                    self.cycles = now
+
+            if now >= scheduler.next:
+                scheduler.run_due(now)
+                self._events_ran()
+
+        return now - start
+
+    def _events_ran(self):
+        # Events run between batches, so an idle loop only has to go round
+        # again if they changed something it reads
+        loop = self._loop
+        if loop is not None and loop.values(self) != self._loop_reads:
+            self._loop = self._idle = None
+
+    def _skip_idle(self, now: int) -> int:
+        # Moves the cycle count on by the whole iterations that fit before
+        # the deadline, leaving PC at the top of the loop. Only there do the
+        # registers hold what executing the loop would have left in them, so
+        # the rest of the way is executed, and the JR closing it flags the
+        # loop again.
+        loop = self._idle
+        self._idle = None
+        if self.deadline > now:
+            now += (self.deadline - now) // loop.cycles * loop.cycles
+            self.cycles = now
+        return now
+
+    def _skip_halted(self, now: int, end: int) -> int:
+        # Nothing can wake a halted CPU before the next event, so the cycles
+        # up to it (or to the end of the run) pass without executing anything
+        scheduler = self.scheduler
+        if scheduler.next > now:
+            now = end if scheduler.next > end else scheduler.next
+            self.cycles = now
+        if now >= scheduler.next:
+            scheduler.run_due(now)
+            self._events_ran()
+        return now
+
+    def run_frame(self) -> int:
+        # Overshoot from the previous frame is taken off this frame's
+        # budget so frames stay aligned to the clock over a long run
+        budget = CYCLES_PER_FRAME - self._frame_overshoot
+        consumed = self.run(budget)
+        self._frame_overshoot = consumed - budget
+        return consumed
+
+    def run_until(self, predicate, max_cycles: int) -> int:
+        # Stops before the first instruction for which predicate(cpu) is
+        # true, or once max_cycles have been consumed
+        ops, mem, scheduler = self.ops, self.M, self.scheduler
+        start = now = self.cycles
+        end = start + max_cycles
+
+        self._irq = 1
+
+        while now < end and not predicate(self):
+            if self._irq:
+                now += self._interrupt()
+                self.cycles = now
+                continue
+            if self.halted:
+                now = self._skip_halted(now, end)
+                continue
+
+            ei = self._ei
+            now += ops[mem[self._pc]](self, mem)
+            self.cycles = now
+            if ei and self._ei:
+                self._ei = 0
+                self.ime = 1
+                self._irq = 1
+
+            if now >= scheduler.next:
+                scheduler.run_due(now)
+
+        return now - start
 
+    def start(self, frames=None):
+        # Runs frame after frame, indefinitely unless a frame count is given
+        frame = 0
 
-        # Update graphics etc here
-        pass
\ No newline at end of file
+        while frames is None or frame < frames:
+            self.run_frame()
+            frame += 1
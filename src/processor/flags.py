@@ -0,0 +1,81 @@
+# Precomputed results for the 8-bit ALU. Each entry packs the result byte
+# and the complete F value as (result << 8) | F, so an operation is one
+# lookup plus two stores instead of computing each flag.
+#
+#   INC, DEC            indexed by the operand
+#   ADD, SUB, AND,      indexed by (A << 8) | operand; CP uses SUB and
+#   XOR, OR             discards the result
+#   ADC, SBC            indexed by (carry << 16) | (A << 8) | operand
+#   DAA                 indexed by ((F & 0x70) << 4) | A
+#   RLC, RRC, RL, RR,   indexed by (carry << 8) | operand; RLCA etc. use
+#   SLA, SRA, SWAP, SRL these and clear Z
+#
+# The carry can be moved into place straight from F: (F & 0x10) << 12 for
+# ADC/SBC and (F & 0x10) << 4 for the rotates.
+
+Z, N, H, C = 0x80, 0x40, 0x20, 0x10
+
+# Every packed value, so that all tables share the same int objects
+_PACKED = tuple(range(0x10000))
+
+def _pack(r: int, f: int) -> int:
+    return _PACKED[(r & 0xff) << 8 | (0 if r & 0xff else Z) | f]
+
+def _add(a, v, carry):
+    return _pack(a + v + carry,
+                 (H if (a & 0x0f) + (v & 0x0f) + carry > 0x0f else 0) |
+                 (C if a + v + carry > 0xff else 0))
+
+def _sub(a, v, carry):
+    return _pack(a - v - carry,
+                 N | (H if (a & 0x0f) < (v & 0x0f) + carry else 0) |
+                 (C if a < v + carry else 0))
+
+def _daa(a, f):
+    carry = f & C
+    if f & N:
+        if carry:
+            a -= 0x60
+        if f & H:
+            a -= 0x06
+    else:
+        if carry or a > 0x99:
+            a += 0x60
+            carry = C
+        if f & H or (a & 0x0f) > 0x09:
+            a += 0x06
+    return _pack(a, (f & N) | carry)
+
+def _binary(fn, carry=0):
+    return tuple(fn(a, v, carry) for a in range(0x100) for v in range(0x100))
+
+INC = tuple(_pack(v + 1, H if v & 0x0f == 0x0f else 0) for v in range(0x100))
+DEC = tuple(_pack(v - 1, N | (H if v & 0x0f == 0 else 0)) for v in range(0x100))
+
+ADD = _binary(_add)
+ADC = ADD + _binary(_add, 1)
+SUB = _binary(_sub)
+SBC = SUB + _binary(_sub, 1)
+AND = _binary(lambda a, v, carry: _pack(a & v, H))
+XOR = _binary(lambda a, v, carry: _pack(a ^ v, 0))
+OR = _binary(lambda a, v, carry: _pack(a | v, 0))
+
+DAA = tuple(_daa(a, f << 4) for f in range(0x08) for a in range(0x100))
+
+def _shift(fn):
+    # fn(v, carry) -> (result, carry out)
+    table = []
+    for carry in (0, 1):
+        for v in range(0x100):
+            r, out = fn(v, carry)
+            table.append(_pack(r, C if out else 0))
+    return tuple(table)
+
+RLC = _shift(lambda v, carry: ((v << 1) | (v >> 7), v >> 7))
+RRC = _shift(lambda v, carry: ((v >> 1) | (v << 7), v & 1))
+RL = _shift(lambda v, carry: ((v << 1) | carry, v >> 7))
+RR = _shift(lambda v, carry: ((v >> 1) | (carry << 7), v & 1))
+SLA = _shift(lambda v, carry: (v << 1, v >> 7))
+SRA = _shift(lambda v, carry: ((v >> 1) | (v & 0x80), v & 1))
+SWAP = _shift(lambda v, carry: ((v << 4) | (v >> 4), 0))
+SRL = _shift(lambda v, carry: (v >> 1, v & 1))
@@ -0,0 +1,395 @@
+# Generates operations.py from the declarative spec in opcode_spec.py.
+#
+#   python -m processor.generate      (from src/)
+#
+# Every handler is specialised to its operands, so there is no runtime
+# branching on register or addressing mode. Handlers follow the shape the
+# translator expects: straight-line code ending in a PC advance and a
+# constant return, or a branch that sets PC itself.
+
+import os
+import re
+
+from processor import opcode_spec
+
+REG = {'A': '_a', 'B': '_b', 'C': '_c', 'D': '_d', 'E': '_e', 'H': '_h', 'L': '_l'}
+PAIRS = {'BC': ('_b', '_c'), 'DE': ('_d', '_e'), 'HL': ('_h', '_l'), 'AF': ('_a', '_f')}
+
+# Operand bytes following the opcode. Like any other address, PC + 1 and
+# PC + 2 wrap at 0xFFFF.
+D8 = 'mem[(pc+1) & 0xffff]'
+D16_HIGH = 'mem[(pc+2) & 0xffff]'
+A16 = f'({D16_HIGH} << 8) | {D8}'
+
+# Condition under which a conditional branch is *not* taken
+NOT_TAKEN = {
+    'NZ': 'cpu._f & 0x80',
+    'Z': 'not cpu._f & 0x80',
+    'NC': 'cpu._f & 0x10',
+    'C': 'not cpu._f & 0x10',
+}
+
+HEADER = '''\
+# Generated by processor.generate from processor.opcode_spec - do not edit.
+# Regenerate with: python -m processor.generate
+
+from .cpu import CPU
+from .flags import (ADC, ADD, AND, DAA, DEC, INC, OR, RL, RLC, RR, RRC, SBC,
+                    SLA, SRA, SRL, SUB, SWAP, XOR)
+'''
+
+def handler_name(mnemonic: str, operands: tuple) -> str:
+    # (X) -> aX ("address of"), HL+ / HL- -> hli / hld
+    parts = [mnemonic]
+    for operand in operands:
+        if operand.startswith('('):
+            operand = 'a' + operand[1:-1].replace('+', 'i').replace('-', 'd')
+        parts.append(operand.replace('+', '_'))
+    return '_'.join(parts).lower()
+
+def pair(rr: str) -> str:
+    if rr == 'SP':
+        return 'cpu._sp'
+    high, low = PAIRS[rr]
+    return f'(cpu.{high} << 8) | cpu.{low}'
+
+def set_pair(rr: str, value: str) -> list:
+    if rr == 'SP':
+        return [f'cpu._sp = {value}']
+    high, low = PAIRS[rr]
+    if rr == 'AF':
+        return [f'cpu.{high} = {value} >> 8', f'cpu.{low} = {value} & 0xf0']
+    return [f'cpu.{high} = {value} >> 8', f'cpu.{low} = {value} & 0xff']
+
+def read8(operand: str) -> tuple:
+    # Returns (setup lines, expression)
+    if operand in REG:
+        return [], f'cpu.{REG[operand]}'
+    if operand == 'd8':
+        return [], D8
+    if operand == '(HL)':
+        return ['hl = (cpu._h << 8) | cpu._l'], 'cpu.read8(hl)'
+    if operand in ('(BC)', '(DE)'):
+        return [], f'cpu.read8({pair(operand[1:-1])})'
+    if operand == '(a16)':
+        return [], f'cpu.read8({A16})'
+    if operand == '(a8)':
+        return [], f'cpu.read8(0xff00 | {D8})'
+    if operand == '(C)':
+        return [], 'cpu.read8(0xff00 | cpu._c)'
+    raise ValueError(operand)
+
+def write8(operand: str, value: str, hl_defined=False) -> list:
+    if operand in REG:
+        return [f'cpu.{REG[operand]} = {value}']
+    if operand == '(HL)':
+        address = 'hl' if hl_defined else '(cpu._h << 8) | cpu._l'
+        return [f'cpu.write8({address}, {value})']
+    if operand in ('(BC)', '(DE)'):
+        return [f'cpu.write8({pair(operand[1:-1])}, {value})']
+    if operand == '(a16)':
+        return [f'cpu.write8({A16}, {value})']
+    if operand == '(a8)':
+        return [f'cpu.write8(0xff00 | {D8}, {value})']
+    if operand == '(C)':
+        return [f'cpu.write8(0xff00 | cpu._c, {value})']
+    raise ValueError(operand)
+
+def flags(spec: str, conditions: dict) -> list:
+    # Builds the single assignment to F described by the spec's flag column
+    parts, keep, constant = [], 0, 0
+    for letter, shift, effect in zip('ZNHC', (7, 6, 5, 4), spec):
+        if effect == '-':
+            keep |= 1 << shift
+        elif effect == '1':
+            constant |= 1 << shift
+        elif effect != '0':
+            parts.append(f'({conditions[letter]}) << {shift}')
+    if keep == 0xf0:
+        return []
+    if constant:
+        parts.append(f'{constant:#04x}')
+    if keep:
+        parts.append(f'(cpu._f & {keep:#04x})')
+    return [f'cpu._f = {" | ".join(parts) or "0"}']
+
+# Operation families. Each returns (compute lines, flag conditions, write
+# lines); flags are assigned between computing and writing back. Passing
+# None for the conditions means the family sets F itself, which is the case
+# for everything backed by a table in processor.flags.
+
+# Index expression for the tables keyed by carry, see processor.flags
+ALU_CARRY = '(cpu._f & 0x10) << 12 | '
+SHIFT_CARRY = '(cpu._f & 0x10) << 4 | '
+
+def lookup(table: str, key: str, keep_c=False) -> tuple:
+    # Returns (compute lines, F assignment) for a packed table entry
+    f = '(t & 0xff) | (cpu._f & 0x10)' if keep_c else 't & 0xff'
+    return [f't = {table}[{key}]'], f'cpu._f = {f}'
+
+def op_ld(operands, spec):
+    dst, src = operands
+    if src == 'd16':
+        if dst == 'SP':
+            return [], {}, [f'cpu._sp = {A16}']
+        high, low = PAIRS[dst]
+        return [], {}, [f'cpu.{high} = {D16_HIGH}', f'cpu.{low} = {D8}']
+    if dst == '(a16)' and src == 'SP':
+        return [], {}, [f'cpu.write16({A16}, cpu._sp)']
+    if dst == 'SP':
+        return [], {}, [f'cpu._sp = {pair(src)}']
+    if src == 'SP+r8':
+        compute, conditions, _ = op_add_sp(operands, spec)
+        return compute, conditions, ['cpu._h = r >> 8', 'cpu._l = r & 0xff']
+    if '(HL+)' in operands or '(HL-)' in operands:
+        step = '+ 1' if '+' in dst + src else '- 1'
+        compute = ['hl = (cpu._h << 8) | cpu._l']
+        if dst == 'A':
+            compute.append('cpu._a = cpu.read8(hl)')
+        else:
+            compute.append('cpu.write8(hl, cpu._a)')
+        compute.append(f'hl = (hl {step}) & 0xffff')
+        return compute, {}, ['cpu._h = hl >> 8', 'cpu._l = hl & 0xff']
+    setup, value = read8(src)
+    return setup, {}, write8(dst, value, hl_defined=bool(setup))
+
+def op_inc_dec(mnemonic, operands, spec):
+    operand, = operands
+    sign = '+' if mnemonic == 'INC' else '-'
+    if operand == 'SP':
+        return [], {}, [f'cpu._sp = (cpu._sp {sign} 1) & 0xffff']
+    if operand in PAIRS:
+        name = operand.lower()
+        return ([f'{name} = (({pair(operand)}) {sign} 1) & 0xffff'], {},
+                set_pair(operand, name))
+    setup, value = read8(operand)
+    compute, f = lookup(mnemonic, value, keep_c=True)
+    return setup + compute, None, [f] + write8(operand, 't >> 8', hl_defined=bool(setup))
+
+def op_add_hl(operands, spec):
+    _, src = operands
+    value = 'hl' if src == 'HL' else pair(src)
+    return (['hl = (cpu._h << 8) | cpu._l', f'v = {value}', 'r = hl + v'],
+            {'H': '(hl & 0x0fff) + (v & 0x0fff) > 0x0fff', 'C': 'r > 0xffff'},
+            ['cpu._h = (r >> 8) & 0xff', 'cpu._l = r & 0xff'])
+
+def op_add_sp(operands, spec):
+    # H and C come from an unsigned add of the offset to the low byte of SP
+    return (['sp = cpu._sp', f'v = {D8}', 'r = (sp + ((v ^ 0x80) - 0x80)) & 0xffff',
+             'cpu._f = ADD[(sp & 0xff) << 8 | v] & 0x30'],
+            None, ['cpu._sp = r'])
+
+def op_alu(mnemonic, operands, spec):
+    setup, value = read8(operands[-1])
+    key = f'cpu._a << 8 | {value}'
+    if mnemonic in ('ADC', 'SBC'):
+        key = ALU_CARRY + key
+    if mnemonic == 'CP':
+        return setup, None, [f'cpu._f = SUB[{key}] & 0xff']
+    compute, f = lookup(mnemonic, key)
+    return setup + compute, None, ['cpu._a = t >> 8', f]
+
+def op_rotate_a(mnemonic, operands, spec):
+    # The CB table without the Z flag
+    table = mnemonic[:-1]
+    key = SHIFT_CARRY + 'cpu._a' if table in ('RL', 'RR') else 'cpu._a'
+    return [f't = {table}[{key}]'], None, ['cpu._a = t >> 8', 'cpu._f = t & 0x10']
+
+def op_daa(operands, spec):
+    compute, f = lookup('DAA', '(cpu._f & 0x70) << 4 | cpu._a')
+    return compute, None, ['cpu._a = t >> 8', f]
+
+def op_misc(mnemonic, operands, spec):
+    if mnemonic == 'CPL':
+        return [], {}, ['cpu._a ^= 0xff']
+    if mnemonic == 'CCF':
+        return [], {'C': 'not cpu._f & 0x10'}, []
+    if mnemonic == 'DI':
+        return [], {}, ['cpu.ime = 0', 'cpu._ei = 0']
+    if mnemonic == 'EI':
+        # Takes effect after the next instruction; ending the batch here
+        # lets the run loop see to that
+        return [], {}, ['cpu._ei = 1', 'cpu.deadline = 0']
+    if mnemonic == 'HALT':
+        # The run loop skips ahead to the next event until an interrupt is
+        # pending. Checking straight away catches one that already is.
+        return [], {}, ['cpu.halted = 1', 'cpu._irq = 1', 'cpu.deadline = 0']
+    if mnemonic == 'STOP':
+        return [], {}, ['cpu.halted = 2', 'cpu.deadline = 0']
+    # NOP, SCF
+    return [], {}, []
+
+def op_push(operands, spec):
+    rr, = operands
+    return ['sp = (cpu._sp - 2) & 0xffff'], {}, ['cpu._sp = sp', f'cpu.write16(sp, {pair(rr)})']
+
+def op_pop(operands, spec):
+    rr, = operands
+    return (['sp = cpu._sp', 'v = cpu.read16(sp)'], None,
+            ['cpu._sp = (sp + 2) & 0xffff'] + set_pair(rr, 'v'))
+
+def op_cb(mnemonic, operands, spec):
+    setup, value = read8(operands[-1])
+    compute = setup + [f'v = {value}']
+    write = lambda r: write8(operands[-1], r, hl_defined=bool(setup))
+    if mnemonic in ('BIT', 'RES', 'SET'):
+        mask = 1 << int(operands[0])
+        if mnemonic == 'BIT':
+            return compute, {'Z': f'(v & {mask:#04x}) == 0'}, []
+        if mnemonic == 'RES':
+            return compute, {}, write(f'v & {~mask & 0xff:#04x}')
+        return compute, {}, write(f'v | {mask:#04x}')
+
+    key = SHIFT_CARRY + value if mnemonic in ('RL', 'RR') else value
+    lookup_lines, f = lookup(mnemonic, key)
+    return setup + lookup_lines, None, [f] + write('t >> 8')
+
+def straight(mnemonic, operands, spec, cb):
+    # Body of an instruction that simply falls through to the next one
+    if cb:
+        return op_cb(mnemonic, operands, spec)
+    if mnemonic in ('LD', 'LDH'):
+        return op_ld(operands, spec)
+    if mnemonic in ('INC', 'DEC'):
+        return op_inc_dec(mnemonic, operands, spec)
+    if mnemonic == 'ADD' and operands[0] == 'HL':
+        return op_add_hl(operands, spec)
+    if mnemonic == 'ADD' and operands[0] == 'SP':
+        return op_add_sp(operands, spec)
+    if mnemonic in ('ADD', 'ADC', 'SUB', 'SBC', 'AND', 'XOR', 'OR', 'CP'):
+        return op_alu(mnemonic, operands, spec)
+    if mnemonic in ('RLCA', 'RRCA', 'RLA', 'RRA'):
+        return op_rotate_a(mnemonic, operands, spec)
+    if mnemonic == 'DAA':
+        return op_daa(operands, spec)
+    if mnemonic == 'PUSH':
+        return op_push(operands, spec)
+    if mnemonic == 'POP':
+        return op_pop(operands, spec)
+    return op_misc(mnemonic, operands, spec)
+
+def branch(mnemonic, operands, length, cycles):
+    # Body of an instruction that sets PC itself
+    condition = operands[0] if operands and operands[0] in NOT_TAKEN else None
+    taken, not_taken = cycles if condition else (cycles, None)
+    target = operands[-1] if operands else None
+
+    lines = []
+    if condition:
+        lines += [
+            f'if {NOT_TAKEN[condition]}:',
+            f'    cpu._pc = (pc + {length}) & 0xffff',
+            f'    return {not_taken}',
+        ]
+
+    if mnemonic == 'JR':
+        # Jumping backwards may close an idle loop, see CPU.idle_loop
+        lines += [
+            f'offset = ({D8} ^ 0x80) - 0x80',
+            f'cpu._pc = (pc + {length} + offset) & 0xffff',
+            'if offset < 0 and pc not in cpu.busy_loops:',
+            '    cpu.idle_loop(pc)',
+        ]
+    elif mnemonic == 'JP' and target == 'HL':
+        lines.append('cpu._pc = (cpu._h << 8) | cpu._l')
+    elif mnemonic == 'JP':
+        lines.append(f'cpu._pc = {A16}')
+    elif mnemonic in ('CALL', 'RST'):
+        address = A16 if mnemonic == 'CALL' else f'{int(target[:2], 16):#06x}'
+        lines += [
+            'sp = (cpu._sp - 2) & 0xffff',
+            'cpu._sp = sp',
+            f'cpu.write16(sp, (pc + {length}) & 0xffff)',
+            f'cpu._pc = {address}',
+        ]
+    else:
+        # RET, RETI
+        lines += [
+            'sp = cpu._sp',
+            'cpu._pc = cpu.read16(sp)',
+            'cpu._sp = (sp + 2) & 0xffff',
+        ]
+        if mnemonic == 'RETI':
+            lines += ['cpu.ime = 1', 'cpu._irq = 1', 'cpu.deadline = 0']
+
+    lines.append(f'return {taken}')
+    if re.search(r'\bpc\b', '\n'.join(lines)):
+        lines.insert(0, 'pc = cpu._pc')
+    return lines
+
+BRANCHES = ('JR', 'JP', 'CALL', 'RET', 'RETI', 'RST')
+
+def handler(opcode: int, spec: tuple, cb=False) -> tuple:
+    mnemonic, operands, length, cycles, flag_spec = spec
+    name = handler_name(mnemonic, operands)
+
+    if mnemonic in BRANCHES:
+        body = branch(mnemonic, operands, length, cycles)
+    else:
+        compute, conditions, write = straight(mnemonic, operands, flag_spec, cb)
+        body = compute
+        if conditions is not None:
+            body += flags(flag_spec, conditions)
+        body += write
+        if re.search(r'\bpc\b', '\n'.join(body)):
+            body = ['pc = cpu._pc'] + body + [f'cpu._pc = (pc + {length}) & 0xffff']
+        else:
+            body += [f'cpu._pc = (cpu._pc + {length}) & 0xffff']
+        body.append(f'return {cycles}')
+
+    source = '\n'.join('    ' + line for line in body)
+    mem = 'mem: list[int]' if re.search(r'\bmem\b', source) else 'mem: list[int] = None'
+    prefix = '0xCB ' if cb else ''
+    comment = f'# {prefix}0x{opcode:02X} {mnemonic} {", ".join(operands)}'.rstrip()
+
+    return name, f'{comment}\ndef {name}(cpu: CPU, {mem}):\n{source}\n'
+
+def generate() -> str:
+    out = [HEADER]
+    base, cb = [None] * 0x100, [None] * 0x100
+    names = set()
+
+    for table, spec, is_cb in ((base, opcode_spec.BASE, False), (cb, opcode_spec.CB, True)):
+        for opcode in sorted(spec):
+            if spec[opcode][0] == 'PREFIX':
+                continue
+            name, source = handler(opcode, spec[opcode], is_cb)
+            if name in names:
+                raise ValueError(f'Duplicate handler name {name}')
+            names.add(name)
+            table[opcode] = name
+            out.append(source)
+
+    lengths = [1] * 0x100
+    for opcode, (mnemonic, operands, length, cycles, flag_spec) in opcode_spec.BASE.items():
+        lengths[opcode] = length
+    # Counting the opcode that follows the prefix
+    lengths[0xcb] = 2
+
+    out.append('# Handler names kept from before the generator')
+    for alias, opcode in opcode_spec.ALIASES.items():
+        out.append(f'{alias} = {base[opcode]}')
+
+    out.append('\n# Dispatch tables indexed by opcode. None marks an unused opcode, and')
+    out.append('# 0xCB is dispatched by op_codes.prefix_cb.')
+    for table_name, table in (('BASE', base), ('CB', cb)):
+        out.append(f'{table_name} = (')
+        for row in range(0, 0x100, 8):
+            out.append('    ' + ' '.join(f'{name or "None"},' for name in table[row:row+8]))
+        out.append(')\n')
+
+    out.append('# Instruction lengths in bytes')
+    out.append('LENGTHS = (')
+    for row in range(0, 0x100, 16):
+        out.append('    ' + ' '.join(f'{length},' for length in lengths[row:row+16]))
+    out.append(')')
+
+    return '\n'.join(out) + '\n'
+
+def main():
+    path = os.path.join(os.path.dirname(__file__), 'operations.py')
+    with open(path, 'w') as f:
+        f.write(generate())
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,158 @@
+from processor.opcode_spec import BASE, CB
+
+# Idle loop detection. Code waiting for the hardware usually spins in a
+# short loop polling a register, e.g.
+#
+#   wait: LDH A, (0x44)     ; LY
+#         CP 0x90
+#         JR NZ, wait
+#
+# If a loop writes no memory, recomputes every register it writes from
+# scratch each time round, and only reads memory that nothing but a
+# scheduled event can change, then after the first iteration every
+# register holds the same value at the top of each iteration until
+# something the loop reads changes. The run loop moves the cycle count on by
+# whole iterations instead of executing them; PC stays at the top.
+# Registers in the middle of an iteration can differ, so any part of one is
+# executed as usual.
+#
+# Analysis works on units: the 8-bit registers 'A'-'L' and the flags
+# 'z', 'n', 'h', 'c'.
+
+# Longer loops are not worth analysing
+MAX_LOOP_BYTES = 16
+
+# Cycles for the JR that closes the loop when it is taken
+JR_TAKEN = 12
+
+CONDITION_FLAGS = {'NZ': 'z', 'Z': 'z', 'NC': 'c', 'C': 'c'}
+POINTERS = {'(BC)': 'BC', '(DE)': 'DE', '(HL)': 'HL', '(C)': 'C'}
+ALU = ('ADD', 'ADC', 'SUB', 'SBC', 'AND', 'XOR', 'OR', 'CP')
+
+def _registers(operand: str) -> set:
+    if operand in ('A', 'B', 'C', 'D', 'E', 'H', 'L'):
+        return {operand}
+    if operand in ('BC', 'DE', 'HL'):
+        return set(operand)
+    return None
+
+def _source(operand: str, mem, address: int):
+    # (units read, memory operand) for an operand that is read, or None if
+    # the loop cannot contain it. Memory operands are an absolute address
+    # or one of POINTERS.
+    registers = _registers(operand)
+    if registers is not None:
+        return registers, None
+    if operand in ('d8', 'd16'):
+        return set(), None
+    if operand == '(a8)':
+        return set(), 0xff00 | mem[address + 1]
+    if operand == '(a16)':
+        return set(), mem[address + 2] << 8 | mem[address + 1]
+    if operand in POINTERS:
+        return set(POINTERS[operand]), operand
+    return None
+
+def _effects(spec: tuple, mem, address: int):
+    # (units read, units written, memory operand) of an instruction, or
+    # None if it has other side effects (memory writes, the stack, control
+    # flow...) or always changes what it reads (INC, rotates...)
+    mnemonic, operands, length, cycles, flags = spec
+    written = {flag for flag, effect in zip('znhc', flags.lower()) if effect != '-'}
+
+    if mnemonic == 'NOP':
+        return set(), set(), None
+
+    if mnemonic in ('LD', 'LDH'):
+        dst, src = operands
+        registers = _registers(dst)
+        source = _source(src, mem, address)
+        if registers is None or source is None:
+            return None
+        return source[0], registers | written, source[1]
+
+    if mnemonic in ALU:
+        source = _source(operands[-1], mem, address)
+        if source is None:
+            return None
+        read = source[0] | {'A'}
+        if mnemonic in ('ADC', 'SBC'):
+            read.add('c')
+        if mnemonic != 'CP':
+            written.add('A')
+        return read, written, source[1]
+
+    if mnemonic == 'BIT':
+        source = _source(operands[1], mem, address)
+        if source is None:
+            return None
+        return source[0], written, source[1]
+
+    return None
+
+class Loop:
+    # An idle loop: cycles per iteration and the memory it reads as
+    # addresses or POINTERS, which are looked up with the registers as they
+    # are when the loop runs
+    __slots__ = ('bank', 'cycles', 'reads')
+
+    def __init__(self, bank: int, cycles: int, reads: tuple):
+        self.bank = bank
+        self.cycles = cycles
+        self.reads = reads
+
+    def addresses(self, cpu) -> list:
+        return [address if type(address) is int
+                else cpu.C | 0xff00 if address == '(C)' else getattr(cpu, POINTERS[address])
+                for address in self.reads]
+
+    def stable(self, cpu) -> bool:
+        # True if every read sees plain memory right now. Registers with a
+        # read hook (DIV, TIMA...) can change with every cycle.
+        direct = cpu.bus.direct
+        return all(direct(address) for address in self.addresses(cpu))
+
+    def values(self, cpu) -> list:
+        mem = cpu.M
+        return [mem[address] for address in self.addresses(cpu)]
+
+def analyse(mem, pc: int, bank: int = 0):
+    # Returns a Loop for the JR at pc if it closes an idle loop, else None
+    opcode = mem[pc]
+    mnemonic, operands, length, cycles, flags = BASE[opcode]
+    target = (pc + 2 + ((mem[pc+1] ^ 0x80) - 0x80)) & 0xffff
+    if mnemonic != 'JR' or target > pc or pc - target > MAX_LOOP_BYTES:
+        return None
+
+    # Decode the body, which has to end exactly at the JR
+    body, address, total = [], target, JR_TAKEN
+    while address < pc:
+        spec = BASE.get(mem[address])
+        if spec is not None and spec[0] == 'PREFIX':
+            spec = CB[mem[address + 1]]
+        if spec is None:
+            return None
+        effects = _effects(spec, mem, address)
+        if effects is None:
+            return None
+        body.append(effects)
+        address += spec[2]
+        total += spec[3]
+    if address != pc:
+        return None
+
+    condition = operands[0] if len(operands) == 2 else None
+    body.append(({CONDITION_FLAGS[condition]} if condition else set(), set(), None))
+
+    # A unit the loop writes has to be written before it is read in each
+    # iteration, otherwise it carries something over from the last one
+    changed = set().union(*(written for read, written, memory in body))
+    written_so_far, reads = set(), []
+    for read, written, memory in body:
+        if (read & changed) - written_so_far:
+            return None
+        written_so_far |= written
+        if memory is not None:
+            reads.append(memory)
+
+    return Loop(bank, total, tuple(reads))
@@ -0,0 +1,32 @@
+# DMG memory map. End addresses are exclusive so they can be used directly
+# as slice bounds.
+ROM0 = (0x0000, 0x4000)     # Cartridge ROM, bank 0
+ROMX = (0x4000, 0x8000)     # Cartridge ROM, switchable bank
+VRAM = (0x8000, 0xa000)     # Video RAM
+SRAM = (0xa000, 0xc000)     # Cartridge RAM
+WRAM = (0xc000, 0xe000)     # Work RAM
+ECHO = (0xe000, 0xfe00)     # Mirror of 0xC000-0xDDFF
+OAM  = (0xfe00, 0xfea0)     # Sprite attribute table
+IO   = (0xff00, 0xff80)     # I/O registers
+HRAM = (0xff80, 0xffff)     # High RAM
+IE   = (0xffff, 0x10000)    # Interrupt enable register
+
+REGIONS = {
+    'rom0': ROM0,
+    'romx': ROMX,
+    'vram': VRAM,
+    'sram': SRAM,
+    'wram': WRAM,
+    'echo': ECHO,
+    'oam': OAM,
+    'io': IO,
+    'hram': HRAM,
+    'ie': IE,
+}
+
+# 64K address space plus one guard byte, so a 16-bit store at 0xFFFF does
+# not fall off the end
+MEMORY_SIZE = 0x10001
+
+def new_memory() -> bytearray:
+    return bytearray(MEMORY_SIZE)
@@ -1,32 +1,28 @@
 from . import operations
 
-def process(c, cpu):
-    codes = {
-        0x00: lambda cpu: operations.nop(cpu),
-        0x01: lambda cpu: operations.ld_bc_d16(cpu, cpu.M),
-        0x02: lambda cpu: operations.ld_bc_a(cpu, cpu.M),
-        0x03: lambda cpu: operations.inc_bc(cpu),
-        0x04: lambda cpu: operations.inc_b(cpu),    
-        0x05: lambda cpu: operations.dec_b(cpu),
-        0x06: lambda cpu: operations.ld_b_d8(cpu, cpu.M),
-        0x07: lambda cpu: operations.rlca(cpu),
-        0x08: lambda cpu: operations.ld_a16_sp(cpu),
-        0x09: lambda cpu: operations.add_hl_bc(cpu),
-        0x0a: lambda cpu: operations.ld_a_abc(cpu, cpu.M),
-        0x0b: lambda cpu: operations.dec_bc(cpu),
-        0x0c: lambda cpu: operations.inc_c(cpu),
-        0x0d: lambda cpu: operations.dec_c(cpu),
-        
-        0x10: lambda cpu: operations.stop(cpu),
-        0x11: lambda cpu: operations.ld_de_d16(cpu,cpu.M),
-        
-        0x20: lambda cpu: operations.jr_nz_r8(cpu,cpu.M),
-        0x21: lambda cpu: operations.ld_hl_d16(cpu,cpu.M),
-        
-        0x30: lambda cpu: operations.jr_nc_r8(cpu,cpu.M),
-        0x31: lambda cpu: operations.ld_sp_d16(cpu,cpu.M),
+class UnimplementedOpcode(NotImplementedError):
+    pass
+
+def unimplemented(cpu, mem):
+    raise UnimplementedOpcode(f'Opcode {mem[cpu.PC]:#04x} at {cpu.PC:#06x} is not implemented')
+
+def unimplemented_cb(cpu, mem):
+    raise UnimplementedOpcode(f'Opcode 0xcb {mem[(cpu.PC + 1) & 0xffff]:#04x} at {cpu.PC:#06x} is not implemented')
+
+# 0xCB PREFIX CB, through the CPU's own table
+def prefix_cb(cpu, mem):
+    return cpu.cb_ops[mem[(cpu.PC + 1) & 0xffff]](cpu, mem)
 
-        0xaf: lambda cpu: operations.xor_a(cpu),
-    }
-        
-    return codes[c](cpu)
\ No newline at end of file
+# Built once at import from the generated tables in operations. Every
+# handler takes (cpu, mem) and is indexed directly by its opcode, so
+# dispatch is a single tuple lookup.
+OPS = tuple(unimplemented if h is None else h for h in operations.BASE)
+OPS = OPS[:0xcb] + (prefix_cb,) + OPS[0xcc:]
+CB_OPS = tuple(unimplemented_cb if h is None else h for h in operations.CB)
+
+# Instruction lengths in bytes, used to decode ahead of the PC. 0xCB counts
+# the opcode that follows it.
+LENGTHS = operations.LENGTHS
+
+def process(c, cpu):
+    return OPS[c](cpu, cpu.M)
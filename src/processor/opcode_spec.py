@@ -0,0 +1,198 @@
+# Declarative description of the SM83 instruction set, consumed by
+# processor.generate to build operations.py.
+#
+# Each entry is opcode: (mnemonic, operands, length, cycles, flags)
+#
+#   length  - instruction length in bytes
+#   cycles  - clock cycles, or (taken, not taken) for conditional branches
+#   flags   - effect on Z N H C: '-' unaffected, '0'/'1' reset/set, or the
+#             flag letter when it depends on the result
+#
+# Operands use the usual notation: d8/d16 immediates, a8/a16 addresses,
+# r8 signed offsets, and parentheses for memory accesses. CB-prefixed
+# instructions include the prefix byte in their length and cycles.
+
+R8 = ('B', 'C', 'D', 'E', 'H', 'L', '(HL)', 'A')
+
+BASE = {
+    0x00: ('NOP', (), 1, 4, '----'),
+    0x01: ('LD', ('BC', 'd16'), 3, 12, '----'),
+    0x02: ('LD', ('(BC)', 'A'), 1, 8, '----'),
+    0x03: ('INC', ('BC',), 1, 8, '----'),
+    0x04: ('INC', ('B',), 1, 4, 'Z0H-'),
+    0x05: ('DEC', ('B',), 1, 4, 'Z1H-'),
+    0x06: ('LD', ('B', 'd8'), 2, 8, '----'),
+    0x07: ('RLCA', (), 1, 4, '000C'),
+    0x08: ('LD', ('(a16)', 'SP'), 3, 20, '----'),
+    0x09: ('ADD', ('HL', 'BC'), 1, 8, '-0HC'),
+    0x0a: ('LD', ('A', '(BC)'), 1, 8, '----'),
+    0x0b: ('DEC', ('BC',), 1, 8, '----'),
+    0x0c: ('INC', ('C',), 1, 4, 'Z0H-'),
+    0x0d: ('DEC', ('C',), 1, 4, 'Z1H-'),
+    0x0e: ('LD', ('C', 'd8'), 2, 8, '----'),
+    0x0f: ('RRCA', (), 1, 4, '000C'),
+
+    0x10: ('STOP', (), 2, 4, '----'),
+    0x11: ('LD', ('DE', 'd16'), 3, 12, '----'),
+    0x12: ('LD', ('(DE)', 'A'), 1, 8, '----'),
+    0x13: ('INC', ('DE',), 1, 8, '----'),
+    0x14: ('INC', ('D',), 1, 4, 'Z0H-'),
+    0x15: ('DEC', ('D',), 1, 4, 'Z1H-'),
+    0x16: ('LD', ('D', 'd8'), 2, 8, '----'),
+    0x17: ('RLA', (), 1, 4, '000C'),
+    0x18: ('JR', ('r8',), 2, 12, '----'),
+    0x19: ('ADD', ('HL', 'DE'), 1, 8, '-0HC'),
+    0x1a: ('LD', ('A', '(DE)'), 1, 8, '----'),
+    0x1b: ('DEC', ('DE',), 1, 8, '----'),
+    0x1c: ('INC', ('E',), 1, 4, 'Z0H-'),
+    0x1d: ('DEC', ('E',), 1, 4, 'Z1H-'),
+    0x1e: ('LD', ('E', 'd8'), 2, 8, '----'),
+    0x1f: ('RRA', (), 1, 4, '000C'),
+
+    0x20: ('JR', ('NZ', 'r8'), 2, (12, 8), '----'),
+    0x21: ('LD', ('HL', 'd16'), 3, 12, '----'),
+    0x22: ('LD', ('(HL+)', 'A'), 1, 8, '----'),
+    0x23: ('INC', ('HL',), 1, 8, '----'),
+    0x24: ('INC', ('H',), 1, 4, 'Z0H-'),
+    0x25: ('DEC', ('H',), 1, 4, 'Z1H-'),
+    0x26: ('LD', ('H', 'd8'), 2, 8, '----'),
+    0x27: ('DAA', (), 1, 4, 'Z-0C'),
+    0x28: ('JR', ('Z', 'r8'), 2, (12, 8), '----'),
+    0x29: ('ADD', ('HL', 'HL'), 1, 8, '-0HC'),
+    0x2a: ('LD', ('A', '(HL+)'), 1, 8, '----'),
+    0x2b: ('DEC', ('HL',), 1, 8, '----'),
+    0x2c: ('INC', ('L',), 1, 4, 'Z0H-'),
+    0x2d: ('DEC', ('L',), 1, 4, 'Z1H-'),
+    0x2e: ('LD', ('L', 'd8'), 2, 8, '----'),
+    0x2f: ('CPL', (), 1, 4, '-11-'),
+
+    0x30: ('JR', ('NC', 'r8'), 2, (12, 8), '----'),
+    0x31: ('LD', ('SP', 'd16'), 3, 12, '----'),
+    0x32: ('LD', ('(HL-)', 'A'), 1, 8, '----'),
+    0x33: ('INC', ('SP',), 1, 8, '----'),
+    0x34: ('INC', ('(HL)',), 1, 12, 'Z0H-'),
+    0x35: ('DEC', ('(HL)',), 1, 12, 'Z1H-'),
+    0x36: ('LD', ('(HL)', 'd8'), 2, 12, '----'),
+    0x37: ('SCF', (), 1, 4, '-001'),
+    0x38: ('JR', ('C', 'r8'), 2, (12, 8), '----'),
+    0x39: ('ADD', ('HL', 'SP'), 1, 8, '-0HC'),
+    0x3a: ('LD', ('A', '(HL-)'), 1, 8, '----'),
+    0x3b: ('DEC', ('SP',), 1, 8, '----'),
+    0x3c: ('INC', ('A',), 1, 4, 'Z0H-'),
+    0x3d: ('DEC', ('A',), 1, 4, 'Z1H-'),
+    0x3e: ('LD', ('A', 'd8'), 2, 8, '----'),
+    0x3f: ('CCF', (), 1, 4, '-00C'),
+
+    0xc0: ('RET', ('NZ',), 1, (20, 8), '----'),
+    0xc1: ('POP', ('BC',), 1, 12, '----'),
+    0xc2: ('JP', ('NZ', 'a16'), 3, (16, 12), '----'),
+    0xc3: ('JP', ('a16',), 3, 16, '----'),
+    0xc4: ('CALL', ('NZ', 'a16'), 3, (24, 12), '----'),
+    0xc5: ('PUSH', ('BC',), 1, 16, '----'),
+    0xc6: ('ADD', ('A', 'd8'), 2, 8, 'Z0HC'),
+    0xc7: ('RST', ('00H',), 1, 16, '----'),
+    0xc8: ('RET', ('Z',), 1, (20, 8), '----'),
+    0xc9: ('RET', (), 1, 16, '----'),
+    0xca: ('JP', ('Z', 'a16'), 3, (16, 12), '----'),
+    0xcb: ('PREFIX', ('CB',), 1, 4, '----'),
+    0xcc: ('CALL', ('Z', 'a16'), 3, (24, 12), '----'),
+    0xcd: ('CALL', ('a16',), 3, 24, '----'),
+    0xce: ('ADC', ('A', 'd8'), 2, 8, 'Z0HC'),
+    0xcf: ('RST', ('08H',), 1, 16, '----'),
+
+    0xd0: ('RET', ('NC',), 1, (20, 8), '----'),
+    0xd1: ('POP', ('DE',), 1, 12, '----'),
+    0xd2: ('JP', ('NC', 'a16'), 3, (16, 12), '----'),
+    0xd4: ('CALL', ('NC', 'a16'), 3, (24, 12), '----'),
+    0xd5: ('PUSH', ('DE',), 1, 16, '----'),
+    0xd6: ('SUB', ('d8',), 2, 8, 'Z1HC'),
+    0xd7: ('RST', ('10H',), 1, 16, '----'),
+    0xd8: ('RET', ('C',), 1, (20, 8), '----'),
+    0xd9: ('RETI', (), 1, 16, '----'),
+    0xda: ('JP', ('C', 'a16'), 3, (16, 12), '----'),
+    0xdc: ('CALL', ('C', 'a16'), 3, (24, 12), '----'),
+    0xde: ('SBC', ('A', 'd8'), 2, 8, 'Z1HC'),
+    0xdf: ('RST', ('18H',), 1, 16, '----'),
+
+    0xe0: ('LDH', ('(a8)', 'A'), 2, 12, '----'),
+    0xe1: ('POP', ('HL',), 1, 12, '----'),
+    0xe2: ('LD', ('(C)', 'A'), 1, 8, '----'),
+    0xe5: ('PUSH', ('HL',), 1, 16, '----'),
+    0xe6: ('AND', ('d8',), 2, 8, 'Z010'),
+    0xe7: ('RST', ('20H',), 1, 16, '----'),
+    0xe8: ('ADD', ('SP', 'r8'), 2, 16, '00HC'),
+    0xe9: ('JP', ('HL',), 1, 4, '----'),
+    0xea: ('LD', ('(a16)', 'A'), 3, 16, '----'),
+    0xee: ('XOR', ('d8',), 2, 8, 'Z000'),
+    0xef: ('RST', ('28H',), 1, 16, '----'),
+
+    0xf0: ('LDH', ('A', '(a8)'), 2, 12, '----'),
+    0xf1: ('POP', ('AF',), 1, 12, 'ZNHC'),
+    0xf2: ('LD', ('A', '(C)'), 1, 8, '----'),
+    0xf3: ('DI', (), 1, 4, '----'),
+    0xf5: ('PUSH', ('AF',), 1, 16, '----'),
+    0xf6: ('OR', ('d8',), 2, 8, 'Z000'),
+    0xf7: ('RST', ('30H',), 1, 16, '----'),
+    0xf8: ('LD', ('HL', 'SP+r8'), 2, 12, '00HC'),
+    0xf9: ('LD', ('SP', 'HL'), 1, 8, '----'),
+    0xfa: ('LD', ('A', '(a16)'), 3, 16, '----'),
+    0xfb: ('EI', (), 1, 4, '----'),
+    0xfe: ('CP', ('d8',), 2, 8, 'Z1HC'),
+    0xff: ('RST', ('38H',), 1, 16, '----'),
+}
+
+# 0x40-0x7F LD r, r' (0x76, which would be LD (HL), (HL), is HALT)
+for i, dst in enumerate(R8):
+    for j, src in enumerate(R8):
+        cycles = 8 if '(HL)' in (dst, src) else 4
+        BASE[0x40 | i << 3 | j] = ('LD', (dst, src), 1, cycles, '----')
+BASE[0x76] = ('HALT', (), 1, 4, '----')
+
+# 0x80-0xBF 8-bit ALU on registers
+ALU = (
+    ('ADD', True, 'Z0HC'),
+    ('ADC', True, 'Z0HC'),
+    ('SUB', False, 'Z1HC'),
+    ('SBC', True, 'Z1HC'),
+    ('AND', False, 'Z010'),
+    ('XOR', False, 'Z000'),
+    ('OR', False, 'Z000'),
+    ('CP', False, 'Z1HC'),
+)
+for i, (mnemonic, explicit_a, flags) in enumerate(ALU):
+    for j, src in enumerate(R8):
+        operands = ('A', src) if explicit_a else (src,)
+        BASE[0x80 | i << 3 | j] = (mnemonic, operands, 1, 8 if src == '(HL)' else 4, flags)
+
+CB = {}
+
+# 0xCB00-0xCB3F rotates and shifts
+SHIFTS = (
+    ('RLC', 'Z00C'),
+    ('RRC', 'Z00C'),
+    ('RL', 'Z00C'),
+    ('RR', 'Z00C'),
+    ('SLA', 'Z00C'),
+    ('SRA', 'Z00C'),
+    ('SWAP', 'Z000'),
+    ('SRL', 'Z00C'),
+)
+for i, (mnemonic, flags) in enumerate(SHIFTS):
+    for j, r in enumerate(R8):
+        CB[i << 3 | j] = (mnemonic, (r,), 2, 16 if r == '(HL)' else 8, flags)
+
+# 0xCB40-0xCBFF bit operations
+for i, (mnemonic, hl_cycles, flags) in enumerate((
+        ('BIT', 12, 'Z01-'),
+        ('RES', 16, '----'),
+        ('SET', 16, '----'))):
+    for bit in range(8):
+        for j, r in enumerate(R8):
+            cycles = hl_cycles if r == '(HL)' else 8
+            CB[0x40 + i * 0x40 | bit << 3 | j] = (mnemonic, (str(bit), r), 2, cycles, flags)
+
+# Handler names that predate the generator
+ALIASES = {
+    'ld_bc_a': 0x02,
+    'ld_a16_sp': 0x08,
+}
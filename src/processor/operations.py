@@ -1,158 +1,3869 @@
+# Generated by processor.generate from processor.opcode_spec - do not edit.
+# Regenerate with: python -m processor.generate
+
 from .cpu import CPU
+from .flags import (ADC, ADD, AND, DAA, DEC, INC, OR, RL, RLC, RR, RRC, SBC,
+                    SLA, SRA, SRL, SUB, SWAP, XOR)
 
 # 0x00 NOP
-def nop(cpu: CPU):                   
-    cpu.PC += 1
+def nop(cpu: CPU, mem: list[int] = None):
+    cpu._pc = (cpu._pc + 1) & 0xffff
     return 4
 
 # 0x01 LD BC, d16
 def ld_bc_d16(cpu: CPU, mem: list[int]):
-    cpu.B = mem[cpu.PC+2]
-    cpu.C = mem[cpu.PC+1]
-    cpu.PC += 3
+    pc = cpu._pc
+    cpu._b = mem[(pc+2) & 0xffff]
+    cpu._c = mem[(pc+1) & 0xffff]
+    cpu._pc = (pc + 3) & 0xffff
     return 12
 
 # 0x02 LD (BC), A
-def ld_bc_a(cpu: CPU, mem: list[int]):
-    mem[cpu.BC] = cpu.A
-    cpu.PC += 1
+def ld_abc_a(cpu: CPU, mem: list[int] = None):
+    cpu.write8((cpu._b << 8) | cpu._c, cpu._a)
+    cpu._pc = (cpu._pc + 1) & 0xffff
     return 8
 
 # 0x03 INC BC
-def inc_bc(cpu: CPU):
-    cpu.BC += 1
-    cpu.PC += 1
+def inc_bc(cpu: CPU, mem: list[int] = None):
+    bc = (((cpu._b << 8) | cpu._c) + 1) & 0xffff
+    cpu._b = bc >> 8
+    cpu._c = bc & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
     return 8
 
 # 0x04 INC B
-def inc_b(cpu: CPU):
-    cpu.F_Z = cpu.B+1 & 0xff == 0
-    cpu.F_N = 0
-    cpu.F_H = (cpu.B & 0x0f) + 1 > 0x0f
-    cpu.B += 1
-    cpu.PC += 1
+def inc_b(cpu: CPU, mem: list[int] = None):
+    t = INC[cpu._b]
+    cpu._f = (t & 0xff) | (cpu._f & 0x10)
+    cpu._b = t >> 8
+    cpu._pc = (cpu._pc + 1) & 0xffff
     return 4
 
 # 0x05 DEC B
-def dec_b(cpu: CPU):
-    cpu.F_Z = cpu.B-1 & 0xff == 0
-    cpu.F_N = 1
-    cpu.F_H = (cpu.B & 0x0f) - 1 > 0xff
-    cpu.B -= 1
-    cpu.PC += 1
+def dec_b(cpu: CPU, mem: list[int] = None):
+    t = DEC[cpu._b]
+    cpu._f = (t & 0xff) | (cpu._f & 0x10)
+    cpu._b = t >> 8
+    cpu._pc = (cpu._pc + 1) & 0xffff
     return 4
 
 # 0x06 LD B, d8
 def ld_b_d8(cpu: CPU, mem: list[int]):
-    cpu.B = mem[cpu.PC+1]
-    cpu.PC += 2
+    pc = cpu._pc
+    cpu._b = mem[(pc+1) & 0xffff]
+    cpu._pc = (pc + 2) & 0xffff
     return 8
 
 # 0x07 RLCA
-def rlca(cpu: CPU):
-    cpu.F_Z = 0
-    cpu.F_N = 0
-    cpu.F_H = 0
-    cpu.F_C = ((cpu.A << 1) & 256) >> 8
-    cpu.A = ((cpu.A << 1) & 255) | cpu.F_C
-    cpu.PC += 1
-    return 4
-
-# 0x08 LD a16, SP
-def ld_a16_sp(cpu: CPU, mem: list[int]):
-    m_address = (mem[cpu.PC+2] << 8) | mem[cpu.PC+1]
-    mem[m_address] = cpu.SP & 255
-    mem[m_address+1] = (cpu.SP >> 8) & 255
-    cpu.PC += 3
+def rlca(cpu: CPU, mem: list[int] = None):
+    t = RLC[cpu._a]
+    cpu._a = t >> 8
+    cpu._f = t & 0x10
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x08 LD (a16), SP
+def ld_aa16_sp(cpu: CPU, mem: list[int]):
+    pc = cpu._pc
+    cpu.write16((mem[(pc+2) & 0xffff] << 8) | mem[(pc+1) & 0xffff], cpu._sp)
+    cpu._pc = (pc + 3) & 0xffff
     return 20
 
 # 0x09 ADD HL, BC
-def add_hl_bc(cpu: CPU):
-    cpu.F_N = 0
-    cpu.F_H = (cpu.HL + cpu.BC) & 0x0fff > 0x0fff
-    cpu.F_C = (cpu.HL + cpu.BC) & 0xffff > 0xffff
-    cpu.HL += cpu.BC
-    cpu.PC += 1
+def add_hl_bc(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    v = (cpu._b << 8) | cpu._c
+    r = hl + v
+    cpu._f = ((hl & 0x0fff) + (v & 0x0fff) > 0x0fff) << 5 | (r > 0xffff) << 4 | (cpu._f & 0x80)
+    cpu._h = (r >> 8) & 0xff
+    cpu._l = r & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
     return 8
 
 # 0x0A LD A, (BC)
-def ld_a_abc(cpu: CPU, mem: list[int]):
-    cpu.A = mem[cpu.BC]
-    cpu.PC += 1
+def ld_a_abc(cpu: CPU, mem: list[int] = None):
+    cpu._a = cpu.read8((cpu._b << 8) | cpu._c)
+    cpu._pc = (cpu._pc + 1) & 0xffff
     return 8
 
 # 0x0B DEC BC
-def dec_bc(cpu: CPU):
-    cpu.BC -= 1
-    cpu.PC += 1
+def dec_bc(cpu: CPU, mem: list[int] = None):
+    bc = (((cpu._b << 8) | cpu._c) - 1) & 0xffff
+    cpu._b = bc >> 8
+    cpu._c = bc & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
     return 8
 
 # 0x0C INC C
-def inc_c(cpu: CPU):
-    cpu.F_Z = cpu.C+1 & 0xff == 0
-    cpu.F_N = 0
-    cpu.F_H = (cpu.C & 0x0f) + 1 > 0x0f
-    cpu.C += 1
-    cpu.PC += 1
+def inc_c(cpu: CPU, mem: list[int] = None):
+    t = INC[cpu._c]
+    cpu._f = (t & 0xff) | (cpu._f & 0x10)
+    cpu._c = t >> 8
+    cpu._pc = (cpu._pc + 1) & 0xffff
     return 4
 
 # 0x0D DEC C
-def dec_c(cpu: CPU):
-    cpu.F_Z = cpu.C-1 & 0xff == 0
-    cpu.F_N = 1
-    cpu.F_H = (cpu.C & 0x0f) - 1 > 0xff
-    cpu.C -= 1
-    cpu.PC += 1
+def dec_c(cpu: CPU, mem: list[int] = None):
+    t = DEC[cpu._c]
+    cpu._f = (t & 0xff) | (cpu._f & 0x10)
+    cpu._c = t >> 8
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x0E LD C, d8
+def ld_c_d8(cpu: CPU, mem: list[int]):
+    pc = cpu._pc
+    cpu._c = mem[(pc+1) & 0xffff]
+    cpu._pc = (pc + 2) & 0xffff
+    return 8
+
+# 0x0F RRCA
+def rrca(cpu: CPU, mem: list[int] = None):
+    t = RRC[cpu._a]
+    cpu._a = t >> 8
+    cpu._f = t & 0x10
+    cpu._pc = (cpu._pc + 1) & 0xffff
     return 4
 
 # 0x10 STOP
-def stop(cpu: CPU):
-    # TODO - Not sure I understand what this does atm
-    cpu.PC += 2
+def stop(cpu: CPU, mem: list[int] = None):
+    cpu.halted = 2
+    cpu.deadline = 0
+    cpu._pc = (cpu._pc + 2) & 0xffff
     return 4
 
 # 0x11 LD DE, d16
 def ld_de_d16(cpu: CPU, mem: list[int]):
-    cpu.D = mem[cpu.PC+2]
-    cpu.E = mem[cpu.PC+1]
-    cpu.PC += 3
+    pc = cpu._pc
+    cpu._d = mem[(pc+2) & 0xffff]
+    cpu._e = mem[(pc+1) & 0xffff]
+    cpu._pc = (pc + 3) & 0xffff
+    return 12
+
+# 0x12 LD (DE), A
+def ld_ade_a(cpu: CPU, mem: list[int] = None):
+    cpu.write8((cpu._d << 8) | cpu._e, cpu._a)
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0x13 INC DE
+def inc_de(cpu: CPU, mem: list[int] = None):
+    de = (((cpu._d << 8) | cpu._e) + 1) & 0xffff
+    cpu._d = de >> 8
+    cpu._e = de & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0x14 INC D
+def inc_d(cpu: CPU, mem: list[int] = None):
+    t = INC[cpu._d]
+    cpu._f = (t & 0xff) | (cpu._f & 0x10)
+    cpu._d = t >> 8
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x15 DEC D
+def dec_d(cpu: CPU, mem: list[int] = None):
+    t = DEC[cpu._d]
+    cpu._f = (t & 0xff) | (cpu._f & 0x10)
+    cpu._d = t >> 8
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x16 LD D, d8
+def ld_d_d8(cpu: CPU, mem: list[int]):
+    pc = cpu._pc
+    cpu._d = mem[(pc+1) & 0xffff]
+    cpu._pc = (pc + 2) & 0xffff
+    return 8
+
+# 0x17 RLA
+def rla(cpu: CPU, mem: list[int] = None):
+    t = RL[(cpu._f & 0x10) << 4 | cpu._a]
+    cpu._a = t >> 8
+    cpu._f = t & 0x10
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x18 JR r8
+def jr_r8(cpu: CPU, mem: list[int]):
+    pc = cpu._pc
+    offset = (mem[(pc+1) & 0xffff] ^ 0x80) - 0x80
+    cpu._pc = (pc + 2 + offset) & 0xffff
+    if offset < 0 and pc not in cpu.busy_loops:
+        cpu.idle_loop(pc)
     return 12
 
+# 0x19 ADD HL, DE
+def add_hl_de(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    v = (cpu._d << 8) | cpu._e
+    r = hl + v
+    cpu._f = ((hl & 0x0fff) + (v & 0x0fff) > 0x0fff) << 5 | (r > 0xffff) << 4 | (cpu._f & 0x80)
+    cpu._h = (r >> 8) & 0xff
+    cpu._l = r & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0x1A LD A, (DE)
+def ld_a_ade(cpu: CPU, mem: list[int] = None):
+    cpu._a = cpu.read8((cpu._d << 8) | cpu._e)
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0x1B DEC DE
+def dec_de(cpu: CPU, mem: list[int] = None):
+    de = (((cpu._d << 8) | cpu._e) - 1) & 0xffff
+    cpu._d = de >> 8
+    cpu._e = de & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0x1C INC E
+def inc_e(cpu: CPU, mem: list[int] = None):
+    t = INC[cpu._e]
+    cpu._f = (t & 0xff) | (cpu._f & 0x10)
+    cpu._e = t >> 8
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x1D DEC E
+def dec_e(cpu: CPU, mem: list[int] = None):
+    t = DEC[cpu._e]
+    cpu._f = (t & 0xff) | (cpu._f & 0x10)
+    cpu._e = t >> 8
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x1E LD E, d8
+def ld_e_d8(cpu: CPU, mem: list[int]):
+    pc = cpu._pc
+    cpu._e = mem[(pc+1) & 0xffff]
+    cpu._pc = (pc + 2) & 0xffff
+    return 8
+
+# 0x1F RRA
+def rra(cpu: CPU, mem: list[int] = None):
+    t = RR[(cpu._f & 0x10) << 4 | cpu._a]
+    cpu._a = t >> 8
+    cpu._f = t & 0x10
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
 # 0x20 JR NZ, r8
 def jr_nz_r8(cpu: CPU, mem: list[int]):
-    if cpu.F_Z:
-        cpu.PC += 1
+    pc = cpu._pc
+    if cpu._f & 0x80:
+        cpu._pc = (pc + 2) & 0xffff
         return 8
-
-    cpu.PC += mem[cpu.PC+1]
+    offset = (mem[(pc+1) & 0xffff] ^ 0x80) - 0x80
+    cpu._pc = (pc + 2 + offset) & 0xffff
+    if offset < 0 and pc not in cpu.busy_loops:
+        cpu.idle_loop(pc)
     return 12
 
 # 0x21 LD HL, d16
 def ld_hl_d16(cpu: CPU, mem: list[int]):
-    cpu.H = mem[cpu.PC+2]
-    cpu.L = mem[cpu.PC+1]
-    cpu.PC += 3
+    pc = cpu._pc
+    cpu._h = mem[(pc+2) & 0xffff]
+    cpu._l = mem[(pc+1) & 0xffff]
+    cpu._pc = (pc + 3) & 0xffff
     return 12
 
-# 0x30 JR NZ, r8
-def jr_nc_r8(cpu: CPU, mem: list[int]):
-    if not cpu.F_C:
-        cpu.PC += mem[cpu.PC+1]
-        return 12
-    
-    cpu.PC += 1
+# 0x22 LD (HL+), A
+def ld_ahli_a(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    cpu.write8(hl, cpu._a)
+    hl = (hl + 1) & 0xffff
+    cpu._h = hl >> 8
+    cpu._l = hl & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0x23 INC HL
+def inc_hl(cpu: CPU, mem: list[int] = None):
+    hl = (((cpu._h << 8) | cpu._l) + 1) & 0xffff
+    cpu._h = hl >> 8
+    cpu._l = hl & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0x24 INC H
+def inc_h(cpu: CPU, mem: list[int] = None):
+    t = INC[cpu._h]
+    cpu._f = (t & 0xff) | (cpu._f & 0x10)
+    cpu._h = t >> 8
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x25 DEC H
+def dec_h(cpu: CPU, mem: list[int] = None):
+    t = DEC[cpu._h]
+    cpu._f = (t & 0xff) | (cpu._f & 0x10)
+    cpu._h = t >> 8
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x26 LD H, d8
+def ld_h_d8(cpu: CPU, mem: list[int]):
+    pc = cpu._pc
+    cpu._h = mem[(pc+1) & 0xffff]
+    cpu._pc = (pc + 2) & 0xffff
+    return 8
+
+# 0x27 DAA
+def daa(cpu: CPU, mem: list[int] = None):
+    t = DAA[(cpu._f & 0x70) << 4 | cpu._a]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x28 JR Z, r8
+def jr_z_r8(cpu: CPU, mem: list[int]):
+    pc = cpu._pc
+    if not cpu._f & 0x80:
+        cpu._pc = (pc + 2) & 0xffff
+        return 8
+    offset = (mem[(pc+1) & 0xffff] ^ 0x80) - 0x80
+    cpu._pc = (pc + 2 + offset) & 0xffff
+    if offset < 0 and pc not in cpu.busy_loops:
+        cpu.idle_loop(pc)
+    return 12
+
+# 0x29 ADD HL, HL
+def add_hl_hl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    v = hl
+    r = hl + v
+    cpu._f = ((hl & 0x0fff) + (v & 0x0fff) > 0x0fff) << 5 | (r > 0xffff) << 4 | (cpu._f & 0x80)
+    cpu._h = (r >> 8) & 0xff
+    cpu._l = r & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0x2A LD A, (HL+)
+def ld_a_ahli(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    cpu._a = cpu.read8(hl)
+    hl = (hl + 1) & 0xffff
+    cpu._h = hl >> 8
+    cpu._l = hl & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0x2B DEC HL
+def dec_hl(cpu: CPU, mem: list[int] = None):
+    hl = (((cpu._h << 8) | cpu._l) - 1) & 0xffff
+    cpu._h = hl >> 8
+    cpu._l = hl & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0x2C INC L
+def inc_l(cpu: CPU, mem: list[int] = None):
+    t = INC[cpu._l]
+    cpu._f = (t & 0xff) | (cpu._f & 0x10)
+    cpu._l = t >> 8
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x2D DEC L
+def dec_l(cpu: CPU, mem: list[int] = None):
+    t = DEC[cpu._l]
+    cpu._f = (t & 0xff) | (cpu._f & 0x10)
+    cpu._l = t >> 8
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x2E LD L, d8
+def ld_l_d8(cpu: CPU, mem: list[int]):
+    pc = cpu._pc
+    cpu._l = mem[(pc+1) & 0xffff]
+    cpu._pc = (pc + 2) & 0xffff
     return 8
 
-# 0x31 LD SP,d16
+# 0x2F CPL
+def cpl(cpu: CPU, mem: list[int] = None):
+    cpu._f = 0x60 | (cpu._f & 0x90)
+    cpu._a ^= 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x30 JR NC, r8
+def jr_nc_r8(cpu: CPU, mem: list[int]):
+    pc = cpu._pc
+    if cpu._f & 0x10:
+        cpu._pc = (pc + 2) & 0xffff
+        return 8
+    offset = (mem[(pc+1) & 0xffff] ^ 0x80) - 0x80
+    cpu._pc = (pc + 2 + offset) & 0xffff
+    if offset < 0 and pc not in cpu.busy_loops:
+        cpu.idle_loop(pc)
+    return 12
+
+# 0x31 LD SP, d16
 def ld_sp_d16(cpu: CPU, mem: list[int]):
-    cpu.SP = (mem[cpu.PC+2] << 8) | mem[cpu.PC+1]
-    cpu.PC += 3
+    pc = cpu._pc
+    cpu._sp = (mem[(pc+2) & 0xffff] << 8) | mem[(pc+1) & 0xffff]
+    cpu._pc = (pc + 3) & 0xffff
+    return 12
+
+# 0x32 LD (HL-), A
+def ld_ahld_a(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    cpu.write8(hl, cpu._a)
+    hl = (hl - 1) & 0xffff
+    cpu._h = hl >> 8
+    cpu._l = hl & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0x33 INC SP
+def inc_sp(cpu: CPU, mem: list[int] = None):
+    cpu._sp = (cpu._sp + 1) & 0xffff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0x34 INC (HL)
+def inc_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    t = INC[cpu.read8(hl)]
+    cpu._f = (t & 0xff) | (cpu._f & 0x10)
+    cpu.write8(hl, t >> 8)
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 12
+
+# 0x35 DEC (HL)
+def dec_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    t = DEC[cpu.read8(hl)]
+    cpu._f = (t & 0xff) | (cpu._f & 0x10)
+    cpu.write8(hl, t >> 8)
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 12
+
+# 0x36 LD (HL), d8
+def ld_ahl_d8(cpu: CPU, mem: list[int]):
+    pc = cpu._pc
+    cpu.write8((cpu._h << 8) | cpu._l, mem[(pc+1) & 0xffff])
+    cpu._pc = (pc + 2) & 0xffff
+    return 12
+
+# 0x37 SCF
+def scf(cpu: CPU, mem: list[int] = None):
+    cpu._f = 0x10 | (cpu._f & 0x80)
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x38 JR C, r8
+def jr_c_r8(cpu: CPU, mem: list[int]):
+    pc = cpu._pc
+    if not cpu._f & 0x10:
+        cpu._pc = (pc + 2) & 0xffff
+        return 8
+    offset = (mem[(pc+1) & 0xffff] ^ 0x80) - 0x80
+    cpu._pc = (pc + 2 + offset) & 0xffff
+    if offset < 0 and pc not in cpu.busy_loops:
+        cpu.idle_loop(pc)
     return 12
 
-# 0xaf XOR A
-def xor_a(cpu: CPU):
-    cpu.A ^= cpu.A
-    if cpu.A: cpu.FZ = 0
-    else: cpu.F_Z = 1
-    cpu.PC += 1
-    return 4
\ No newline at end of file
+# 0x39 ADD HL, SP
+def add_hl_sp(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    v = cpu._sp
+    r = hl + v
+    cpu._f = ((hl & 0x0fff) + (v & 0x0fff) > 0x0fff) << 5 | (r > 0xffff) << 4 | (cpu._f & 0x80)
+    cpu._h = (r >> 8) & 0xff
+    cpu._l = r & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0x3A LD A, (HL-)
+def ld_a_ahld(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    cpu._a = cpu.read8(hl)
+    hl = (hl - 1) & 0xffff
+    cpu._h = hl >> 8
+    cpu._l = hl & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0x3B DEC SP
+def dec_sp(cpu: CPU, mem: list[int] = None):
+    cpu._sp = (cpu._sp - 1) & 0xffff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0x3C INC A
+def inc_a(cpu: CPU, mem: list[int] = None):
+    t = INC[cpu._a]
+    cpu._f = (t & 0xff) | (cpu._f & 0x10)
+    cpu._a = t >> 8
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x3D DEC A
+def dec_a(cpu: CPU, mem: list[int] = None):
+    t = DEC[cpu._a]
+    cpu._f = (t & 0xff) | (cpu._f & 0x10)
+    cpu._a = t >> 8
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x3E LD A, d8
+def ld_a_d8(cpu: CPU, mem: list[int]):
+    pc = cpu._pc
+    cpu._a = mem[(pc+1) & 0xffff]
+    cpu._pc = (pc + 2) & 0xffff
+    return 8
+
+# 0x3F CCF
+def ccf(cpu: CPU, mem: list[int] = None):
+    cpu._f = (not cpu._f & 0x10) << 4 | (cpu._f & 0x80)
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x40 LD B, B
+def ld_b_b(cpu: CPU, mem: list[int] = None):
+    cpu._b = cpu._b
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x41 LD B, C
+def ld_b_c(cpu: CPU, mem: list[int] = None):
+    cpu._b = cpu._c
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x42 LD B, D
+def ld_b_d(cpu: CPU, mem: list[int] = None):
+    cpu._b = cpu._d
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x43 LD B, E
+def ld_b_e(cpu: CPU, mem: list[int] = None):
+    cpu._b = cpu._e
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x44 LD B, H
+def ld_b_h(cpu: CPU, mem: list[int] = None):
+    cpu._b = cpu._h
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x45 LD B, L
+def ld_b_l(cpu: CPU, mem: list[int] = None):
+    cpu._b = cpu._l
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x46 LD B, (HL)
+def ld_b_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    cpu._b = cpu.read8(hl)
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0x47 LD B, A
+def ld_b_a(cpu: CPU, mem: list[int] = None):
+    cpu._b = cpu._a
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x48 LD C, B
+def ld_c_b(cpu: CPU, mem: list[int] = None):
+    cpu._c = cpu._b
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x49 LD C, C
+def ld_c_c(cpu: CPU, mem: list[int] = None):
+    cpu._c = cpu._c
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x4A LD C, D
+def ld_c_d(cpu: CPU, mem: list[int] = None):
+    cpu._c = cpu._d
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x4B LD C, E
+def ld_c_e(cpu: CPU, mem: list[int] = None):
+    cpu._c = cpu._e
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x4C LD C, H
+def ld_c_h(cpu: CPU, mem: list[int] = None):
+    cpu._c = cpu._h
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x4D LD C, L
+def ld_c_l(cpu: CPU, mem: list[int] = None):
+    cpu._c = cpu._l
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x4E LD C, (HL)
+def ld_c_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    cpu._c = cpu.read8(hl)
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0x4F LD C, A
+def ld_c_a(cpu: CPU, mem: list[int] = None):
+    cpu._c = cpu._a
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x50 LD D, B
+def ld_d_b(cpu: CPU, mem: list[int] = None):
+    cpu._d = cpu._b
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x51 LD D, C
+def ld_d_c(cpu: CPU, mem: list[int] = None):
+    cpu._d = cpu._c
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x52 LD D, D
+def ld_d_d(cpu: CPU, mem: list[int] = None):
+    cpu._d = cpu._d
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x53 LD D, E
+def ld_d_e(cpu: CPU, mem: list[int] = None):
+    cpu._d = cpu._e
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x54 LD D, H
+def ld_d_h(cpu: CPU, mem: list[int] = None):
+    cpu._d = cpu._h
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x55 LD D, L
+def ld_d_l(cpu: CPU, mem: list[int] = None):
+    cpu._d = cpu._l
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x56 LD D, (HL)
+def ld_d_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    cpu._d = cpu.read8(hl)
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0x57 LD D, A
+def ld_d_a(cpu: CPU, mem: list[int] = None):
+    cpu._d = cpu._a
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x58 LD E, B
+def ld_e_b(cpu: CPU, mem: list[int] = None):
+    cpu._e = cpu._b
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x59 LD E, C
+def ld_e_c(cpu: CPU, mem: list[int] = None):
+    cpu._e = cpu._c
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x5A LD E, D
+def ld_e_d(cpu: CPU, mem: list[int] = None):
+    cpu._e = cpu._d
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x5B LD E, E
+def ld_e_e(cpu: CPU, mem: list[int] = None):
+    cpu._e = cpu._e
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x5C LD E, H
+def ld_e_h(cpu: CPU, mem: list[int] = None):
+    cpu._e = cpu._h
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x5D LD E, L
+def ld_e_l(cpu: CPU, mem: list[int] = None):
+    cpu._e = cpu._l
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x5E LD E, (HL)
+def ld_e_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    cpu._e = cpu.read8(hl)
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0x5F LD E, A
+def ld_e_a(cpu: CPU, mem: list[int] = None):
+    cpu._e = cpu._a
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x60 LD H, B
+def ld_h_b(cpu: CPU, mem: list[int] = None):
+    cpu._h = cpu._b
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x61 LD H, C
+def ld_h_c(cpu: CPU, mem: list[int] = None):
+    cpu._h = cpu._c
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x62 LD H, D
+def ld_h_d(cpu: CPU, mem: list[int] = None):
+    cpu._h = cpu._d
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x63 LD H, E
+def ld_h_e(cpu: CPU, mem: list[int] = None):
+    cpu._h = cpu._e
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x64 LD H, H
+def ld_h_h(cpu: CPU, mem: list[int] = None):
+    cpu._h = cpu._h
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x65 LD H, L
+def ld_h_l(cpu: CPU, mem: list[int] = None):
+    cpu._h = cpu._l
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x66 LD H, (HL)
+def ld_h_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    cpu._h = cpu.read8(hl)
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0x67 LD H, A
+def ld_h_a(cpu: CPU, mem: list[int] = None):
+    cpu._h = cpu._a
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x68 LD L, B
+def ld_l_b(cpu: CPU, mem: list[int] = None):
+    cpu._l = cpu._b
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x69 LD L, C
+def ld_l_c(cpu: CPU, mem: list[int] = None):
+    cpu._l = cpu._c
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x6A LD L, D
+def ld_l_d(cpu: CPU, mem: list[int] = None):
+    cpu._l = cpu._d
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x6B LD L, E
+def ld_l_e(cpu: CPU, mem: list[int] = None):
+    cpu._l = cpu._e
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x6C LD L, H
+def ld_l_h(cpu: CPU, mem: list[int] = None):
+    cpu._l = cpu._h
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x6D LD L, L
+def ld_l_l(cpu: CPU, mem: list[int] = None):
+    cpu._l = cpu._l
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x6E LD L, (HL)
+def ld_l_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    cpu._l = cpu.read8(hl)
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0x6F LD L, A
+def ld_l_a(cpu: CPU, mem: list[int] = None):
+    cpu._l = cpu._a
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x70 LD (HL), B
+def ld_ahl_b(cpu: CPU, mem: list[int] = None):
+    cpu.write8((cpu._h << 8) | cpu._l, cpu._b)
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0x71 LD (HL), C
+def ld_ahl_c(cpu: CPU, mem: list[int] = None):
+    cpu.write8((cpu._h << 8) | cpu._l, cpu._c)
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0x72 LD (HL), D
+def ld_ahl_d(cpu: CPU, mem: list[int] = None):
+    cpu.write8((cpu._h << 8) | cpu._l, cpu._d)
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0x73 LD (HL), E
+def ld_ahl_e(cpu: CPU, mem: list[int] = None):
+    cpu.write8((cpu._h << 8) | cpu._l, cpu._e)
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0x74 LD (HL), H
+def ld_ahl_h(cpu: CPU, mem: list[int] = None):
+    cpu.write8((cpu._h << 8) | cpu._l, cpu._h)
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0x75 LD (HL), L
+def ld_ahl_l(cpu: CPU, mem: list[int] = None):
+    cpu.write8((cpu._h << 8) | cpu._l, cpu._l)
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0x76 HALT
+def halt(cpu: CPU, mem: list[int] = None):
+    cpu.halted = 1
+    cpu._irq = 1
+    cpu.deadline = 0
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x77 LD (HL), A
+def ld_ahl_a(cpu: CPU, mem: list[int] = None):
+    cpu.write8((cpu._h << 8) | cpu._l, cpu._a)
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0x78 LD A, B
+def ld_a_b(cpu: CPU, mem: list[int] = None):
+    cpu._a = cpu._b
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x79 LD A, C
+def ld_a_c(cpu: CPU, mem: list[int] = None):
+    cpu._a = cpu._c
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x7A LD A, D
+def ld_a_d(cpu: CPU, mem: list[int] = None):
+    cpu._a = cpu._d
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x7B LD A, E
+def ld_a_e(cpu: CPU, mem: list[int] = None):
+    cpu._a = cpu._e
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x7C LD A, H
+def ld_a_h(cpu: CPU, mem: list[int] = None):
+    cpu._a = cpu._h
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x7D LD A, L
+def ld_a_l(cpu: CPU, mem: list[int] = None):
+    cpu._a = cpu._l
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x7E LD A, (HL)
+def ld_a_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    cpu._a = cpu.read8(hl)
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0x7F LD A, A
+def ld_a_a(cpu: CPU, mem: list[int] = None):
+    cpu._a = cpu._a
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x80 ADD A, B
+def add_a_b(cpu: CPU, mem: list[int] = None):
+    t = ADD[cpu._a << 8 | cpu._b]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x81 ADD A, C
+def add_a_c(cpu: CPU, mem: list[int] = None):
+    t = ADD[cpu._a << 8 | cpu._c]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x82 ADD A, D
+def add_a_d(cpu: CPU, mem: list[int] = None):
+    t = ADD[cpu._a << 8 | cpu._d]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x83 ADD A, E
+def add_a_e(cpu: CPU, mem: list[int] = None):
+    t = ADD[cpu._a << 8 | cpu._e]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x84 ADD A, H
+def add_a_h(cpu: CPU, mem: list[int] = None):
+    t = ADD[cpu._a << 8 | cpu._h]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x85 ADD A, L
+def add_a_l(cpu: CPU, mem: list[int] = None):
+    t = ADD[cpu._a << 8 | cpu._l]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x86 ADD A, (HL)
+def add_a_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    t = ADD[cpu._a << 8 | cpu.read8(hl)]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0x87 ADD A, A
+def add_a_a(cpu: CPU, mem: list[int] = None):
+    t = ADD[cpu._a << 8 | cpu._a]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x88 ADC A, B
+def adc_a_b(cpu: CPU, mem: list[int] = None):
+    t = ADC[(cpu._f & 0x10) << 12 | cpu._a << 8 | cpu._b]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x89 ADC A, C
+def adc_a_c(cpu: CPU, mem: list[int] = None):
+    t = ADC[(cpu._f & 0x10) << 12 | cpu._a << 8 | cpu._c]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x8A ADC A, D
+def adc_a_d(cpu: CPU, mem: list[int] = None):
+    t = ADC[(cpu._f & 0x10) << 12 | cpu._a << 8 | cpu._d]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x8B ADC A, E
+def adc_a_e(cpu: CPU, mem: list[int] = None):
+    t = ADC[(cpu._f & 0x10) << 12 | cpu._a << 8 | cpu._e]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x8C ADC A, H
+def adc_a_h(cpu: CPU, mem: list[int] = None):
+    t = ADC[(cpu._f & 0x10) << 12 | cpu._a << 8 | cpu._h]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x8D ADC A, L
+def adc_a_l(cpu: CPU, mem: list[int] = None):
+    t = ADC[(cpu._f & 0x10) << 12 | cpu._a << 8 | cpu._l]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x8E ADC A, (HL)
+def adc_a_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    t = ADC[(cpu._f & 0x10) << 12 | cpu._a << 8 | cpu.read8(hl)]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0x8F ADC A, A
+def adc_a_a(cpu: CPU, mem: list[int] = None):
+    t = ADC[(cpu._f & 0x10) << 12 | cpu._a << 8 | cpu._a]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x90 SUB B
+def sub_b(cpu: CPU, mem: list[int] = None):
+    t = SUB[cpu._a << 8 | cpu._b]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x91 SUB C
+def sub_c(cpu: CPU, mem: list[int] = None):
+    t = SUB[cpu._a << 8 | cpu._c]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x92 SUB D
+def sub_d(cpu: CPU, mem: list[int] = None):
+    t = SUB[cpu._a << 8 | cpu._d]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x93 SUB E
+def sub_e(cpu: CPU, mem: list[int] = None):
+    t = SUB[cpu._a << 8 | cpu._e]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x94 SUB H
+def sub_h(cpu: CPU, mem: list[int] = None):
+    t = SUB[cpu._a << 8 | cpu._h]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x95 SUB L
+def sub_l(cpu: CPU, mem: list[int] = None):
+    t = SUB[cpu._a << 8 | cpu._l]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x96 SUB (HL)
+def sub_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    t = SUB[cpu._a << 8 | cpu.read8(hl)]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0x97 SUB A
+def sub_a(cpu: CPU, mem: list[int] = None):
+    t = SUB[cpu._a << 8 | cpu._a]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x98 SBC A, B
+def sbc_a_b(cpu: CPU, mem: list[int] = None):
+    t = SBC[(cpu._f & 0x10) << 12 | cpu._a << 8 | cpu._b]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x99 SBC A, C
+def sbc_a_c(cpu: CPU, mem: list[int] = None):
+    t = SBC[(cpu._f & 0x10) << 12 | cpu._a << 8 | cpu._c]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x9A SBC A, D
+def sbc_a_d(cpu: CPU, mem: list[int] = None):
+    t = SBC[(cpu._f & 0x10) << 12 | cpu._a << 8 | cpu._d]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x9B SBC A, E
+def sbc_a_e(cpu: CPU, mem: list[int] = None):
+    t = SBC[(cpu._f & 0x10) << 12 | cpu._a << 8 | cpu._e]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x9C SBC A, H
+def sbc_a_h(cpu: CPU, mem: list[int] = None):
+    t = SBC[(cpu._f & 0x10) << 12 | cpu._a << 8 | cpu._h]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x9D SBC A, L
+def sbc_a_l(cpu: CPU, mem: list[int] = None):
+    t = SBC[(cpu._f & 0x10) << 12 | cpu._a << 8 | cpu._l]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0x9E SBC A, (HL)
+def sbc_a_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    t = SBC[(cpu._f & 0x10) << 12 | cpu._a << 8 | cpu.read8(hl)]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0x9F SBC A, A
+def sbc_a_a(cpu: CPU, mem: list[int] = None):
+    t = SBC[(cpu._f & 0x10) << 12 | cpu._a << 8 | cpu._a]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0xA0 AND B
+def and_b(cpu: CPU, mem: list[int] = None):
+    t = AND[cpu._a << 8 | cpu._b]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0xA1 AND C
+def and_c(cpu: CPU, mem: list[int] = None):
+    t = AND[cpu._a << 8 | cpu._c]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0xA2 AND D
+def and_d(cpu: CPU, mem: list[int] = None):
+    t = AND[cpu._a << 8 | cpu._d]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0xA3 AND E
+def and_e(cpu: CPU, mem: list[int] = None):
+    t = AND[cpu._a << 8 | cpu._e]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0xA4 AND H
+def and_h(cpu: CPU, mem: list[int] = None):
+    t = AND[cpu._a << 8 | cpu._h]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0xA5 AND L
+def and_l(cpu: CPU, mem: list[int] = None):
+    t = AND[cpu._a << 8 | cpu._l]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0xA6 AND (HL)
+def and_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    t = AND[cpu._a << 8 | cpu.read8(hl)]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0xA7 AND A
+def and_a(cpu: CPU, mem: list[int] = None):
+    t = AND[cpu._a << 8 | cpu._a]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0xA8 XOR B
+def xor_b(cpu: CPU, mem: list[int] = None):
+    t = XOR[cpu._a << 8 | cpu._b]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0xA9 XOR C
+def xor_c(cpu: CPU, mem: list[int] = None):
+    t = XOR[cpu._a << 8 | cpu._c]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0xAA XOR D
+def xor_d(cpu: CPU, mem: list[int] = None):
+    t = XOR[cpu._a << 8 | cpu._d]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0xAB XOR E
+def xor_e(cpu: CPU, mem: list[int] = None):
+    t = XOR[cpu._a << 8 | cpu._e]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0xAC XOR H
+def xor_h(cpu: CPU, mem: list[int] = None):
+    t = XOR[cpu._a << 8 | cpu._h]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0xAD XOR L
+def xor_l(cpu: CPU, mem: list[int] = None):
+    t = XOR[cpu._a << 8 | cpu._l]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0xAE XOR (HL)
+def xor_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    t = XOR[cpu._a << 8 | cpu.read8(hl)]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0xAF XOR A
+def xor_a(cpu: CPU, mem: list[int] = None):
+    t = XOR[cpu._a << 8 | cpu._a]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0xB0 OR B
+def or_b(cpu: CPU, mem: list[int] = None):
+    t = OR[cpu._a << 8 | cpu._b]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0xB1 OR C
+def or_c(cpu: CPU, mem: list[int] = None):
+    t = OR[cpu._a << 8 | cpu._c]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0xB2 OR D
+def or_d(cpu: CPU, mem: list[int] = None):
+    t = OR[cpu._a << 8 | cpu._d]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0xB3 OR E
+def or_e(cpu: CPU, mem: list[int] = None):
+    t = OR[cpu._a << 8 | cpu._e]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0xB4 OR H
+def or_h(cpu: CPU, mem: list[int] = None):
+    t = OR[cpu._a << 8 | cpu._h]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0xB5 OR L
+def or_l(cpu: CPU, mem: list[int] = None):
+    t = OR[cpu._a << 8 | cpu._l]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0xB6 OR (HL)
+def or_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    t = OR[cpu._a << 8 | cpu.read8(hl)]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0xB7 OR A
+def or_a(cpu: CPU, mem: list[int] = None):
+    t = OR[cpu._a << 8 | cpu._a]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0xB8 CP B
+def cp_b(cpu: CPU, mem: list[int] = None):
+    cpu._f = SUB[cpu._a << 8 | cpu._b] & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0xB9 CP C
+def cp_c(cpu: CPU, mem: list[int] = None):
+    cpu._f = SUB[cpu._a << 8 | cpu._c] & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0xBA CP D
+def cp_d(cpu: CPU, mem: list[int] = None):
+    cpu._f = SUB[cpu._a << 8 | cpu._d] & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0xBB CP E
+def cp_e(cpu: CPU, mem: list[int] = None):
+    cpu._f = SUB[cpu._a << 8 | cpu._e] & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0xBC CP H
+def cp_h(cpu: CPU, mem: list[int] = None):
+    cpu._f = SUB[cpu._a << 8 | cpu._h] & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0xBD CP L
+def cp_l(cpu: CPU, mem: list[int] = None):
+    cpu._f = SUB[cpu._a << 8 | cpu._l] & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0xBE CP (HL)
+def cp_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    cpu._f = SUB[cpu._a << 8 | cpu.read8(hl)] & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0xBF CP A
+def cp_a(cpu: CPU, mem: list[int] = None):
+    cpu._f = SUB[cpu._a << 8 | cpu._a] & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0xC0 RET NZ
+def ret_nz(cpu: CPU, mem: list[int] = None):
+    pc = cpu._pc
+    if cpu._f & 0x80:
+        cpu._pc = (pc + 1) & 0xffff
+        return 8
+    sp = cpu._sp
+    cpu._pc = cpu.read16(sp)
+    cpu._sp = (sp + 2) & 0xffff
+    return 20
+
+# 0xC1 POP BC
+def pop_bc(cpu: CPU, mem: list[int] = None):
+    sp = cpu._sp
+    v = cpu.read16(sp)
+    cpu._sp = (sp + 2) & 0xffff
+    cpu._b = v >> 8
+    cpu._c = v & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 12
+
+# 0xC2 JP NZ, a16
+def jp_nz_a16(cpu: CPU, mem: list[int]):
+    pc = cpu._pc
+    if cpu._f & 0x80:
+        cpu._pc = (pc + 3) & 0xffff
+        return 12
+    cpu._pc = (mem[(pc+2) & 0xffff] << 8) | mem[(pc+1) & 0xffff]
+    return 16
+
+# 0xC3 JP a16
+def jp_a16(cpu: CPU, mem: list[int]):
+    pc = cpu._pc
+    cpu._pc = (mem[(pc+2) & 0xffff] << 8) | mem[(pc+1) & 0xffff]
+    return 16
+
+# 0xC4 CALL NZ, a16
+def call_nz_a16(cpu: CPU, mem: list[int]):
+    pc = cpu._pc
+    if cpu._f & 0x80:
+        cpu._pc = (pc + 3) & 0xffff
+        return 12
+    sp = (cpu._sp - 2) & 0xffff
+    cpu._sp = sp
+    cpu.write16(sp, (pc + 3) & 0xffff)
+    cpu._pc = (mem[(pc+2) & 0xffff] << 8) | mem[(pc+1) & 0xffff]
+    return 24
+
+# 0xC5 PUSH BC
+def push_bc(cpu: CPU, mem: list[int] = None):
+    sp = (cpu._sp - 2) & 0xffff
+    cpu._sp = sp
+    cpu.write16(sp, (cpu._b << 8) | cpu._c)
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 16
+
+# 0xC6 ADD A, d8
+def add_a_d8(cpu: CPU, mem: list[int]):
+    pc = cpu._pc
+    t = ADD[cpu._a << 8 | mem[(pc+1) & 0xffff]]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (pc + 2) & 0xffff
+    return 8
+
+# 0xC7 RST 00H
+def rst_00h(cpu: CPU, mem: list[int] = None):
+    pc = cpu._pc
+    sp = (cpu._sp - 2) & 0xffff
+    cpu._sp = sp
+    cpu.write16(sp, (pc + 1) & 0xffff)
+    cpu._pc = 0x0000
+    return 16
+
+# 0xC8 RET Z
+def ret_z(cpu: CPU, mem: list[int] = None):
+    pc = cpu._pc
+    if not cpu._f & 0x80:
+        cpu._pc = (pc + 1) & 0xffff
+        return 8
+    sp = cpu._sp
+    cpu._pc = cpu.read16(sp)
+    cpu._sp = (sp + 2) & 0xffff
+    return 20
+
+# 0xC9 RET
+def ret(cpu: CPU, mem: list[int] = None):
+    sp = cpu._sp
+    cpu._pc = cpu.read16(sp)
+    cpu._sp = (sp + 2) & 0xffff
+    return 16
+
+# 0xCA JP Z, a16
+def jp_z_a16(cpu: CPU, mem: list[int]):
+    pc = cpu._pc
+    if not cpu._f & 0x80:
+        cpu._pc = (pc + 3) & 0xffff
+        return 12
+    cpu._pc = (mem[(pc+2) & 0xffff] << 8) | mem[(pc+1) & 0xffff]
+    return 16
+
+# 0xCC CALL Z, a16
+def call_z_a16(cpu: CPU, mem: list[int]):
+    pc = cpu._pc
+    if not cpu._f & 0x80:
+        cpu._pc = (pc + 3) & 0xffff
+        return 12
+    sp = (cpu._sp - 2) & 0xffff
+    cpu._sp = sp
+    cpu.write16(sp, (pc + 3) & 0xffff)
+    cpu._pc = (mem[(pc+2) & 0xffff] << 8) | mem[(pc+1) & 0xffff]
+    return 24
+
+# 0xCD CALL a16
+def call_a16(cpu: CPU, mem: list[int]):
+    pc = cpu._pc
+    sp = (cpu._sp - 2) & 0xffff
+    cpu._sp = sp
+    cpu.write16(sp, (pc + 3) & 0xffff)
+    cpu._pc = (mem[(pc+2) & 0xffff] << 8) | mem[(pc+1) & 0xffff]
+    return 24
+
+# 0xCE ADC A, d8
+def adc_a_d8(cpu: CPU, mem: list[int]):
+    pc = cpu._pc
+    t = ADC[(cpu._f & 0x10) << 12 | cpu._a << 8 | mem[(pc+1) & 0xffff]]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (pc + 2) & 0xffff
+    return 8
+
+# 0xCF RST 08H
+def rst_08h(cpu: CPU, mem: list[int] = None):
+    pc = cpu._pc
+    sp = (cpu._sp - 2) & 0xffff
+    cpu._sp = sp
+    cpu.write16(sp, (pc + 1) & 0xffff)
+    cpu._pc = 0x0008
+    return 16
+
+# 0xD0 RET NC
+def ret_nc(cpu: CPU, mem: list[int] = None):
+    pc = cpu._pc
+    if cpu._f & 0x10:
+        cpu._pc = (pc + 1) & 0xffff
+        return 8
+    sp = cpu._sp
+    cpu._pc = cpu.read16(sp)
+    cpu._sp = (sp + 2) & 0xffff
+    return 20
+
+# 0xD1 POP DE
+def pop_de(cpu: CPU, mem: list[int] = None):
+    sp = cpu._sp
+    v = cpu.read16(sp)
+    cpu._sp = (sp + 2) & 0xffff
+    cpu._d = v >> 8
+    cpu._e = v & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 12
+
+# 0xD2 JP NC, a16
+def jp_nc_a16(cpu: CPU, mem: list[int]):
+    pc = cpu._pc
+    if cpu._f & 0x10:
+        cpu._pc = (pc + 3) & 0xffff
+        return 12
+    cpu._pc = (mem[(pc+2) & 0xffff] << 8) | mem[(pc+1) & 0xffff]
+    return 16
+
+# 0xD4 CALL NC, a16
+def call_nc_a16(cpu: CPU, mem: list[int]):
+    pc = cpu._pc
+    if cpu._f & 0x10:
+        cpu._pc = (pc + 3) & 0xffff
+        return 12
+    sp = (cpu._sp - 2) & 0xffff
+    cpu._sp = sp
+    cpu.write16(sp, (pc + 3) & 0xffff)
+    cpu._pc = (mem[(pc+2) & 0xffff] << 8) | mem[(pc+1) & 0xffff]
+    return 24
+
+# 0xD5 PUSH DE
+def push_de(cpu: CPU, mem: list[int] = None):
+    sp = (cpu._sp - 2) & 0xffff
+    cpu._sp = sp
+    cpu.write16(sp, (cpu._d << 8) | cpu._e)
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 16
+
+# 0xD6 SUB d8
+def sub_d8(cpu: CPU, mem: list[int]):
+    pc = cpu._pc
+    t = SUB[cpu._a << 8 | mem[(pc+1) & 0xffff]]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (pc + 2) & 0xffff
+    return 8
+
+# 0xD7 RST 10H
+def rst_10h(cpu: CPU, mem: list[int] = None):
+    pc = cpu._pc
+    sp = (cpu._sp - 2) & 0xffff
+    cpu._sp = sp
+    cpu.write16(sp, (pc + 1) & 0xffff)
+    cpu._pc = 0x0010
+    return 16
+
+# 0xD8 RET C
+def ret_c(cpu: CPU, mem: list[int] = None):
+    pc = cpu._pc
+    if not cpu._f & 0x10:
+        cpu._pc = (pc + 1) & 0xffff
+        return 8
+    sp = cpu._sp
+    cpu._pc = cpu.read16(sp)
+    cpu._sp = (sp + 2) & 0xffff
+    return 20
+
+# 0xD9 RETI
+def reti(cpu: CPU, mem: list[int] = None):
+    sp = cpu._sp
+    cpu._pc = cpu.read16(sp)
+    cpu._sp = (sp + 2) & 0xffff
+    cpu.ime = 1
+    cpu._irq = 1
+    cpu.deadline = 0
+    return 16
+
+# 0xDA JP C, a16
+def jp_c_a16(cpu: CPU, mem: list[int]):
+    pc = cpu._pc
+    if not cpu._f & 0x10:
+        cpu._pc = (pc + 3) & 0xffff
+        return 12
+    cpu._pc = (mem[(pc+2) & 0xffff] << 8) | mem[(pc+1) & 0xffff]
+    return 16
+
+# 0xDC CALL C, a16
+def call_c_a16(cpu: CPU, mem: list[int]):
+    pc = cpu._pc
+    if not cpu._f & 0x10:
+        cpu._pc = (pc + 3) & 0xffff
+        return 12
+    sp = (cpu._sp - 2) & 0xffff
+    cpu._sp = sp
+    cpu.write16(sp, (pc + 3) & 0xffff)
+    cpu._pc = (mem[(pc+2) & 0xffff] << 8) | mem[(pc+1) & 0xffff]
+    return 24
+
+# 0xDE SBC A, d8
+def sbc_a_d8(cpu: CPU, mem: list[int]):
+    pc = cpu._pc
+    t = SBC[(cpu._f & 0x10) << 12 | cpu._a << 8 | mem[(pc+1) & 0xffff]]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (pc + 2) & 0xffff
+    return 8
+
+# 0xDF RST 18H
+def rst_18h(cpu: CPU, mem: list[int] = None):
+    pc = cpu._pc
+    sp = (cpu._sp - 2) & 0xffff
+    cpu._sp = sp
+    cpu.write16(sp, (pc + 1) & 0xffff)
+    cpu._pc = 0x0018
+    return 16
+
+# 0xE0 LDH (a8), A
+def ldh_aa8_a(cpu: CPU, mem: list[int]):
+    pc = cpu._pc
+    cpu.write8(0xff00 | mem[(pc+1) & 0xffff], cpu._a)
+    cpu._pc = (pc + 2) & 0xffff
+    return 12
+
+# 0xE1 POP HL
+def pop_hl(cpu: CPU, mem: list[int] = None):
+    sp = cpu._sp
+    v = cpu.read16(sp)
+    cpu._sp = (sp + 2) & 0xffff
+    cpu._h = v >> 8
+    cpu._l = v & 0xff
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 12
+
+# 0xE2 LD (C), A
+def ld_ac_a(cpu: CPU, mem: list[int] = None):
+    cpu.write8(0xff00 | cpu._c, cpu._a)
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0xE5 PUSH HL
+def push_hl(cpu: CPU, mem: list[int] = None):
+    sp = (cpu._sp - 2) & 0xffff
+    cpu._sp = sp
+    cpu.write16(sp, (cpu._h << 8) | cpu._l)
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 16
+
+# 0xE6 AND d8
+def and_d8(cpu: CPU, mem: list[int]):
+    pc = cpu._pc
+    t = AND[cpu._a << 8 | mem[(pc+1) & 0xffff]]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (pc + 2) & 0xffff
+    return 8
+
+# 0xE7 RST 20H
+def rst_20h(cpu: CPU, mem: list[int] = None):
+    pc = cpu._pc
+    sp = (cpu._sp - 2) & 0xffff
+    cpu._sp = sp
+    cpu.write16(sp, (pc + 1) & 0xffff)
+    cpu._pc = 0x0020
+    return 16
+
+# 0xE8 ADD SP, r8
+def add_sp_r8(cpu: CPU, mem: list[int]):
+    pc = cpu._pc
+    sp = cpu._sp
+    v = mem[(pc+1) & 0xffff]
+    r = (sp + ((v ^ 0x80) - 0x80)) & 0xffff
+    cpu._f = ADD[(sp & 0xff) << 8 | v] & 0x30
+    cpu._sp = r
+    cpu._pc = (pc + 2) & 0xffff
+    return 16
+
+# 0xE9 JP HL
+def jp_hl(cpu: CPU, mem: list[int] = None):
+    cpu._pc = (cpu._h << 8) | cpu._l
+    return 4
+
+# 0xEA LD (a16), A
+def ld_aa16_a(cpu: CPU, mem: list[int]):
+    pc = cpu._pc
+    cpu.write8((mem[(pc+2) & 0xffff] << 8) | mem[(pc+1) & 0xffff], cpu._a)
+    cpu._pc = (pc + 3) & 0xffff
+    return 16
+
+# 0xEE XOR d8
+def xor_d8(cpu: CPU, mem: list[int]):
+    pc = cpu._pc
+    t = XOR[cpu._a << 8 | mem[(pc+1) & 0xffff]]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (pc + 2) & 0xffff
+    return 8
+
+# 0xEF RST 28H
+def rst_28h(cpu: CPU, mem: list[int] = None):
+    pc = cpu._pc
+    sp = (cpu._sp - 2) & 0xffff
+    cpu._sp = sp
+    cpu.write16(sp, (pc + 1) & 0xffff)
+    cpu._pc = 0x0028
+    return 16
+
+# 0xF0 LDH A, (a8)
+def ldh_a_aa8(cpu: CPU, mem: list[int]):
+    pc = cpu._pc
+    cpu._a = cpu.read8(0xff00 | mem[(pc+1) & 0xffff])
+    cpu._pc = (pc + 2) & 0xffff
+    return 12
+
+# 0xF1 POP AF
+def pop_af(cpu: CPU, mem: list[int] = None):
+    sp = cpu._sp
+    v = cpu.read16(sp)
+    cpu._sp = (sp + 2) & 0xffff
+    cpu._a = v >> 8
+    cpu._f = v & 0xf0
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 12
+
+# 0xF2 LD A, (C)
+def ld_a_ac(cpu: CPU, mem: list[int] = None):
+    cpu._a = cpu.read8(0xff00 | cpu._c)
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0xF3 DI
+def di(cpu: CPU, mem: list[int] = None):
+    cpu.ime = 0
+    cpu._ei = 0
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0xF5 PUSH AF
+def push_af(cpu: CPU, mem: list[int] = None):
+    sp = (cpu._sp - 2) & 0xffff
+    cpu._sp = sp
+    cpu.write16(sp, (cpu._a << 8) | cpu._f)
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 16
+
+# 0xF6 OR d8
+def or_d8(cpu: CPU, mem: list[int]):
+    pc = cpu._pc
+    t = OR[cpu._a << 8 | mem[(pc+1) & 0xffff]]
+    cpu._a = t >> 8
+    cpu._f = t & 0xff
+    cpu._pc = (pc + 2) & 0xffff
+    return 8
+
+# 0xF7 RST 30H
+def rst_30h(cpu: CPU, mem: list[int] = None):
+    pc = cpu._pc
+    sp = (cpu._sp - 2) & 0xffff
+    cpu._sp = sp
+    cpu.write16(sp, (pc + 1) & 0xffff)
+    cpu._pc = 0x0030
+    return 16
+
+# 0xF8 LD HL, SP+r8
+def ld_hl_sp_r8(cpu: CPU, mem: list[int]):
+    pc = cpu._pc
+    sp = cpu._sp
+    v = mem[(pc+1) & 0xffff]
+    r = (sp + ((v ^ 0x80) - 0x80)) & 0xffff
+    cpu._f = ADD[(sp & 0xff) << 8 | v] & 0x30
+    cpu._h = r >> 8
+    cpu._l = r & 0xff
+    cpu._pc = (pc + 2) & 0xffff
+    return 12
+
+# 0xF9 LD SP, HL
+def ld_sp_hl(cpu: CPU, mem: list[int] = None):
+    cpu._sp = (cpu._h << 8) | cpu._l
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 8
+
+# 0xFA LD A, (a16)
+def ld_a_aa16(cpu: CPU, mem: list[int]):
+    pc = cpu._pc
+    cpu._a = cpu.read8((mem[(pc+2) & 0xffff] << 8) | mem[(pc+1) & 0xffff])
+    cpu._pc = (pc + 3) & 0xffff
+    return 16
+
+# 0xFB EI
+def ei(cpu: CPU, mem: list[int] = None):
+    cpu._ei = 1
+    cpu.deadline = 0
+    cpu._pc = (cpu._pc + 1) & 0xffff
+    return 4
+
+# 0xFE CP d8
+def cp_d8(cpu: CPU, mem: list[int]):
+    pc = cpu._pc
+    cpu._f = SUB[cpu._a << 8 | mem[(pc+1) & 0xffff]] & 0xff
+    cpu._pc = (pc + 2) & 0xffff
+    return 8
+
+# 0xFF RST 38H
+def rst_38h(cpu: CPU, mem: list[int] = None):
+    pc = cpu._pc
+    sp = (cpu._sp - 2) & 0xffff
+    cpu._sp = sp
+    cpu.write16(sp, (pc + 1) & 0xffff)
+    cpu._pc = 0x0038
+    return 16
+
+# 0xCB 0x00 RLC B
+def rlc_b(cpu: CPU, mem: list[int] = None):
+    t = RLC[cpu._b]
+    cpu._f = t & 0xff
+    cpu._b = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x01 RLC C
+def rlc_c(cpu: CPU, mem: list[int] = None):
+    t = RLC[cpu._c]
+    cpu._f = t & 0xff
+    cpu._c = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x02 RLC D
+def rlc_d(cpu: CPU, mem: list[int] = None):
+    t = RLC[cpu._d]
+    cpu._f = t & 0xff
+    cpu._d = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x03 RLC E
+def rlc_e(cpu: CPU, mem: list[int] = None):
+    t = RLC[cpu._e]
+    cpu._f = t & 0xff
+    cpu._e = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x04 RLC H
+def rlc_h(cpu: CPU, mem: list[int] = None):
+    t = RLC[cpu._h]
+    cpu._f = t & 0xff
+    cpu._h = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x05 RLC L
+def rlc_l(cpu: CPU, mem: list[int] = None):
+    t = RLC[cpu._l]
+    cpu._f = t & 0xff
+    cpu._l = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x06 RLC (HL)
+def rlc_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    t = RLC[cpu.read8(hl)]
+    cpu._f = t & 0xff
+    cpu.write8(hl, t >> 8)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 16
+
+# 0xCB 0x07 RLC A
+def rlc_a(cpu: CPU, mem: list[int] = None):
+    t = RLC[cpu._a]
+    cpu._f = t & 0xff
+    cpu._a = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x08 RRC B
+def rrc_b(cpu: CPU, mem: list[int] = None):
+    t = RRC[cpu._b]
+    cpu._f = t & 0xff
+    cpu._b = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x09 RRC C
+def rrc_c(cpu: CPU, mem: list[int] = None):
+    t = RRC[cpu._c]
+    cpu._f = t & 0xff
+    cpu._c = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x0A RRC D
+def rrc_d(cpu: CPU, mem: list[int] = None):
+    t = RRC[cpu._d]
+    cpu._f = t & 0xff
+    cpu._d = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x0B RRC E
+def rrc_e(cpu: CPU, mem: list[int] = None):
+    t = RRC[cpu._e]
+    cpu._f = t & 0xff
+    cpu._e = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x0C RRC H
+def rrc_h(cpu: CPU, mem: list[int] = None):
+    t = RRC[cpu._h]
+    cpu._f = t & 0xff
+    cpu._h = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x0D RRC L
+def rrc_l(cpu: CPU, mem: list[int] = None):
+    t = RRC[cpu._l]
+    cpu._f = t & 0xff
+    cpu._l = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x0E RRC (HL)
+def rrc_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    t = RRC[cpu.read8(hl)]
+    cpu._f = t & 0xff
+    cpu.write8(hl, t >> 8)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 16
+
+# 0xCB 0x0F RRC A
+def rrc_a(cpu: CPU, mem: list[int] = None):
+    t = RRC[cpu._a]
+    cpu._f = t & 0xff
+    cpu._a = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x10 RL B
+def rl_b(cpu: CPU, mem: list[int] = None):
+    t = RL[(cpu._f & 0x10) << 4 | cpu._b]
+    cpu._f = t & 0xff
+    cpu._b = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x11 RL C
+def rl_c(cpu: CPU, mem: list[int] = None):
+    t = RL[(cpu._f & 0x10) << 4 | cpu._c]
+    cpu._f = t & 0xff
+    cpu._c = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x12 RL D
+def rl_d(cpu: CPU, mem: list[int] = None):
+    t = RL[(cpu._f & 0x10) << 4 | cpu._d]
+    cpu._f = t & 0xff
+    cpu._d = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x13 RL E
+def rl_e(cpu: CPU, mem: list[int] = None):
+    t = RL[(cpu._f & 0x10) << 4 | cpu._e]
+    cpu._f = t & 0xff
+    cpu._e = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x14 RL H
+def rl_h(cpu: CPU, mem: list[int] = None):
+    t = RL[(cpu._f & 0x10) << 4 | cpu._h]
+    cpu._f = t & 0xff
+    cpu._h = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x15 RL L
+def rl_l(cpu: CPU, mem: list[int] = None):
+    t = RL[(cpu._f & 0x10) << 4 | cpu._l]
+    cpu._f = t & 0xff
+    cpu._l = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x16 RL (HL)
+def rl_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    t = RL[(cpu._f & 0x10) << 4 | cpu.read8(hl)]
+    cpu._f = t & 0xff
+    cpu.write8(hl, t >> 8)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 16
+
+# 0xCB 0x17 RL A
+def rl_a(cpu: CPU, mem: list[int] = None):
+    t = RL[(cpu._f & 0x10) << 4 | cpu._a]
+    cpu._f = t & 0xff
+    cpu._a = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x18 RR B
+def rr_b(cpu: CPU, mem: list[int] = None):
+    t = RR[(cpu._f & 0x10) << 4 | cpu._b]
+    cpu._f = t & 0xff
+    cpu._b = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x19 RR C
+def rr_c(cpu: CPU, mem: list[int] = None):
+    t = RR[(cpu._f & 0x10) << 4 | cpu._c]
+    cpu._f = t & 0xff
+    cpu._c = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x1A RR D
+def rr_d(cpu: CPU, mem: list[int] = None):
+    t = RR[(cpu._f & 0x10) << 4 | cpu._d]
+    cpu._f = t & 0xff
+    cpu._d = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x1B RR E
+def rr_e(cpu: CPU, mem: list[int] = None):
+    t = RR[(cpu._f & 0x10) << 4 | cpu._e]
+    cpu._f = t & 0xff
+    cpu._e = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x1C RR H
+def rr_h(cpu: CPU, mem: list[int] = None):
+    t = RR[(cpu._f & 0x10) << 4 | cpu._h]
+    cpu._f = t & 0xff
+    cpu._h = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x1D RR L
+def rr_l(cpu: CPU, mem: list[int] = None):
+    t = RR[(cpu._f & 0x10) << 4 | cpu._l]
+    cpu._f = t & 0xff
+    cpu._l = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x1E RR (HL)
+def rr_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    t = RR[(cpu._f & 0x10) << 4 | cpu.read8(hl)]
+    cpu._f = t & 0xff
+    cpu.write8(hl, t >> 8)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 16
+
+# 0xCB 0x1F RR A
+def rr_a(cpu: CPU, mem: list[int] = None):
+    t = RR[(cpu._f & 0x10) << 4 | cpu._a]
+    cpu._f = t & 0xff
+    cpu._a = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x20 SLA B
+def sla_b(cpu: CPU, mem: list[int] = None):
+    t = SLA[cpu._b]
+    cpu._f = t & 0xff
+    cpu._b = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x21 SLA C
+def sla_c(cpu: CPU, mem: list[int] = None):
+    t = SLA[cpu._c]
+    cpu._f = t & 0xff
+    cpu._c = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x22 SLA D
+def sla_d(cpu: CPU, mem: list[int] = None):
+    t = SLA[cpu._d]
+    cpu._f = t & 0xff
+    cpu._d = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x23 SLA E
+def sla_e(cpu: CPU, mem: list[int] = None):
+    t = SLA[cpu._e]
+    cpu._f = t & 0xff
+    cpu._e = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x24 SLA H
+def sla_h(cpu: CPU, mem: list[int] = None):
+    t = SLA[cpu._h]
+    cpu._f = t & 0xff
+    cpu._h = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x25 SLA L
+def sla_l(cpu: CPU, mem: list[int] = None):
+    t = SLA[cpu._l]
+    cpu._f = t & 0xff
+    cpu._l = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x26 SLA (HL)
+def sla_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    t = SLA[cpu.read8(hl)]
+    cpu._f = t & 0xff
+    cpu.write8(hl, t >> 8)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 16
+
+# 0xCB 0x27 SLA A
+def sla_a(cpu: CPU, mem: list[int] = None):
+    t = SLA[cpu._a]
+    cpu._f = t & 0xff
+    cpu._a = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x28 SRA B
+def sra_b(cpu: CPU, mem: list[int] = None):
+    t = SRA[cpu._b]
+    cpu._f = t & 0xff
+    cpu._b = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x29 SRA C
+def sra_c(cpu: CPU, mem: list[int] = None):
+    t = SRA[cpu._c]
+    cpu._f = t & 0xff
+    cpu._c = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x2A SRA D
+def sra_d(cpu: CPU, mem: list[int] = None):
+    t = SRA[cpu._d]
+    cpu._f = t & 0xff
+    cpu._d = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x2B SRA E
+def sra_e(cpu: CPU, mem: list[int] = None):
+    t = SRA[cpu._e]
+    cpu._f = t & 0xff
+    cpu._e = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x2C SRA H
+def sra_h(cpu: CPU, mem: list[int] = None):
+    t = SRA[cpu._h]
+    cpu._f = t & 0xff
+    cpu._h = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x2D SRA L
+def sra_l(cpu: CPU, mem: list[int] = None):
+    t = SRA[cpu._l]
+    cpu._f = t & 0xff
+    cpu._l = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x2E SRA (HL)
+def sra_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    t = SRA[cpu.read8(hl)]
+    cpu._f = t & 0xff
+    cpu.write8(hl, t >> 8)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 16
+
+# 0xCB 0x2F SRA A
+def sra_a(cpu: CPU, mem: list[int] = None):
+    t = SRA[cpu._a]
+    cpu._f = t & 0xff
+    cpu._a = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x30 SWAP B
+def swap_b(cpu: CPU, mem: list[int] = None):
+    t = SWAP[cpu._b]
+    cpu._f = t & 0xff
+    cpu._b = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x31 SWAP C
+def swap_c(cpu: CPU, mem: list[int] = None):
+    t = SWAP[cpu._c]
+    cpu._f = t & 0xff
+    cpu._c = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x32 SWAP D
+def swap_d(cpu: CPU, mem: list[int] = None):
+    t = SWAP[cpu._d]
+    cpu._f = t & 0xff
+    cpu._d = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x33 SWAP E
+def swap_e(cpu: CPU, mem: list[int] = None):
+    t = SWAP[cpu._e]
+    cpu._f = t & 0xff
+    cpu._e = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x34 SWAP H
+def swap_h(cpu: CPU, mem: list[int] = None):
+    t = SWAP[cpu._h]
+    cpu._f = t & 0xff
+    cpu._h = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x35 SWAP L
+def swap_l(cpu: CPU, mem: list[int] = None):
+    t = SWAP[cpu._l]
+    cpu._f = t & 0xff
+    cpu._l = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x36 SWAP (HL)
+def swap_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    t = SWAP[cpu.read8(hl)]
+    cpu._f = t & 0xff
+    cpu.write8(hl, t >> 8)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 16
+
+# 0xCB 0x37 SWAP A
+def swap_a(cpu: CPU, mem: list[int] = None):
+    t = SWAP[cpu._a]
+    cpu._f = t & 0xff
+    cpu._a = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x38 SRL B
+def srl_b(cpu: CPU, mem: list[int] = None):
+    t = SRL[cpu._b]
+    cpu._f = t & 0xff
+    cpu._b = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x39 SRL C
+def srl_c(cpu: CPU, mem: list[int] = None):
+    t = SRL[cpu._c]
+    cpu._f = t & 0xff
+    cpu._c = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x3A SRL D
+def srl_d(cpu: CPU, mem: list[int] = None):
+    t = SRL[cpu._d]
+    cpu._f = t & 0xff
+    cpu._d = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x3B SRL E
+def srl_e(cpu: CPU, mem: list[int] = None):
+    t = SRL[cpu._e]
+    cpu._f = t & 0xff
+    cpu._e = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x3C SRL H
+def srl_h(cpu: CPU, mem: list[int] = None):
+    t = SRL[cpu._h]
+    cpu._f = t & 0xff
+    cpu._h = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x3D SRL L
+def srl_l(cpu: CPU, mem: list[int] = None):
+    t = SRL[cpu._l]
+    cpu._f = t & 0xff
+    cpu._l = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x3E SRL (HL)
+def srl_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    t = SRL[cpu.read8(hl)]
+    cpu._f = t & 0xff
+    cpu.write8(hl, t >> 8)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 16
+
+# 0xCB 0x3F SRL A
+def srl_a(cpu: CPU, mem: list[int] = None):
+    t = SRL[cpu._a]
+    cpu._f = t & 0xff
+    cpu._a = t >> 8
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x40 BIT 0, B
+def bit_0_b(cpu: CPU, mem: list[int] = None):
+    v = cpu._b
+    cpu._f = ((v & 0x01) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x41 BIT 0, C
+def bit_0_c(cpu: CPU, mem: list[int] = None):
+    v = cpu._c
+    cpu._f = ((v & 0x01) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x42 BIT 0, D
+def bit_0_d(cpu: CPU, mem: list[int] = None):
+    v = cpu._d
+    cpu._f = ((v & 0x01) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x43 BIT 0, E
+def bit_0_e(cpu: CPU, mem: list[int] = None):
+    v = cpu._e
+    cpu._f = ((v & 0x01) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x44 BIT 0, H
+def bit_0_h(cpu: CPU, mem: list[int] = None):
+    v = cpu._h
+    cpu._f = ((v & 0x01) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x45 BIT 0, L
+def bit_0_l(cpu: CPU, mem: list[int] = None):
+    v = cpu._l
+    cpu._f = ((v & 0x01) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x46 BIT 0, (HL)
+def bit_0_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    v = cpu.read8(hl)
+    cpu._f = ((v & 0x01) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 12
+
+# 0xCB 0x47 BIT 0, A
+def bit_0_a(cpu: CPU, mem: list[int] = None):
+    v = cpu._a
+    cpu._f = ((v & 0x01) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x48 BIT 1, B
+def bit_1_b(cpu: CPU, mem: list[int] = None):
+    v = cpu._b
+    cpu._f = ((v & 0x02) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x49 BIT 1, C
+def bit_1_c(cpu: CPU, mem: list[int] = None):
+    v = cpu._c
+    cpu._f = ((v & 0x02) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x4A BIT 1, D
+def bit_1_d(cpu: CPU, mem: list[int] = None):
+    v = cpu._d
+    cpu._f = ((v & 0x02) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x4B BIT 1, E
+def bit_1_e(cpu: CPU, mem: list[int] = None):
+    v = cpu._e
+    cpu._f = ((v & 0x02) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x4C BIT 1, H
+def bit_1_h(cpu: CPU, mem: list[int] = None):
+    v = cpu._h
+    cpu._f = ((v & 0x02) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x4D BIT 1, L
+def bit_1_l(cpu: CPU, mem: list[int] = None):
+    v = cpu._l
+    cpu._f = ((v & 0x02) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x4E BIT 1, (HL)
+def bit_1_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    v = cpu.read8(hl)
+    cpu._f = ((v & 0x02) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 12
+
+# 0xCB 0x4F BIT 1, A
+def bit_1_a(cpu: CPU, mem: list[int] = None):
+    v = cpu._a
+    cpu._f = ((v & 0x02) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x50 BIT 2, B
+def bit_2_b(cpu: CPU, mem: list[int] = None):
+    v = cpu._b
+    cpu._f = ((v & 0x04) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x51 BIT 2, C
+def bit_2_c(cpu: CPU, mem: list[int] = None):
+    v = cpu._c
+    cpu._f = ((v & 0x04) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x52 BIT 2, D
+def bit_2_d(cpu: CPU, mem: list[int] = None):
+    v = cpu._d
+    cpu._f = ((v & 0x04) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x53 BIT 2, E
+def bit_2_e(cpu: CPU, mem: list[int] = None):
+    v = cpu._e
+    cpu._f = ((v & 0x04) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x54 BIT 2, H
+def bit_2_h(cpu: CPU, mem: list[int] = None):
+    v = cpu._h
+    cpu._f = ((v & 0x04) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x55 BIT 2, L
+def bit_2_l(cpu: CPU, mem: list[int] = None):
+    v = cpu._l
+    cpu._f = ((v & 0x04) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x56 BIT 2, (HL)
+def bit_2_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    v = cpu.read8(hl)
+    cpu._f = ((v & 0x04) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 12
+
+# 0xCB 0x57 BIT 2, A
+def bit_2_a(cpu: CPU, mem: list[int] = None):
+    v = cpu._a
+    cpu._f = ((v & 0x04) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x58 BIT 3, B
+def bit_3_b(cpu: CPU, mem: list[int] = None):
+    v = cpu._b
+    cpu._f = ((v & 0x08) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x59 BIT 3, C
+def bit_3_c(cpu: CPU, mem: list[int] = None):
+    v = cpu._c
+    cpu._f = ((v & 0x08) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x5A BIT 3, D
+def bit_3_d(cpu: CPU, mem: list[int] = None):
+    v = cpu._d
+    cpu._f = ((v & 0x08) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x5B BIT 3, E
+def bit_3_e(cpu: CPU, mem: list[int] = None):
+    v = cpu._e
+    cpu._f = ((v & 0x08) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x5C BIT 3, H
+def bit_3_h(cpu: CPU, mem: list[int] = None):
+    v = cpu._h
+    cpu._f = ((v & 0x08) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x5D BIT 3, L
+def bit_3_l(cpu: CPU, mem: list[int] = None):
+    v = cpu._l
+    cpu._f = ((v & 0x08) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x5E BIT 3, (HL)
+def bit_3_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    v = cpu.read8(hl)
+    cpu._f = ((v & 0x08) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 12
+
+# 0xCB 0x5F BIT 3, A
+def bit_3_a(cpu: CPU, mem: list[int] = None):
+    v = cpu._a
+    cpu._f = ((v & 0x08) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x60 BIT 4, B
+def bit_4_b(cpu: CPU, mem: list[int] = None):
+    v = cpu._b
+    cpu._f = ((v & 0x10) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x61 BIT 4, C
+def bit_4_c(cpu: CPU, mem: list[int] = None):
+    v = cpu._c
+    cpu._f = ((v & 0x10) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x62 BIT 4, D
+def bit_4_d(cpu: CPU, mem: list[int] = None):
+    v = cpu._d
+    cpu._f = ((v & 0x10) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x63 BIT 4, E
+def bit_4_e(cpu: CPU, mem: list[int] = None):
+    v = cpu._e
+    cpu._f = ((v & 0x10) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x64 BIT 4, H
+def bit_4_h(cpu: CPU, mem: list[int] = None):
+    v = cpu._h
+    cpu._f = ((v & 0x10) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x65 BIT 4, L
+def bit_4_l(cpu: CPU, mem: list[int] = None):
+    v = cpu._l
+    cpu._f = ((v & 0x10) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x66 BIT 4, (HL)
+def bit_4_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    v = cpu.read8(hl)
+    cpu._f = ((v & 0x10) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 12
+
+# 0xCB 0x67 BIT 4, A
+def bit_4_a(cpu: CPU, mem: list[int] = None):
+    v = cpu._a
+    cpu._f = ((v & 0x10) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x68 BIT 5, B
+def bit_5_b(cpu: CPU, mem: list[int] = None):
+    v = cpu._b
+    cpu._f = ((v & 0x20) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x69 BIT 5, C
+def bit_5_c(cpu: CPU, mem: list[int] = None):
+    v = cpu._c
+    cpu._f = ((v & 0x20) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x6A BIT 5, D
+def bit_5_d(cpu: CPU, mem: list[int] = None):
+    v = cpu._d
+    cpu._f = ((v & 0x20) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x6B BIT 5, E
+def bit_5_e(cpu: CPU, mem: list[int] = None):
+    v = cpu._e
+    cpu._f = ((v & 0x20) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x6C BIT 5, H
+def bit_5_h(cpu: CPU, mem: list[int] = None):
+    v = cpu._h
+    cpu._f = ((v & 0x20) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x6D BIT 5, L
+def bit_5_l(cpu: CPU, mem: list[int] = None):
+    v = cpu._l
+    cpu._f = ((v & 0x20) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x6E BIT 5, (HL)
+def bit_5_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    v = cpu.read8(hl)
+    cpu._f = ((v & 0x20) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 12
+
+# 0xCB 0x6F BIT 5, A
+def bit_5_a(cpu: CPU, mem: list[int] = None):
+    v = cpu._a
+    cpu._f = ((v & 0x20) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x70 BIT 6, B
+def bit_6_b(cpu: CPU, mem: list[int] = None):
+    v = cpu._b
+    cpu._f = ((v & 0x40) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x71 BIT 6, C
+def bit_6_c(cpu: CPU, mem: list[int] = None):
+    v = cpu._c
+    cpu._f = ((v & 0x40) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x72 BIT 6, D
+def bit_6_d(cpu: CPU, mem: list[int] = None):
+    v = cpu._d
+    cpu._f = ((v & 0x40) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x73 BIT 6, E
+def bit_6_e(cpu: CPU, mem: list[int] = None):
+    v = cpu._e
+    cpu._f = ((v & 0x40) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x74 BIT 6, H
+def bit_6_h(cpu: CPU, mem: list[int] = None):
+    v = cpu._h
+    cpu._f = ((v & 0x40) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x75 BIT 6, L
+def bit_6_l(cpu: CPU, mem: list[int] = None):
+    v = cpu._l
+    cpu._f = ((v & 0x40) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x76 BIT 6, (HL)
+def bit_6_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    v = cpu.read8(hl)
+    cpu._f = ((v & 0x40) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 12
+
+# 0xCB 0x77 BIT 6, A
+def bit_6_a(cpu: CPU, mem: list[int] = None):
+    v = cpu._a
+    cpu._f = ((v & 0x40) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x78 BIT 7, B
+def bit_7_b(cpu: CPU, mem: list[int] = None):
+    v = cpu._b
+    cpu._f = ((v & 0x80) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x79 BIT 7, C
+def bit_7_c(cpu: CPU, mem: list[int] = None):
+    v = cpu._c
+    cpu._f = ((v & 0x80) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x7A BIT 7, D
+def bit_7_d(cpu: CPU, mem: list[int] = None):
+    v = cpu._d
+    cpu._f = ((v & 0x80) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x7B BIT 7, E
+def bit_7_e(cpu: CPU, mem: list[int] = None):
+    v = cpu._e
+    cpu._f = ((v & 0x80) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x7C BIT 7, H
+def bit_7_h(cpu: CPU, mem: list[int] = None):
+    v = cpu._h
+    cpu._f = ((v & 0x80) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x7D BIT 7, L
+def bit_7_l(cpu: CPU, mem: list[int] = None):
+    v = cpu._l
+    cpu._f = ((v & 0x80) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x7E BIT 7, (HL)
+def bit_7_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    v = cpu.read8(hl)
+    cpu._f = ((v & 0x80) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 12
+
+# 0xCB 0x7F BIT 7, A
+def bit_7_a(cpu: CPU, mem: list[int] = None):
+    v = cpu._a
+    cpu._f = ((v & 0x80) == 0) << 7 | 0x20 | (cpu._f & 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x80 RES 0, B
+def res_0_b(cpu: CPU, mem: list[int] = None):
+    v = cpu._b
+    cpu._b = v & 0xfe
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x81 RES 0, C
+def res_0_c(cpu: CPU, mem: list[int] = None):
+    v = cpu._c
+    cpu._c = v & 0xfe
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x82 RES 0, D
+def res_0_d(cpu: CPU, mem: list[int] = None):
+    v = cpu._d
+    cpu._d = v & 0xfe
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x83 RES 0, E
+def res_0_e(cpu: CPU, mem: list[int] = None):
+    v = cpu._e
+    cpu._e = v & 0xfe
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x84 RES 0, H
+def res_0_h(cpu: CPU, mem: list[int] = None):
+    v = cpu._h
+    cpu._h = v & 0xfe
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x85 RES 0, L
+def res_0_l(cpu: CPU, mem: list[int] = None):
+    v = cpu._l
+    cpu._l = v & 0xfe
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x86 RES 0, (HL)
+def res_0_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    v = cpu.read8(hl)
+    cpu.write8(hl, v & 0xfe)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 16
+
+# 0xCB 0x87 RES 0, A
+def res_0_a(cpu: CPU, mem: list[int] = None):
+    v = cpu._a
+    cpu._a = v & 0xfe
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x88 RES 1, B
+def res_1_b(cpu: CPU, mem: list[int] = None):
+    v = cpu._b
+    cpu._b = v & 0xfd
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x89 RES 1, C
+def res_1_c(cpu: CPU, mem: list[int] = None):
+    v = cpu._c
+    cpu._c = v & 0xfd
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x8A RES 1, D
+def res_1_d(cpu: CPU, mem: list[int] = None):
+    v = cpu._d
+    cpu._d = v & 0xfd
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x8B RES 1, E
+def res_1_e(cpu: CPU, mem: list[int] = None):
+    v = cpu._e
+    cpu._e = v & 0xfd
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x8C RES 1, H
+def res_1_h(cpu: CPU, mem: list[int] = None):
+    v = cpu._h
+    cpu._h = v & 0xfd
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x8D RES 1, L
+def res_1_l(cpu: CPU, mem: list[int] = None):
+    v = cpu._l
+    cpu._l = v & 0xfd
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x8E RES 1, (HL)
+def res_1_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    v = cpu.read8(hl)
+    cpu.write8(hl, v & 0xfd)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 16
+
+# 0xCB 0x8F RES 1, A
+def res_1_a(cpu: CPU, mem: list[int] = None):
+    v = cpu._a
+    cpu._a = v & 0xfd
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x90 RES 2, B
+def res_2_b(cpu: CPU, mem: list[int] = None):
+    v = cpu._b
+    cpu._b = v & 0xfb
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x91 RES 2, C
+def res_2_c(cpu: CPU, mem: list[int] = None):
+    v = cpu._c
+    cpu._c = v & 0xfb
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x92 RES 2, D
+def res_2_d(cpu: CPU, mem: list[int] = None):
+    v = cpu._d
+    cpu._d = v & 0xfb
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x93 RES 2, E
+def res_2_e(cpu: CPU, mem: list[int] = None):
+    v = cpu._e
+    cpu._e = v & 0xfb
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x94 RES 2, H
+def res_2_h(cpu: CPU, mem: list[int] = None):
+    v = cpu._h
+    cpu._h = v & 0xfb
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x95 RES 2, L
+def res_2_l(cpu: CPU, mem: list[int] = None):
+    v = cpu._l
+    cpu._l = v & 0xfb
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x96 RES 2, (HL)
+def res_2_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    v = cpu.read8(hl)
+    cpu.write8(hl, v & 0xfb)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 16
+
+# 0xCB 0x97 RES 2, A
+def res_2_a(cpu: CPU, mem: list[int] = None):
+    v = cpu._a
+    cpu._a = v & 0xfb
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x98 RES 3, B
+def res_3_b(cpu: CPU, mem: list[int] = None):
+    v = cpu._b
+    cpu._b = v & 0xf7
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x99 RES 3, C
+def res_3_c(cpu: CPU, mem: list[int] = None):
+    v = cpu._c
+    cpu._c = v & 0xf7
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x9A RES 3, D
+def res_3_d(cpu: CPU, mem: list[int] = None):
+    v = cpu._d
+    cpu._d = v & 0xf7
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x9B RES 3, E
+def res_3_e(cpu: CPU, mem: list[int] = None):
+    v = cpu._e
+    cpu._e = v & 0xf7
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x9C RES 3, H
+def res_3_h(cpu: CPU, mem: list[int] = None):
+    v = cpu._h
+    cpu._h = v & 0xf7
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x9D RES 3, L
+def res_3_l(cpu: CPU, mem: list[int] = None):
+    v = cpu._l
+    cpu._l = v & 0xf7
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0x9E RES 3, (HL)
+def res_3_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    v = cpu.read8(hl)
+    cpu.write8(hl, v & 0xf7)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 16
+
+# 0xCB 0x9F RES 3, A
+def res_3_a(cpu: CPU, mem: list[int] = None):
+    v = cpu._a
+    cpu._a = v & 0xf7
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xA0 RES 4, B
+def res_4_b(cpu: CPU, mem: list[int] = None):
+    v = cpu._b
+    cpu._b = v & 0xef
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xA1 RES 4, C
+def res_4_c(cpu: CPU, mem: list[int] = None):
+    v = cpu._c
+    cpu._c = v & 0xef
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xA2 RES 4, D
+def res_4_d(cpu: CPU, mem: list[int] = None):
+    v = cpu._d
+    cpu._d = v & 0xef
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xA3 RES 4, E
+def res_4_e(cpu: CPU, mem: list[int] = None):
+    v = cpu._e
+    cpu._e = v & 0xef
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xA4 RES 4, H
+def res_4_h(cpu: CPU, mem: list[int] = None):
+    v = cpu._h
+    cpu._h = v & 0xef
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xA5 RES 4, L
+def res_4_l(cpu: CPU, mem: list[int] = None):
+    v = cpu._l
+    cpu._l = v & 0xef
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xA6 RES 4, (HL)
+def res_4_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    v = cpu.read8(hl)
+    cpu.write8(hl, v & 0xef)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 16
+
+# 0xCB 0xA7 RES 4, A
+def res_4_a(cpu: CPU, mem: list[int] = None):
+    v = cpu._a
+    cpu._a = v & 0xef
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xA8 RES 5, B
+def res_5_b(cpu: CPU, mem: list[int] = None):
+    v = cpu._b
+    cpu._b = v & 0xdf
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xA9 RES 5, C
+def res_5_c(cpu: CPU, mem: list[int] = None):
+    v = cpu._c
+    cpu._c = v & 0xdf
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xAA RES 5, D
+def res_5_d(cpu: CPU, mem: list[int] = None):
+    v = cpu._d
+    cpu._d = v & 0xdf
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xAB RES 5, E
+def res_5_e(cpu: CPU, mem: list[int] = None):
+    v = cpu._e
+    cpu._e = v & 0xdf
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xAC RES 5, H
+def res_5_h(cpu: CPU, mem: list[int] = None):
+    v = cpu._h
+    cpu._h = v & 0xdf
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xAD RES 5, L
+def res_5_l(cpu: CPU, mem: list[int] = None):
+    v = cpu._l
+    cpu._l = v & 0xdf
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xAE RES 5, (HL)
+def res_5_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    v = cpu.read8(hl)
+    cpu.write8(hl, v & 0xdf)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 16
+
+# 0xCB 0xAF RES 5, A
+def res_5_a(cpu: CPU, mem: list[int] = None):
+    v = cpu._a
+    cpu._a = v & 0xdf
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xB0 RES 6, B
+def res_6_b(cpu: CPU, mem: list[int] = None):
+    v = cpu._b
+    cpu._b = v & 0xbf
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xB1 RES 6, C
+def res_6_c(cpu: CPU, mem: list[int] = None):
+    v = cpu._c
+    cpu._c = v & 0xbf
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xB2 RES 6, D
+def res_6_d(cpu: CPU, mem: list[int] = None):
+    v = cpu._d
+    cpu._d = v & 0xbf
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xB3 RES 6, E
+def res_6_e(cpu: CPU, mem: list[int] = None):
+    v = cpu._e
+    cpu._e = v & 0xbf
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xB4 RES 6, H
+def res_6_h(cpu: CPU, mem: list[int] = None):
+    v = cpu._h
+    cpu._h = v & 0xbf
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xB5 RES 6, L
+def res_6_l(cpu: CPU, mem: list[int] = None):
+    v = cpu._l
+    cpu._l = v & 0xbf
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xB6 RES 6, (HL)
+def res_6_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    v = cpu.read8(hl)
+    cpu.write8(hl, v & 0xbf)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 16
+
+# 0xCB 0xB7 RES 6, A
+def res_6_a(cpu: CPU, mem: list[int] = None):
+    v = cpu._a
+    cpu._a = v & 0xbf
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xB8 RES 7, B
+def res_7_b(cpu: CPU, mem: list[int] = None):
+    v = cpu._b
+    cpu._b = v & 0x7f
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xB9 RES 7, C
+def res_7_c(cpu: CPU, mem: list[int] = None):
+    v = cpu._c
+    cpu._c = v & 0x7f
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xBA RES 7, D
+def res_7_d(cpu: CPU, mem: list[int] = None):
+    v = cpu._d
+    cpu._d = v & 0x7f
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xBB RES 7, E
+def res_7_e(cpu: CPU, mem: list[int] = None):
+    v = cpu._e
+    cpu._e = v & 0x7f
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xBC RES 7, H
+def res_7_h(cpu: CPU, mem: list[int] = None):
+    v = cpu._h
+    cpu._h = v & 0x7f
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xBD RES 7, L
+def res_7_l(cpu: CPU, mem: list[int] = None):
+    v = cpu._l
+    cpu._l = v & 0x7f
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xBE RES 7, (HL)
+def res_7_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    v = cpu.read8(hl)
+    cpu.write8(hl, v & 0x7f)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 16
+
+# 0xCB 0xBF RES 7, A
+def res_7_a(cpu: CPU, mem: list[int] = None):
+    v = cpu._a
+    cpu._a = v & 0x7f
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xC0 SET 0, B
+def set_0_b(cpu: CPU, mem: list[int] = None):
+    v = cpu._b
+    cpu._b = v | 0x01
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xC1 SET 0, C
+def set_0_c(cpu: CPU, mem: list[int] = None):
+    v = cpu._c
+    cpu._c = v | 0x01
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xC2 SET 0, D
+def set_0_d(cpu: CPU, mem: list[int] = None):
+    v = cpu._d
+    cpu._d = v | 0x01
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xC3 SET 0, E
+def set_0_e(cpu: CPU, mem: list[int] = None):
+    v = cpu._e
+    cpu._e = v | 0x01
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xC4 SET 0, H
+def set_0_h(cpu: CPU, mem: list[int] = None):
+    v = cpu._h
+    cpu._h = v | 0x01
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xC5 SET 0, L
+def set_0_l(cpu: CPU, mem: list[int] = None):
+    v = cpu._l
+    cpu._l = v | 0x01
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xC6 SET 0, (HL)
+def set_0_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    v = cpu.read8(hl)
+    cpu.write8(hl, v | 0x01)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 16
+
+# 0xCB 0xC7 SET 0, A
+def set_0_a(cpu: CPU, mem: list[int] = None):
+    v = cpu._a
+    cpu._a = v | 0x01
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xC8 SET 1, B
+def set_1_b(cpu: CPU, mem: list[int] = None):
+    v = cpu._b
+    cpu._b = v | 0x02
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xC9 SET 1, C
+def set_1_c(cpu: CPU, mem: list[int] = None):
+    v = cpu._c
+    cpu._c = v | 0x02
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xCA SET 1, D
+def set_1_d(cpu: CPU, mem: list[int] = None):
+    v = cpu._d
+    cpu._d = v | 0x02
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xCB SET 1, E
+def set_1_e(cpu: CPU, mem: list[int] = None):
+    v = cpu._e
+    cpu._e = v | 0x02
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xCC SET 1, H
+def set_1_h(cpu: CPU, mem: list[int] = None):
+    v = cpu._h
+    cpu._h = v | 0x02
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xCD SET 1, L
+def set_1_l(cpu: CPU, mem: list[int] = None):
+    v = cpu._l
+    cpu._l = v | 0x02
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xCE SET 1, (HL)
+def set_1_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    v = cpu.read8(hl)
+    cpu.write8(hl, v | 0x02)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 16
+
+# 0xCB 0xCF SET 1, A
+def set_1_a(cpu: CPU, mem: list[int] = None):
+    v = cpu._a
+    cpu._a = v | 0x02
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xD0 SET 2, B
+def set_2_b(cpu: CPU, mem: list[int] = None):
+    v = cpu._b
+    cpu._b = v | 0x04
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xD1 SET 2, C
+def set_2_c(cpu: CPU, mem: list[int] = None):
+    v = cpu._c
+    cpu._c = v | 0x04
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xD2 SET 2, D
+def set_2_d(cpu: CPU, mem: list[int] = None):
+    v = cpu._d
+    cpu._d = v | 0x04
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xD3 SET 2, E
+def set_2_e(cpu: CPU, mem: list[int] = None):
+    v = cpu._e
+    cpu._e = v | 0x04
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xD4 SET 2, H
+def set_2_h(cpu: CPU, mem: list[int] = None):
+    v = cpu._h
+    cpu._h = v | 0x04
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xD5 SET 2, L
+def set_2_l(cpu: CPU, mem: list[int] = None):
+    v = cpu._l
+    cpu._l = v | 0x04
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xD6 SET 2, (HL)
+def set_2_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    v = cpu.read8(hl)
+    cpu.write8(hl, v | 0x04)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 16
+
+# 0xCB 0xD7 SET 2, A
+def set_2_a(cpu: CPU, mem: list[int] = None):
+    v = cpu._a
+    cpu._a = v | 0x04
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xD8 SET 3, B
+def set_3_b(cpu: CPU, mem: list[int] = None):
+    v = cpu._b
+    cpu._b = v | 0x08
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xD9 SET 3, C
+def set_3_c(cpu: CPU, mem: list[int] = None):
+    v = cpu._c
+    cpu._c = v | 0x08
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xDA SET 3, D
+def set_3_d(cpu: CPU, mem: list[int] = None):
+    v = cpu._d
+    cpu._d = v | 0x08
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xDB SET 3, E
+def set_3_e(cpu: CPU, mem: list[int] = None):
+    v = cpu._e
+    cpu._e = v | 0x08
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xDC SET 3, H
+def set_3_h(cpu: CPU, mem: list[int] = None):
+    v = cpu._h
+    cpu._h = v | 0x08
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xDD SET 3, L
+def set_3_l(cpu: CPU, mem: list[int] = None):
+    v = cpu._l
+    cpu._l = v | 0x08
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xDE SET 3, (HL)
+def set_3_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    v = cpu.read8(hl)
+    cpu.write8(hl, v | 0x08)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 16
+
+# 0xCB 0xDF SET 3, A
+def set_3_a(cpu: CPU, mem: list[int] = None):
+    v = cpu._a
+    cpu._a = v | 0x08
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xE0 SET 4, B
+def set_4_b(cpu: CPU, mem: list[int] = None):
+    v = cpu._b
+    cpu._b = v | 0x10
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xE1 SET 4, C
+def set_4_c(cpu: CPU, mem: list[int] = None):
+    v = cpu._c
+    cpu._c = v | 0x10
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xE2 SET 4, D
+def set_4_d(cpu: CPU, mem: list[int] = None):
+    v = cpu._d
+    cpu._d = v | 0x10
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xE3 SET 4, E
+def set_4_e(cpu: CPU, mem: list[int] = None):
+    v = cpu._e
+    cpu._e = v | 0x10
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xE4 SET 4, H
+def set_4_h(cpu: CPU, mem: list[int] = None):
+    v = cpu._h
+    cpu._h = v | 0x10
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xE5 SET 4, L
+def set_4_l(cpu: CPU, mem: list[int] = None):
+    v = cpu._l
+    cpu._l = v | 0x10
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xE6 SET 4, (HL)
+def set_4_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    v = cpu.read8(hl)
+    cpu.write8(hl, v | 0x10)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 16
+
+# 0xCB 0xE7 SET 4, A
+def set_4_a(cpu: CPU, mem: list[int] = None):
+    v = cpu._a
+    cpu._a = v | 0x10
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xE8 SET 5, B
+def set_5_b(cpu: CPU, mem: list[int] = None):
+    v = cpu._b
+    cpu._b = v | 0x20
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xE9 SET 5, C
+def set_5_c(cpu: CPU, mem: list[int] = None):
+    v = cpu._c
+    cpu._c = v | 0x20
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xEA SET 5, D
+def set_5_d(cpu: CPU, mem: list[int] = None):
+    v = cpu._d
+    cpu._d = v | 0x20
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xEB SET 5, E
+def set_5_e(cpu: CPU, mem: list[int] = None):
+    v = cpu._e
+    cpu._e = v | 0x20
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xEC SET 5, H
+def set_5_h(cpu: CPU, mem: list[int] = None):
+    v = cpu._h
+    cpu._h = v | 0x20
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xED SET 5, L
+def set_5_l(cpu: CPU, mem: list[int] = None):
+    v = cpu._l
+    cpu._l = v | 0x20
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xEE SET 5, (HL)
+def set_5_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    v = cpu.read8(hl)
+    cpu.write8(hl, v | 0x20)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 16
+
+# 0xCB 0xEF SET 5, A
+def set_5_a(cpu: CPU, mem: list[int] = None):
+    v = cpu._a
+    cpu._a = v | 0x20
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xF0 SET 6, B
+def set_6_b(cpu: CPU, mem: list[int] = None):
+    v = cpu._b
+    cpu._b = v | 0x40
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xF1 SET 6, C
+def set_6_c(cpu: CPU, mem: list[int] = None):
+    v = cpu._c
+    cpu._c = v | 0x40
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xF2 SET 6, D
+def set_6_d(cpu: CPU, mem: list[int] = None):
+    v = cpu._d
+    cpu._d = v | 0x40
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xF3 SET 6, E
+def set_6_e(cpu: CPU, mem: list[int] = None):
+    v = cpu._e
+    cpu._e = v | 0x40
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xF4 SET 6, H
+def set_6_h(cpu: CPU, mem: list[int] = None):
+    v = cpu._h
+    cpu._h = v | 0x40
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xF5 SET 6, L
+def set_6_l(cpu: CPU, mem: list[int] = None):
+    v = cpu._l
+    cpu._l = v | 0x40
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xF6 SET 6, (HL)
+def set_6_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    v = cpu.read8(hl)
+    cpu.write8(hl, v | 0x40)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 16
+
+# 0xCB 0xF7 SET 6, A
+def set_6_a(cpu: CPU, mem: list[int] = None):
+    v = cpu._a
+    cpu._a = v | 0x40
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xF8 SET 7, B
+def set_7_b(cpu: CPU, mem: list[int] = None):
+    v = cpu._b
+    cpu._b = v | 0x80
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xF9 SET 7, C
+def set_7_c(cpu: CPU, mem: list[int] = None):
+    v = cpu._c
+    cpu._c = v | 0x80
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xFA SET 7, D
+def set_7_d(cpu: CPU, mem: list[int] = None):
+    v = cpu._d
+    cpu._d = v | 0x80
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xFB SET 7, E
+def set_7_e(cpu: CPU, mem: list[int] = None):
+    v = cpu._e
+    cpu._e = v | 0x80
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xFC SET 7, H
+def set_7_h(cpu: CPU, mem: list[int] = None):
+    v = cpu._h
+    cpu._h = v | 0x80
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xFD SET 7, L
+def set_7_l(cpu: CPU, mem: list[int] = None):
+    v = cpu._l
+    cpu._l = v | 0x80
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# 0xCB 0xFE SET 7, (HL)
+def set_7_ahl(cpu: CPU, mem: list[int] = None):
+    hl = (cpu._h << 8) | cpu._l
+    v = cpu.read8(hl)
+    cpu.write8(hl, v | 0x80)
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 16
+
+# 0xCB 0xFF SET 7, A
+def set_7_a(cpu: CPU, mem: list[int] = None):
+    v = cpu._a
+    cpu._a = v | 0x80
+    cpu._pc = (cpu._pc + 2) & 0xffff
+    return 8
+
+# Handler names kept from before the generator
+ld_bc_a = ld_abc_a
+ld_a16_sp = ld_aa16_sp
+
+# Dispatch tables indexed by opcode. None marks an unused opcode, and
+# 0xCB is dispatched by op_codes.prefix_cb.
+BASE = (
+    nop, ld_bc_d16, ld_abc_a, inc_bc, inc_b, dec_b, ld_b_d8, rlca,
+    ld_aa16_sp, add_hl_bc, ld_a_abc, dec_bc, inc_c, dec_c, ld_c_d8, rrca,
+    stop, ld_de_d16, ld_ade_a, inc_de, inc_d, dec_d, ld_d_d8, rla,
+    jr_r8, add_hl_de, ld_a_ade, dec_de, inc_e, dec_e, ld_e_d8, rra,
+    jr_nz_r8, ld_hl_d16, ld_ahli_a, inc_hl, inc_h, dec_h, ld_h_d8, daa,
+    jr_z_r8, add_hl_hl, ld_a_ahli, dec_hl, inc_l, dec_l, ld_l_d8, cpl,
+    jr_nc_r8, ld_sp_d16, ld_ahld_a, inc_sp, inc_ahl, dec_ahl, ld_ahl_d8, scf,
+    jr_c_r8, add_hl_sp, ld_a_ahld, dec_sp, inc_a, dec_a, ld_a_d8, ccf,
+    ld_b_b, ld_b_c, ld_b_d, ld_b_e, ld_b_h, ld_b_l, ld_b_ahl, ld_b_a,
+    ld_c_b, ld_c_c, ld_c_d, ld_c_e, ld_c_h, ld_c_l, ld_c_ahl, ld_c_a,
+    ld_d_b, ld_d_c, ld_d_d, ld_d_e, ld_d_h, ld_d_l, ld_d_ahl, ld_d_a,
+    ld_e_b, ld_e_c, ld_e_d, ld_e_e, ld_e_h, ld_e_l, ld_e_ahl, ld_e_a,
+    ld_h_b, ld_h_c, ld_h_d, ld_h_e, ld_h_h, ld_h_l, ld_h_ahl, ld_h_a,
+    ld_l_b, ld_l_c, ld_l_d, ld_l_e, ld_l_h, ld_l_l, ld_l_ahl, ld_l_a,
+    ld_ahl_b, ld_ahl_c, ld_ahl_d, ld_ahl_e, ld_ahl_h, ld_ahl_l, halt, ld_ahl_a,
+    ld_a_b, ld_a_c, ld_a_d, ld_a_e, ld_a_h, ld_a_l, ld_a_ahl, ld_a_a,
+    add_a_b, add_a_c, add_a_d, add_a_e, add_a_h, add_a_l, add_a_ahl, add_a_a,
+    adc_a_b, adc_a_c, adc_a_d, adc_a_e, adc_a_h, adc_a_l, adc_a_ahl, adc_a_a,
+    sub_b, sub_c, sub_d, sub_e, sub_h, sub_l, sub_ahl, sub_a,
+    sbc_a_b, sbc_a_c, sbc_a_d, sbc_a_e, sbc_a_h, sbc_a_l, sbc_a_ahl, sbc_a_a,
+    and_b, and_c, and_d, and_e, and_h, and_l, and_ahl, and_a,
+    xor_b, xor_c, xor_d, xor_e, xor_h, xor_l, xor_ahl, xor_a,
+    or_b, or_c, or_d, or_e, or_h, or_l, or_ahl, or_a,
+    cp_b, cp_c, cp_d, cp_e, cp_h, cp_l, cp_ahl, cp_a,
+    ret_nz, pop_bc, jp_nz_a16, jp_a16, call_nz_a16, push_bc, add_a_d8, rst_00h,
+    ret_z, ret, jp_z_a16, None, call_z_a16, call_a16, adc_a_d8, rst_08h,
+    ret_nc, pop_de, jp_nc_a16, None, call_nc_a16, push_de, sub_d8, rst_10h,
+    ret_c, reti, jp_c_a16, None, call_c_a16, None, sbc_a_d8, rst_18h,
+    ldh_aa8_a, pop_hl, ld_ac_a, None, None, push_hl, and_d8, rst_20h,
+    add_sp_r8, jp_hl, ld_aa16_a, None, None, None, xor_d8, rst_28h,
+    ldh_a_aa8, pop_af, ld_a_ac, di, None, push_af, or_d8, rst_30h,
+    ld_hl_sp_r8, ld_sp_hl, ld_a_aa16, ei, None, None, cp_d8, rst_38h,
+)
+
+CB = (
+    rlc_b, rlc_c, rlc_d, rlc_e, rlc_h, rlc_l, rlc_ahl, rlc_a,
+    rrc_b, rrc_c, rrc_d, rrc_e, rrc_h, rrc_l, rrc_ahl, rrc_a,
+    rl_b, rl_c, rl_d, rl_e, rl_h, rl_l, rl_ahl, rl_a,
+    rr_b, rr_c, rr_d, rr_e, rr_h, rr_l, rr_ahl, rr_a,
+    sla_b, sla_c, sla_d, sla_e, sla_h, sla_l, sla_ahl, sla_a,
+    sra_b, sra_c, sra_d, sra_e, sra_h, sra_l, sra_ahl, sra_a,
+    swap_b, swap_c, swap_d, swap_e, swap_h, swap_l, swap_ahl, swap_a,
+    srl_b, srl_c, srl_d, srl_e, srl_h, srl_l, srl_ahl, srl_a,
+    bit_0_b, bit_0_c, bit_0_d, bit_0_e, bit_0_h, bit_0_l, bit_0_ahl, bit_0_a,
+    bit_1_b, bit_1_c, bit_1_d, bit_1_e, bit_1_h, bit_1_l, bit_1_ahl, bit_1_a,
+    bit_2_b, bit_2_c, bit_2_d, bit_2_e, bit_2_h, bit_2_l, bit_2_ahl, bit_2_a,
+    bit_3_b, bit_3_c, bit_3_d, bit_3_e, bit_3_h, bit_3_l, bit_3_ahl, bit_3_a,
+    bit_4_b, bit_4_c, bit_4_d, bit_4_e, bit_4_h, bit_4_l, bit_4_ahl, bit_4_a,
+    bit_5_b, bit_5_c, bit_5_d, bit_5_e, bit_5_h, bit_5_l, bit_5_ahl, bit_5_a,
+    bit_6_b, bit_6_c, bit_6_d, bit_6_e, bit_6_h, bit_6_l, bit_6_ahl, bit_6_a,
+    bit_7_b, bit_7_c, bit_7_d, bit_7_e, bit_7_h, bit_7_l, bit_7_ahl, bit_7_a,
+    res_0_b, res_0_c, res_0_d, res_0_e, res_0_h, res_0_l, res_0_ahl, res_0_a,
+    res_1_b, res_1_c, res_1_d, res_1_e, res_1_h, res_1_l, res_1_ahl, res_1_a,
+    res_2_b, res_2_c, res_2_d, res_2_e, res_2_h, res_2_l, res_2_ahl, res_2_a,
+    res_3_b, res_3_c, res_3_d, res_3_e, res_3_h, res_3_l, res_3_ahl, res_3_a,
+    res_4_b, res_4_c, res_4_d, res_4_e, res_4_h, res_4_l, res_4_ahl, res_4_a,
+    res_5_b, res_5_c, res_5_d, res_5_e, res_5_h, res_5_l, res_5_ahl, res_5_a,
+    res_6_b, res_6_c, res_6_d, res_6_e, res_6_h, res_6_l, res_6_ahl, res_6_a,
+    res_7_b, res_7_c, res_7_d, res_7_e, res_7_h, res_7_l, res_7_ahl, res_7_a,
+    set_0_b, set_0_c, set_0_d, set_0_e, set_0_h, set_0_l, set_0_ahl, set_0_a,
+    set_1_b, set_1_c, set_1_d, set_1_e, set_1_h, set_1_l, set_1_ahl, set_1_a,
+    set_2_b, set_2_c, set_2_d, set_2_e, set_2_h, set_2_l, set_2_ahl, set_2_a,
+    set_3_b, set_3_c, set_3_d, set_3_e, set_3_h, set_3_l, set_3_ahl, set_3_a,
+    set_4_b, set_4_c, set_4_d, set_4_e, set_4_h, set_4_l, set_4_ahl, set_4_a,
+    set_5_b, set_5_c, set_5_d, set_5_e, set_5_h, set_5_l, set_5_ahl, set_5_a,
+    set_6_b, set_6_c, set_6_d, set_6_e, set_6_h, set_6_l, set_6_ahl, set_6_a,
+    set_7_b, set_7_c, set_7_d, set_7_e, set_7_h, set_7_l, set_7_ahl, set_7_a,
+)
+
+# Instruction lengths in bytes
+LENGTHS = (
+    1, 3, 1, 1, 1, 1, 2, 1, 3, 1, 1, 1, 1, 1, 2, 1,
+    2, 3, 1, 1, 1, 1, 2, 1, 2, 1, 1, 1, 1, 1, 2, 1,
+    2, 3, 1, 1, 1, 1, 2, 1, 2, 1, 1, 1, 1, 1, 2, 1,
+    2, 3, 1, 1, 1, 1, 2, 1, 2, 1, 1, 1, 1, 1, 2, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1,
+    1, 1, 3, 3, 3, 1, 2, 1, 1, 1, 3, 2, 3, 3, 2, 1,
+    1, 1, 3, 1, 3, 1, 2, 1, 1, 1, 3, 1, 3, 1, 2, 1,
+    2, 1, 1, 1, 1, 1, 2, 1, 2, 1, 3, 1, 1, 1, 2, 1,
+    2, 1, 1, 1, 1, 1, 2, 1, 2, 1, 3, 1, 1, 1, 2, 1,
+)
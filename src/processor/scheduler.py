@@ -0,0 +1,84 @@
+import heapq
+
+# Cycle used for "no event pending"; compares like an int, unlike inf
+NEVER = 1 << 62
+
+class Event:
+    # A scheduled callback. seq identifies the heap entry that is current
+    # for this event; older entries left behind by cancel or reschedule are
+    # skipped when they reach the top of the heap.
+    __slots__ = ('callback', 'cycle', 'seq')
+
+    def __init__(self, callback):
+        self.callback = callback
+        self.cycle = None
+        self.seq = None
+
+    @property
+    def pending(self) -> bool:
+        return self.seq is not None
+
+class Scheduler:
+    # Timeline of hardware events keyed by absolute CPU cycle. The CPU runs
+    # uninterrupted batches of instructions up to `next`, then calls
+    # run_due(), so devices cost nothing between their deadlines.
+    #
+    # Callbacks are called as callback(cycle) with the cycle the event was
+    # due at; the CPU may have run a few cycles past it by then.
+    __slots__ = ('cpu', 'heap', 'next', '_seq')
+
+    def __init__(self, cpu=None):
+        self.cpu = cpu
+        self.heap = []
+        self.next = NEVER
+        self._seq = 0
+
+    def schedule(self, cycle: int, callback) -> Event:
+        event = Event(callback)
+        self._push(event, cycle)
+        return event
+
+    def reschedule(self, event: Event, cycle: int):
+        # Moves a pending event, or schedules it again after it fired or
+        # was cancelled
+        self._push(event, cycle)
+
+    def cancel(self, event: Event):
+        if event.seq is None:
+            return
+        event.seq = None
+        self._update_next()
+
+    def _push(self, event: Event, cycle: int):
+        self._seq += 1
+        event.cycle, event.seq = cycle, self._seq
+        heapq.heappush(self.heap, (cycle, self._seq, event))
+
+        if cycle < self.next:
+            self.next = cycle
+        else:
+            # The event may have been the earliest one before it moved
+            self._update_next()
+
+        # An event scheduled during a batch ends the batch early if needed
+        cpu = self.cpu
+        if cpu is not None and cycle < cpu.deadline:
+            cpu.deadline = cycle
+
+    def _update_next(self):
+        heap = self.heap
+        while heap and heap[0][2].seq != heap[0][1]:
+            heapq.heappop(heap)
+        self.next = heap[0][0] if heap else NEVER
+
+    def run_due(self, now: int):
+        # Fires every event due at or before now, in cycle order. Callbacks
+        # may schedule further events, including ones already due.
+        heap = self.heap
+        while heap and heap[0][0] <= now:
+            cycle, seq, event = heapq.heappop(heap)
+            if event.seq != seq:
+                continue
+            event.seq = None
+            event.callback(cycle)
+        self._update_next()
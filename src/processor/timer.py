@@ -0,0 +1,116 @@
+from processor.cpu import TIMER
+from processor.scheduler import Event
+
+# 0xFF04-0xFF07
+DIV = 0xff04
+TIMA = 0xff05
+TMA = 0xff06
+TAC = 0xff07
+
+# TIMA counts falling edges of one bit of the internal 16-bit counter that
+# DIV is the top half of. TAC bits 0-1 select it, as a shift: the period in
+# cycles is 1 << shift.
+SHIFTS = (10, 4, 6, 8)      # 4096, 262144, 65536, 16384 Hz
+
+class Timer:
+    # Nothing is ticked. The internal counter is (now - div_base), DIV is
+    # its top byte, and TIMA is the value it was last set to plus the edges
+    # counted since. The only scheduled work is the next TIMA overflow,
+    # recomputed whenever a register write changes when it will happen.
+    __slots__ = ('cpu', 'div_base', 'tima', 'counted', 'tma', 'tac', 'overflow')
+
+    def __init__(self, cpu):
+        self.cpu = cpu
+        self.div_base = cpu.cycles
+        self.tima = 0               # TIMA as of the last sync
+        self.counted = 0            # Edges counted up to the last sync
+        self.tma = 0
+        self.tac = 0
+        self.overflow = Event(self._overflow)
+
+        io = cpu.bus.io
+        io.hook(DIV, read=self.read_div, write=self.write_div)
+        io.hook(TIMA, read=self.read_tima, write=self.write_tima)
+        io.hook(TMA, read=self.read_tma, write=self.write_tma)
+        io.hook(TAC, read=self.read_tac, write=self.write_tac)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.tac & 0x04)
+
+    def _edges(self, now: int) -> int:
+        return (now - self.div_base) >> SHIFTS[self.tac & 0x03]
+
+    def _value(self, now: int) -> int:
+        # TIMA at now, folding in any overflow the event has not handled yet
+        tima = self.tima + self._edges(now) - self.counted
+        if tima > 0xff:
+            tima = self.tma + (tima - 0x100) % (0x100 - self.tma)
+        return tima
+
+    def _sync(self, now: int):
+        # Latches TIMA at now so the timer settings can change
+        if self.enabled:
+            self.tima = self._value(now)
+        self.counted = self._edges(now)
+
+    def _schedule(self):
+        scheduler = self.cpu.scheduler
+        if not self.enabled:
+            scheduler.cancel(self.overflow)
+            return
+        shift = SHIFTS[self.tac & 0x03]
+        edge = self.counted + 0x100 - self.tima
+        scheduler.reschedule(self.overflow, self.div_base + (edge << shift))
+
+    def _overflow(self, cycle: int):
+        # TIMA reloads from TMA and requests the timer interrupt
+        self.tima = self.tma
+        self.counted = self._edges(cycle)
+        self.cpu.request_interrupt(TIMER)
+        self._schedule()
+
+    def read_div(self) -> int:
+        return ((self.cpu.cycles - self.div_base) >> 8) & 0xff
+
+    def write_div(self, value: int):
+        # Any write clears the counter. If that takes the selected bit from
+        # 1 to 0 it counts as an edge, as on hardware.
+        now = self.cpu.cycles
+        self._sync(now)
+        if self.enabled and (now - self.div_base) >> (SHIFTS[self.tac & 0x03] - 1) & 1:
+            self.tima += 1
+            if self.tima > 0xff:
+                self.tima = self.tma
+                self.cpu.request_interrupt(TIMER)
+        self.div_base = now
+        self.counted = 0
+        self._schedule()
+
+    def read_tima(self) -> int:
+        if not self.enabled:
+            return self.tima
+        return self._value(self.cpu.cycles)
+
+    def write_tima(self, value: int):
+        self._sync(self.cpu.cycles)
+        self.tima = value
+        self._schedule()
+
+    def read_tma(self) -> int:
+        return self.tma
+
+    def write_tma(self, value: int):
+        # Only affects reloads, which the overflow event reads when it fires
+        self._sync(self.cpu.cycles)
+        self.tma = value
+
+    def read_tac(self) -> int:
+        return 0xf8 | self.tac
+
+    def write_tac(self, value: int):
+        now = self.cpu.cycles
+        self._sync(now)
+        self.tac = value & 0x07
+        self.counted = self._edges(now)
+        self._schedule()
@@ -0,0 +1,262 @@
+import ast
+import copy
+import inspect
+import textwrap
+
+from processor import op_codes
+from processor.bus import ReadOnly
+
+# Upper bound on instructions per block, so a block cannot run far past a
+# cycle deadline
+MAX_BLOCK_INSTRUCTIONS = 32
+
+def _is_pc(node) -> bool:
+    return (isinstance(node, ast.Attribute) and node.attr == '_pc'
+            and isinstance(node.value, ast.Name) and node.value.id == 'cpu')
+
+def _is_advance(node, aliases: set, length: int) -> bool:
+    # (cpu._pc + length) & 0xffff, or the same through a local copy of PC
+    return (isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitAnd)
+            and isinstance(node.right, ast.Constant) and node.right.value == 0xffff
+            and isinstance(node.left, ast.BinOp) and isinstance(node.left.op, ast.Add)
+            and isinstance(node.left.right, ast.Constant) and node.left.right.value == length
+            and (_is_pc(node.left.left)
+                 or isinstance(node.left.left, ast.Name) and node.left.left.id in aliases))
+
+def parse_handler(handler, length: int):
+    # Returns (statements, cycles) for a straight-line handler whose only
+    # effect on PC is to step over its own instruction, or None if it has
+    # to be called instead (branches, calls, anything unusual)
+    try:
+        source = textwrap.dedent(inspect.getsource(handler))
+    except (OSError, TypeError):
+        return None
+
+    fn = ast.parse(source).body[0]
+    if not isinstance(fn, ast.FunctionDef) or [a.arg for a in fn.args.args] != ['cpu', 'mem']:
+        return None
+
+    *body, last = fn.body
+    if not (isinstance(last, ast.Return) and isinstance(last.value, ast.Constant)
+            and type(last.value.value) is int):
+        return None
+    if not body or not isinstance(body[-1], ast.Assign) or not _is_pc(body[-1].targets[0]):
+        return None
+
+    aliases, stores = set(), 0
+    for statement in body:
+        for node in ast.walk(statement):
+            if isinstance(node, (ast.Return, ast.FunctionDef, ast.Lambda, ast.Global,
+                                 ast.Nonlocal, ast.Yield, ast.YieldFrom)):
+                return None
+            if _is_pc(node) and isinstance(node.ctx, ast.Store):
+                stores += 1
+            # Ending the batch (EI, HALT...) has to end the block too
+            if (isinstance(node, ast.Attribute) and node.attr == 'deadline'
+                    and isinstance(node.ctx, ast.Store)):
+                return None
+        if (isinstance(statement, ast.Assign) and len(statement.targets) == 1
+                and isinstance(statement.targets[0], ast.Name) and _is_pc(statement.value)):
+            aliases.add(statement.targets[0].id)
+
+    if stores != 1 or not _is_advance(body[-1].value, aliases, length):
+        return None
+
+    return body[:-1], last.value.value
+
+class _FoldPC(ast.NodeTransformer):
+    # The address of every inlined instruction is known when the block is
+    # translated, so reads of cpu._pc become constants
+    def __init__(self, pc: int):
+        self.pc = pc
+
+    def visit_Attribute(self, node):
+        if _is_pc(node) and isinstance(node.ctx, ast.Load):
+            return ast.Constant(self.pc)
+        return self.generic_visit(node)
+
+class CodeWatch:
+    # Write handler installed on pages that hold translated code. Writes go
+    # through to whatever owned the page before and then invalidate any
+    # block covering the written address, which may be the one running.
+    __slots__ = ('translator', 'previous', 'memory')
+
+    def __init__(self, translator, previous, memory):
+        self.translator = translator
+        self.previous = previous
+        self.memory = memory
+
+    def write(self, address: int, value: int):
+        if self.previous is None:
+            self.memory[address] = value
+        else:
+            self.previous.write(address, value)
+        self.translator.invalidate(address, address + 1)
+
+class Translator:
+    # Translates straight-line runs of guest instructions, up to and
+    # including the first one that cannot be inlined (a branch), into a
+    # single compiled Python function. Blocks take (cpu, mem) and return
+    # their cycles with cpu._pc left at the next block, like a handler, so a
+    # block that would be a branch alone is just its handler. Blocks are
+    # cached by PC, and by ROM bank in the switchable ROM area.
+    #
+    # Dropping a block raises stale. Every instruction in a block that
+    # writes memory is followed by a check of it, so a block that rewrites
+    # its own code returns there and the rest is translated afresh.
+    def __init__(self, cpu):
+        self.cpu = cpu
+        self.blocks = {}
+        self.ranges = {}            # Block key -> (start, end)
+        self.pages = {}             # Page -> keys of blocks touching it
+        self.watches = {}           # Page -> CodeWatch installed on it
+        self.inlined = {}           # Handler -> parse_handler() result
+        self.stale = False          # A block was dropped, maybe the running one
+        self.namespace = {'_ops': cpu.ops, '_translator': self}
+
+    def key(self, pc: int) -> int:
+        if 0x4000 <= pc < 0x8000:
+            return pc | self.cpu.bus.rom_bank << 16
+        return pc
+
+    def run(self) -> int:
+        # Runs blocks until cpu.cycles reaches cpu.deadline and returns the
+        # new cycle count. Cycles are published once per block, so devices
+        # see the time at the start of the block an access is made from.
+        cpu = self.cpu
+        mem, bus, blocks = cpu.M, cpu.bus, self.blocks
+        now = cpu.cycles
+        pc = cpu._pc
+
+        while now < cpu.deadline:
+            key = pc | bus.rom_bank << 16 if 0x4000 <= pc < 0x8000 else pc
+            block = blocks.get(key)
+            if block is None:
+                block = self.translate(pc)
+            now += block(cpu, mem)
+            pc = cpu._pc
+            cpu.cycles = now
+
+        return now
+
+    def _inline(self, handler, length: int):
+        if handler not in self.inlined:
+            self.inlined[handler] = parse_handler(handler, length)
+            if self.inlined[handler] is not None:
+                self.namespace.update(
+                    (k, v) for k, v in handler.__globals__.items() if not k.startswith('__'))
+        return self.inlined[handler]
+
+    def translate(self, start: int):
+        mem = self.cpu.M
+        limit = min(len(mem), 0x10000)
+        statements, cycles, pc = [], 0, start
+        terminal = None
+
+        for count in range(MAX_BLOCK_INSTRUCTIONS):
+            if pc >= limit:
+                break
+            opcode = mem[pc]
+            length = op_codes.LENGTHS[opcode]
+            if pc + length > limit:
+                break
+
+            handler = self.cpu.ops[opcode]
+            if opcode == 0xcb:
+                handler = self.cpu.cb_ops[mem[pc+1]]
+
+            inline = self._inline(handler, length)
+            if inline is None:
+                terminal = opcode
+                break
+
+            body, c = inline
+            fold = _FoldPC(pc)
+            statements.extend(fold.visit(copy.deepcopy(s)) for s in body)
+            cycles += c
+            pc += length
+            if any(isinstance(node, ast.Attribute) and node.attr in ('write8', 'write16')
+                   for s in body for node in ast.walk(s)):
+                statements.extend(ast.parse(
+                    'if _translator.stale:\n'
+                    '    _translator.stale = False\n'
+                    f'    cpu._pc = {pc & 0xffff:#06x}\n'
+                    f'    return {cycles}\n').body)
+        else:
+            count = MAX_BLOCK_INSTRUCTIONS
+
+        key = self.key(start)
+        if terminal is not None and count == 0:
+            # Nothing to inline ahead of the branch: no block needed
+            self.blocks[key] = self.cpu.ops[terminal]
+            self.ranges[key] = (start, pc + op_codes.LENGTHS[terminal])
+            self._watch(key, *self.ranges[key])
+            return self.blocks[key]
+
+        source = ['def block(cpu, mem):']
+        if statements:
+            source.append(textwrap.indent(ast.unparse(ast.Module(statements, [])), '    '))
+
+        # Instructions like NOP inline to no statements at all, so whether
+        # anything was decoded is told by the instruction count
+        if terminal is None and count == 0:
+            # Nothing decodable here, e.g. PC past the end of a short test
+            # memory. Defer to the interpreter for a single instruction.
+            source.append(f'    return _ops[mem[{pc:#06x}]](cpu, mem)')
+            end = pc + 1
+        elif terminal is None:
+            source.append(f'    cpu._pc = {pc & 0xffff:#06x}')
+            source.append(f'    return {cycles}')
+            end = pc
+        else:
+            source.append(f'    cpu._pc = {pc:#06x}')
+            source.append(f'    return {cycles} + _ops[{terminal:#04x}](cpu, mem)')
+            end = pc + op_codes.LENGTHS[terminal]
+
+        source = '\n'.join(source) + '\n'
+        namespace = {}
+        exec(compile(source, f'<block {start:#06x}>', 'exec'), self.namespace, namespace)
+        block = namespace['block']
+        block.source = source
+
+        self.blocks[key] = block
+        self.ranges[key] = (start, end)
+        self._watch(key, start, end)
+        return block
+
+    def _watch(self, key: int, start: int, end: int):
+        bus = self.cpu.bus
+        for page in range(start >> 8, ((end - 1) >> 8) + 1):
+            previous = bus.write_pages[page]
+            if isinstance(previous, ReadOnly):
+                continue
+            self.pages.setdefault(page, set()).add(key)
+            if page not in self.watches:
+                watch = CodeWatch(self, previous, self.cpu.M)
+                self.watches[page] = watch
+                bus.write_pages[page] = watch
+
+    def invalidate(self, start: int, end: int):
+        # Drops every block overlapping [start, end)
+        for page in range(start >> 8, ((end - 1) >> 8) + 1):
+            for key in list(self.pages.get(page, ())):
+                block_start, block_end = self.ranges[key]
+                if block_start < end and start < block_end:
+                    self._drop(key)
+
+    def flush(self):
+        for key in list(self.blocks):
+            self._drop(key)
+
+    def _drop(self, key: int):
+        start, end = self.ranges.pop(key)
+        del self.blocks[key]
+        self.stale = True
+        for page in range(start >> 8, ((end - 1) >> 8) + 1):
+            keys = self.pages.get(page)
+            if keys is None:
+                continue
+            keys.discard(key)
+            if not keys:
+                del self.pages[page]
+                self.cpu.bus.write_pages[page] = self.watches.pop(page).previous
@@ -0,0 +1,26 @@
+from processor.cpu import CPU
+
+# Shared by the tests; pyproject puts this directory on the path
+
+ENGINES = ('interpreter', 'translator')
+
+def new_cpu(program, engine='interpreter'):
+    # program at 0x0100, JR -2 idle loops at every vector and after it
+    cpu = CPU(engine=engine)
+    for vector in range(0x40, 0x68, 0x08):
+        cpu.load(vector, bytes([0x18, 0xfe]))
+    cpu.load(0x0100, bytes(program) + bytes([0x18, 0xfe]))
+    cpu.PC, cpu.SP = 0x0100, 0xfffe
+    return cpu
+
+def count_instructions(cpu):
+    # Wraps the CPU's dispatch table; the returned counter[0] goes up by one
+    # per instruction executed
+    counter = [0]
+    def counting(handler):
+        def wrapper(cpu, mem=None):
+            counter[0] += 1
+            return handler(cpu, mem)
+        return wrapper
+    cpu.ops = tuple(counting(h) for h in cpu.ops)
+    return counter
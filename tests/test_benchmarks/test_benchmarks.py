@@ -0,0 +1,74 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from benchmarks import runner, scenarios
+from processor.cpu import CYCLES_PER_FRAME
+
+class Benchmarks_Test(unittest.TestCase):
+    def test_scenarios_loop(self):
+        # Every synthetic program keeps running past a frame
+        for name in ('nop_sled', 'alu_loop', 'memory_copy', 'branch_heavy'):
+            result = runner.run_scenario(name, frames=2)
+
+            self.assertGreaterEqual(result['cycles'], 2 * CYCLES_PER_FRAME)
+            self.assertGreater(result['instructions'], 0)
+            self.assertGreater(result['emulated_mhz'], 0)
+
+    def test_instruction_count(self):
+        # One frame is a single pass over the sled (4 cycles per NOP), one
+        # JP back to the start (16 cycles) and then more NOPs
+        result = runner.run_scenario('nop_sled', frames=1)
+
+        self.assertEqual(result['instructions'], (result['cycles'] - 16) // 4 + 1)
+
+    def test_engines_agree(self):
+        interpreter = runner.run_scenario('branch_heavy', frames=1)
+        translator = runner.run_scenario('branch_heavy', frames=1, engine='translator')
+
+        self.assertAlmostEqual(interpreter['instructions'] / interpreter['cycles'],
+                               translator['instructions'] / translator['cycles'], places=3)
+
+    def test_time_opcodes(self):
+        timings = runner.time_opcodes(iterations=10, samples=2, warmup=1)
+
+        self.assertEqual(len(timings), 244 + 256)
+        self.assertEqual(len(timings['0x00']), 2)
+        self.assertIn('0x00', timings)
+        self.assertIn('0xcbff', timings)
+        self.assertEqual(runner.handler_name('0xcb37'), 'swap_a')
+
+    def test_save_load(self):
+        results = runner.run(['alu_loop'], frames=1, opcodes=False)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'results', 'run.json')
+            runner.save(results, path)
+
+            self.assertEqual(runner.load(path), json.loads(json.dumps(results)))
+
+        self.assertIn('alu_loop', runner.report(results))
+
+    def test_boot_rom_optional(self):
+        self.assertEqual(os.path.exists(scenarios.BOOT_ROM), 'boot_rom' in scenarios.available())
+
+    def test_boot_rom_hardware(self):
+        # LD A, 0x91; LDH (0x40), A
+        # loop: LDH A, (0x44); CP 0x90; JR NZ, loop; INC B; JR loop
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'bootrom.bin')
+            with open(path, 'wb') as f:
+                f.write(bytes([0x3e, 0x91, 0xe0, 0x40, 0xf0, 0x44, 0xfe, 0x90, 0x20, 0xfa,
+                               0x04, 0x18, 0xf7]))
+
+            with mock.patch.dict(runner.SCENARIOS, {'ly_poll': lambda cpu: scenarios.boot_rom(cpu, path)}):
+                cpu = runner.new_cpu('ly_poll', 'interpreter')
+                cpu.run_frame()
+                instructions, cycles = runner.count_instructions('ly_poll', 1)
+
+        # LY reached 0x90, and the poll loop was skipped rather than
+        # counted at 3 instructions per 32 cycles
+        self.assertGreater(cpu.B, 0)
+        self.assertLess(instructions, cycles * 3 // 32 // 2)
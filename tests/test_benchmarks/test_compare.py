@@ -0,0 +1,70 @@
+import json
+import os
+import tempfile
+import unittest
+
+from benchmarks import compare, stats
+from benchmarks.__main__ import main
+
+def results(scenario_samples, inc_a_samples):
+    return {
+        'meta': {'commit': None},
+        'scenarios': {'alu_loop': {'cycles': 1000, 'seconds': 0.0, 'samples': scenario_samples}},
+        'opcodes': {'0x3c': inc_a_samples},
+    }
+
+class Compare_Test(unittest.TestCase):
+    def test_interval(self):
+        low, high = stats.interval([1.0, 2.0, 3.0])
+
+        # mean 2, stdev 1, t(2) = 4.303
+        self.assertAlmostEqual(low, 2 - 4.303 / 3 ** 0.5)
+        self.assertAlmostEqual(high, 2 + 4.303 / 3 ** 0.5)
+        self.assertEqual(stats.interval([5.0]), (5.0, 5.0))
+
+    def test_regression(self):
+        base = results([1.00, 1.01, 0.99], [100, 101, 99])
+        new = results([1.00, 1.01, 0.99], [130, 131, 129])
+
+        rows = {row[0]: row for row in compare.compare(base, new, threshold=0.1)}
+
+        self.assertEqual(rows['opcode 0x3c inc_a'][4], 'regressed')
+        self.assertAlmostEqual(rows['opcode 0x3c inc_a'][3], 0.3)
+        self.assertEqual(rows['scenario alu_loop'][4], 'same')
+
+    def test_improvement(self):
+        base = results([2.0, 2.1, 1.9], [100, 101, 99])
+        new = results([1.0, 1.1, 0.9], [100, 101, 99])
+
+        rows = {row[0]: row for row in compare.compare(base, new)}
+
+        self.assertEqual(rows['scenario alu_loop'][4], 'improved')
+
+    def test_noise_is_not_a_regression(self):
+        # 20% slower on average, but the intervals overlap
+        base = results([1.0], [50, 150, 100])
+        new = results([1.0], [60, 180, 120])
+
+        rows = {row[0]: row for row in compare.compare(base, new, threshold=0.1)}
+
+        self.assertEqual(rows['opcode 0x3c inc_a'][4], 'same')
+
+    def test_single_mean_results(self):
+        # Opcode timings saved before samples were recorded
+        base = results([1.0], 100.0)
+        new = results([1.0], 150.0)
+
+        rows = {row[0]: row for row in compare.compare(base, new)}
+
+        self.assertEqual(rows['opcode 0x3c inc_a'][4], 'regressed')
+
+    def test_exit_status(self):
+        with tempfile.TemporaryDirectory() as directory:
+            paths = []
+            for name, samples in (('base', [100, 101, 99]), ('new', [200, 201, 199])):
+                paths.append(os.path.join(directory, f'{name}.json'))
+                with open(paths[-1], 'w') as f:
+                    json.dump(results([1.0], samples), f)
+
+            self.assertEqual(main(['compare', paths[0], paths[0]]), 0)
+            self.assertEqual(main(['compare', paths[0], paths[1]]), 1)
@@ -0,0 +1,117 @@
+import threading
+import time
+
+import numpy as np
+
+from frontend.emulation import Emulation, FrameRing
+from graphics import PPU
+from graphics.ppu import HEIGHT, LCDC, LINE_CYCLES
+from processor.cpu import CPU
+
+import unittest
+
+def new_ppu():
+    cpu = CPU()
+    cpu.load(0x0000, bytes([0x18, 0xfe]))
+    ppu = PPU(cpu)
+    cpu.write8(LCDC, 0x91)
+    return cpu, ppu
+
+class FrameRing_Test(unittest.TestCase):
+    def test_handoff(self):
+        back = np.zeros((2, 2), dtype=np.uint8)
+        ring = FrameRing(back)
+        self.assertIsNone(ring.take())
+
+        back[:] = 1
+        next_back = ring.publish()
+        shown = ring.take()
+
+        self.assertIs(shown, back)
+        self.assertIsNot(next_back, back)
+        self.assertIsNone(ring.take())
+
+    def test_drops_stale_frames(self):
+        ring = FrameRing(np.zeros(1, dtype=np.uint8))
+
+        for n in range(1, 5):
+            ring.back[0] = n
+            ring.publish()
+
+        self.assertEqual(ring.take()[0], 4)
+        self.assertEqual(ring.dropped, 3)
+
+    def test_front_is_left_alone(self):
+        ring = FrameRing(np.zeros(1, dtype=np.uint8))
+        ring.back[0] = 1
+        ring.publish()
+        shown = ring.take()
+
+        for n in range(2, 6):
+            ring.back[0] = n
+            ring.publish()
+
+        self.assertEqual(shown[0], 1)
+        self.assertEqual(len({id(ring.back), id(ring.ready), id(ring.front)}), 3)
+
+    def test_threads(self):
+        # Every frame taken is whole: all its values written by one publish
+        ring = FrameRing(np.zeros(1000, dtype=np.int64))
+        done = threading.Event()
+        def produce():
+            for n in range(1, 2001):
+                ring.back[:] = n
+                ring.publish()
+            done.set()
+        thread = threading.Thread(target=produce)
+        thread.start()
+
+        last = 0
+        while not done.is_set() or ring.fresh:
+            shown = ring.take()
+            if shown is not None:
+                self.assertTrue((shown == shown[0]).all())
+                self.assertGreater(shown[0], last)
+                last = shown[0]
+        thread.join()
+
+        self.assertEqual(last, 2000)
+
+class Emulation_Test(unittest.TestCase):
+    def test_ppu_swaps_at_vblank(self):
+        cpu, ppu = new_ppu()
+        emulation = Emulation(cpu, ppu)
+        first = ppu.frame
+
+        cpu.run(HEIGHT * LINE_CYCLES + 100)
+
+        self.assertIs(emulation.ring.take(), first)
+        self.assertIsNot(ppu.frame, first)
+
+    def test_runs_on_its_own_thread(self):
+        cpu, ppu = new_ppu()
+        emulation = Emulation(cpu, ppu)
+
+        emulation.start()
+        time.sleep(0.1)
+        emulation.stop()
+
+        self.assertGreaterEqual(ppu.frames, 3)
+        self.assertIsNotNone(emulation.ring.take())
+        self.assertIsNone(emulation.thread)
+
+    def test_keeps_the_error(self):
+        cpu, ppu = new_ppu()
+        emulation = Emulation(cpu, ppu)
+        def fail(cycle):
+            raise RuntimeError('broken')
+        cpu.scheduler.schedule(100, fail)
+
+        emulation.start()
+        emulation.thread.join()
+
+        self.assertFalse(emulation.running)
+        self.assertIsInstance(emulation.error, RuntimeError)
+
+if __name__ == '__main__':
+    unittest.main()
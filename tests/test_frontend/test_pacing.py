@@ -0,0 +1,100 @@
+from frontend.pacing import FRAME_RATE, MAX_LAG, Pacer
+
+import unittest
+
+PERIOD = 1 / FRAME_RATE
+
+class Clock:
+    # Moves on a little with every look, and by however long is slept
+    def __init__(self):
+        self.now = 100.0
+        self.looks = 0
+
+    def __call__(self):
+        self.now += 1e-5
+        self.looks += 1
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+def new_pacer(frameskip=2):
+    clock = Clock()
+    return clock, Pacer(frameskip, clock=clock, sleep=clock.sleep)
+
+def emulate(clock, pacer, frames, seconds):
+    # Frames taking seconds each to emulate; returns which were drawn
+    drawn = []
+    for _ in range(frames):
+        drawn.append(pacer.draw())
+        clock.now += seconds
+        pacer.wait()
+    return drawn
+
+class Pacer_Test(unittest.TestCase):
+    def test_frame_rate(self):
+        self.assertAlmostEqual(FRAME_RATE, 59.73, places=2)
+
+    def test_keeps_to_frame_rate(self):
+        clock, pacer = new_pacer()
+        start = clock.now
+
+        drawn = emulate(clock, pacer, 120, PERIOD / 4)
+
+        self.assertTrue(all(drawn))
+        self.assertAlmostEqual(clock.now - start, 120 * PERIOD, delta=PERIOD / 10)
+
+    def test_waits_without_spinning(self):
+        clock, pacer = new_pacer()
+        due = pacer.deadline
+        looks = clock.looks
+
+        pacer.wait()
+
+        self.assertEqual(clock.looks - looks, 1)
+        self.assertGreaterEqual(clock.now, due)
+
+    def test_skips_when_behind(self):
+        clock, pacer = new_pacer(frameskip=2)
+
+        # Emulating alone takes 3/4 of a frame and drawing all of one
+        drawn = []
+        for _ in range(60):
+            show = pacer.draw()
+            clock.now += PERIOD * 3 / 4
+            if show:
+                clock.now += PERIOD
+            drawn.append(show)
+            pacer.wait()
+
+        self.assertLess(drawn.count(True), 40)
+        self.assertNotIn([False] * 3, [drawn[i:i+3] for i in range(len(drawn) - 2)])
+
+    def test_never_skips_more_than_frameskip(self):
+        clock, pacer = new_pacer(frameskip=3)
+
+        drawn = emulate(clock, pacer, 20, PERIOD * 2)
+
+        self.assertEqual(drawn[:8], [True, False, False, False] * 2)
+
+    def test_restarts_after_a_stall(self):
+        clock, pacer = new_pacer()
+        emulate(clock, pacer, 10, PERIOD / 2)
+
+        clock.now += MAX_LAG * 2
+        emulate(clock, pacer, 1, 0)
+
+        self.assertEqual(emulate(clock, pacer, 10, PERIOD / 2), [True] * 10)
+
+    def test_fast_forward(self):
+        clock, pacer = new_pacer()
+        pacer.fast_forward = True
+        start = clock.now
+
+        drawn = emulate(clock, pacer, 100, PERIOD / 10)
+
+        self.assertLess(clock.now - start, 11 * PERIOD)
+        self.assertTrue(8 <= drawn.count(True) <= 12)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import os
+
+os.environ['SDL_VIDEODRIVER'] = 'dummy'
+
+import pygame
+
+from frontend.pacing import FRAME_RATE, Pacer
+from frontend.window import Window
+from graphics import PPU
+from graphics.colours import GREYS, Colours
+from graphics.ppu import BGP, HEIGHT, LCDC, LINE_CYCLES, LINES, WIDTH
+from processor.cpu import CPU
+
+import unittest
+
+class Window_Test(unittest.TestCase):
+    def test_draws_the_frame_scaled(self):
+        cpu = CPU()
+        cpu.load(0x0000, bytes([0x18, 0xfe]))
+        ppu = PPU(cpu)
+        cpu.write8(LCDC, 0x91)
+        window = Window(cpu, ppu, scale=2, colours=Colours(GREYS))
+        try:
+            frame = ppu.frame.copy()
+            frame[:, :] = 3
+            frame[10, 20] = 0
+
+            window.draw(frame)
+            pixels = pygame.surfarray.array3d(window.display)
+
+            self.assertEqual(pixels.shape, (WIDTH * 2, HEIGHT * 2, 3))
+            self.assertEqual(list(pixels[40, 20]), [0xff] * 3)
+            self.assertEqual(list(pixels[41, 21]), [0xff] * 3)
+            self.assertEqual(list(pixels[42, 20]), [0] * 3)
+        finally:
+            pygame.display.quit()
+
+    def test_runs_frames(self):
+        cpu = CPU()
+        cpu.load(0x0000, bytes([0x18, 0xfe]))
+        window = Window(cpu, PPU(cpu))
+
+        window.run(frames=3)
+
+        self.assertGreaterEqual(cpu.cycles, 3 * 70224)
+        self.assertFalse(pygame.display.get_init())
+
+    def test_shows_whole_frames(self):
+        # Mid-frame, what would be drawn is the frame finished at VBlank
+        cpu = CPU()
+        cpu.load(0x0000, bytes([0x18, 0xfe]))
+        ppu = PPU(cpu)
+        cpu.write8(LCDC, 0x91)
+        window = Window(cpu, ppu)
+        try:
+            first = ppu.frame
+            cpu.run(HEIGHT * LINE_CYCLES + 100)
+            shown = window.shown.copy()
+
+            # Half of the next frame, in another colour
+            cpu.write8(BGP, 0xff)
+            cpu.run((LINES - HEIGHT + HEIGHT // 2) * LINE_CYCLES)
+
+            self.assertIs(window.shown, first)
+            self.assertTrue((window.shown == shown).all())
+            self.assertTrue((ppu.frame[:HEIGHT // 2] == 3).all())
+        finally:
+            pygame.display.quit()
+
+    def test_skipped_frames_are_not_rendered(self):
+        # Every frame takes two periods, so only the first is to be drawn.
+        # That decision is taken up at the next line 0, by frame 1, and frame
+        # 0 was already being drawn.
+        cpu = CPU()
+        cpu.load(0x0000, bytes([0x18, 0xfe]))
+        ppu = PPU(cpu)
+        cpu.write8(LCDC, 0x91)
+        window = Window(cpu, ppu)
+        now = [100.0]
+        def clock():
+            now[0] += 2 / FRAME_RATE
+            return now[0]
+        window.pacer = Pacer(10, clock=clock, sleep=lambda seconds: None)
+        finished = []
+        on_frame = ppu.on_frame
+        ppu.on_frame = lambda: finished.append(ppu.frames) or on_frame()
+
+        window.run(frames=6)
+
+        self.assertGreaterEqual(ppu.frames, 5)
+        self.assertEqual(finished, [0, 1])
+
+    def test_threaded(self):
+        cpu = CPU()
+        cpu.load(0x0000, bytes([0x18, 0xfe]))
+        ppu = PPU(cpu)
+        cpu.write8(LCDC, 0x91)
+        window = Window(cpu, ppu, threaded=True)
+
+        window.run(frames=6)
+
+        self.assertGreater(ppu.frames, 0)
+        self.assertIsNone(window.emulation.thread)
+
+if __name__ == '__main__':
+    unittest.main()
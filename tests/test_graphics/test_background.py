@@ -0,0 +1,94 @@
+from hypothesis import given, settings
+from hypothesis.strategies import booleans, integers, lists, tuples
+
+import numpy as np
+
+from graphics.background import SIGNED, Background, wrap
+from graphics.tiles import TileCache
+from processor.cpu import CPU
+
+import unittest
+
+def new_background(lcdc=0x10):
+    cpu = CPU()
+    memory = np.frombuffer(cpu.M, dtype=np.uint8)
+    tiles = TileCache(cpu.bus, memory)
+    background = Background(cpu.bus, memory, tiles)
+    background.update(lcdc)
+    return cpu, background
+
+def draw_map(cpu, tiles, map_select, lcdc):
+    # The map drawn tile by tile
+    numbers = np.frombuffer(cpu.M, dtype=np.uint8)[0x9800 + map_select * 0x400:][:0x400].reshape(32, 32)
+    indices = numbers.astype(np.intp) if lcdc & 0x10 else SIGNED[numbers]
+    return tiles.tiles[indices].transpose(0, 2, 1, 3).reshape(256, 256)
+
+class Wrap_Test(unittest.TestCase):
+    def test_inside_is_a_view(self):
+        layer = np.arange(256 * 256).reshape(256, 256)
+
+        view = wrap(layer, 10, 20, 4, 160)
+
+        self.assertTrue(np.shares_memory(view, layer))
+        self.assertTrue((view == layer[10:14, 20:180]).all())
+
+    @given(integers(0, 255), integers(0, 255), integers(1, 144), integers(1, 160))
+    def test_matches_roll(self, top, left, height, width):
+        layer = np.arange(256 * 256).reshape(256, 256)
+
+        expected = np.roll(layer, (-top, -left), axis=(0, 1))[:height, :width]
+
+        self.assertTrue((wrap(layer, top, left, height, width) == expected).all())
+
+class Background_Test(unittest.TestCase):
+    def test_map_write_redraws_cell(self):
+        cpu, background = new_background()
+        cpu.load(0x8010, bytes([0xff] * 16))
+        background.update(0x10)
+
+        cpu.write8(0x9c21, 0x01)
+
+        self.assertTrue(background.dirty[1, 1, 1])
+        self.assertEqual(background.dirty.sum(), 1)
+        background.update(0x10)
+        self.assertTrue((background.layers[1, 8:16, 8:16] == 3).all())
+        self.assertEqual(background.layers.sum(), 3 * 64)
+
+    def test_tile_write_redraws_its_cells(self):
+        cpu, background = new_background()
+        cpu.write8(0x9800, 0x02)
+        cpu.write8(0x9bff, 0x02)
+        background.update(0x10)
+
+        cpu.write8(0x8020, 0xff)
+        background.update(0x10)
+
+        self.assertEqual(list(background.layers[0, 0, :8]), [1] * 8)
+        self.assertEqual(list(background.layers[0, 248, 248:]), [1] * 8)
+        self.assertEqual(background.layers.sum(), 16)
+
+    def test_tile_data_select(self):
+        # Tile 0 is at 0x9000 with LCDC bit 4 clear
+        cpu, background = new_background()
+        cpu.load(0x9000, bytes([0x00, 0xff] * 8))
+
+        background.update(0x00)
+
+        self.assertTrue((background.layers == 2).all())
+
+    @settings(max_examples=50)
+    @given(lists(tuples(integers(0x8000, 0x9fff), integers(0, 0xff)), max_size=50), booleans())
+    def test_matches_full_draw(self, writes, unsigned):
+        lcdc = 0x10 if unsigned else 0x00
+        cpu, background = new_background(lcdc)
+
+        for address, value in writes:
+            cpu.write8(address, value)
+        background.update(lcdc)
+
+        for map_select in (0, 1):
+            expected = draw_map(cpu, background.tiles, map_select, lcdc)
+            self.assertTrue((background.layers[map_select] == expected).all())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,129 @@
+from hypothesis import given, settings
+from hypothesis.strategies import integers, lists, sampled_from, tuples
+import numpy as np
+
+from graphics.ppu import BGP, HEIGHT, LCDC, LINE_CYCLES, OAM_CYCLES, PPU, SCX, SCY, WIDTH, WX, WY
+from processor.cpu import CPU
+
+import unittest
+
+# Part way into VBlank, when the whole frame has been output
+VBLANK = HEIGHT * LINE_CYCLES + 100
+
+def new_ppu(rendering, lcdc=0xb3):
+    # JR -2 at 0 so the CPU idles while the PPU runs
+    cpu = CPU()
+    cpu.load(0x0000, bytes([0x18, 0xfe]))
+    ppu = PPU(cpu, rendering)
+    scene(cpu)
+    cpu.write8(BGP, 0xe4)
+    cpu.write8(LCDC, lcdc)
+    return cpu, ppu
+
+def scene(cpu):
+    # Striped tiles, a different tile pattern in each map and a sprite on
+    # lines 20-27
+    data = bytearray()
+    for n in range(0x100):
+        for y in range(8):
+            row = [n % 4 if (x + y + n) % 3 else 3 - n % 4 for x in range(8)]
+            data.append(sum((c & 1) << (7 - x) for x, c in enumerate(row)))
+            data.append(sum((c >> 1) << (7 - x) for x, c in enumerate(row)))
+    cpu.load(0x8000, bytes(data))
+    cpu.load(0x9800, bytes(n * 7 & 0xff for n in range(0x400)))
+    cpu.load(0x9c00, bytes(n * 5 & 0xff for n in range(0x400)))
+    cpu.load(0xfe00, bytes([36, 40, 3, 0x00]))
+
+def write_at(cpu, cycle, address, value, times=None):
+    def write(cycle):
+        if times is not None:
+            times.append(cpu.cycles)
+        cpu.write8(address, value)
+    cpu.scheduler.schedule(cycle, write)
+
+class CatchUp_Test(unittest.TestCase):
+    def test_unknown_rendering(self):
+        with self.assertRaises(ValueError):
+            PPU(CPU(), 'tile')
+
+    def test_draws_only_when_read(self):
+        cpu, ppu = new_ppu('catch-up')
+
+        cpu.run(10 * LINE_CYCLES)
+
+        self.assertEqual(ppu.drawn, 0)
+        ppu.frame
+        self.assertEqual(ppu.drawn, 10 * WIDTH)
+
+    def test_vblank_draws_the_frame(self):
+        cpu, ppu = new_ppu('catch-up')
+        reference, expected = new_ppu('scanline')
+
+        cpu.run(VBLANK)
+        reference.run(VBLANK)
+
+        self.assertEqual(ppu.drawn, HEIGHT * WIDTH)
+        self.assertTrue((ppu._frame == expected.frame).all())
+
+    def test_write_mid_line(self):
+        # BGP changes part way through drawing line 10
+        cpu, ppu = new_ppu('catch-up')
+        times = []
+        write_at(cpu, 10 * LINE_CYCLES + OAM_CYCLES + 50, BGP, 0x1b, times)
+        cpu.run(VBLANK)
+
+        frames = []
+        for bgp in (0xe4, 0x1b):
+            reference, expected = new_ppu('scanline')
+            reference.write8(BGP, bgp)
+            reference.run(VBLANK)
+            frames.append(expected.frame)
+        before, after = frames
+        split = times[0] - 10 * LINE_CYCLES - OAM_CYCLES
+        frame = ppu.frame
+
+        self.assertTrue((frame[:10] == before[:10]).all())
+        self.assertTrue((frame[10, :split] == before[10, :split]).all())
+        self.assertTrue((frame[10, split:] == after[10, split:]).all())
+        self.assertTrue((frame[11:] == after[11:]).all())
+        self.assertFalse((before[10] == after[10]).all())
+
+    def test_vram_write_draws_first(self):
+        cpu, ppu = new_ppu('catch-up')
+        cpu.run(5 * LINE_CYCLES)
+
+        cpu.write8(0x9800, 0x01)
+
+        self.assertEqual(ppu.drawn, 5 * WIDTH)
+        first = ppu._frame[:5].copy()
+        cpu.run(VBLANK - cpu.cycles)
+        self.assertTrue((ppu.frame[:5] == first).all())
+
+    def test_lcd_off_draws_first(self):
+        cpu, ppu = new_ppu('catch-up')
+        cpu.run(5 * LINE_CYCLES)
+
+        cpu.write8(LCDC, 0x00)
+
+        self.assertEqual(ppu.drawn, 5 * WIDTH)
+        self.assertEqual(ppu.registers[0], 0x00)
+
+    @settings(max_examples=30, deadline=None)
+    @given(lists(tuples(integers(0, HEIGHT - 2), sampled_from((LCDC, SCY, SCX, BGP, WY, WX)),
+                        integers(0, 0xff)), max_size=12))
+    def test_matches_scanline_between_lines(self, writes):
+        # Writes in HBlank take effect from the next line either way
+        frames = []
+        for rendering in ('scanline', 'catch-up'):
+            cpu, ppu = new_ppu(rendering)
+            for line, address, value in writes:
+                if address == LCDC:
+                    value |= 0x80
+                write_at(cpu, line * LINE_CYCLES + 300, address, value)
+            cpu.run(VBLANK)
+            frames.append(np.array(ppu.frame))
+
+        self.assertTrue((frames[0] == frames[1]).all())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+from hypothesis import given
+from hypothesis.strategies import integers
+
+import numpy as np
+
+from graphics.colours import GREEN, GREYS, Colours
+from graphics.ppu import HEIGHT, PALETTES, WIDTH, palette
+
+import unittest
+
+def random_frame(seed):
+    return np.random.default_rng(seed).integers(0, 4, (HEIGHT, WIDTH), dtype=np.uint8)
+
+class Palettes_Test(unittest.TestCase):
+    @given(integers(0, 0xff))
+    def test_table(self, value):
+        self.assertEqual(list(palette(value)), [value >> shift & 3 for shift in (0, 2, 4, 6)])
+        self.assertEqual(PALETTES.shape, (0x100, 4))
+
+class Colours_Test(unittest.TestCase):
+    @given(integers(0, 2**32 - 1))
+    def test_convert(self, seed):
+        colours = Colours(GREYS)
+        frame = random_frame(seed)
+
+        colours.convert(frame)
+
+        self.assertTrue((colours.image == np.array(GREYS, dtype=np.uint8)[frame]).all())
+        self.assertTrue((colours.buffer == colours.image.transpose(1, 0, 2)).all())
+
+    def test_reuses_buffer(self):
+        colours = Colours()
+        buffer = colours.buffer
+
+        result = colours.convert(random_frame(0))
+        colours.convert(random_frame(1))
+
+        self.assertIs(result, buffer)
+        self.assertIs(colours.buffer, buffer)
+        self.assertEqual(buffer.shape, (WIDTH, HEIGHT, 3))
+        self.assertTrue(np.shares_memory(colours.image, buffer))
+
+    def test_alpha(self):
+        colours = Colours(GREEN, alpha=True)
+
+        colours.convert(np.full((HEIGHT, WIDTH), 2, dtype=np.uint8))
+
+        self.assertEqual(list(colours.image[5, 7]), list(GREEN[2]) + [0xff])
+
+    def test_set(self):
+        colours = Colours(GREEN)
+
+        colours.set(GREYS)
+        colours.convert(np.zeros((HEIGHT, WIDTH), dtype=np.uint8))
+
+        self.assertTrue((colours.image == 0xff).all())
+
+if __name__ == '__main__':
+    unittest.main()
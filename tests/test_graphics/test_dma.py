@@ -0,0 +1,99 @@
+from graphics.dma import BLOCKED, DMA, DMA_CYCLES
+from graphics.ppu import LCDC, LINE_CYCLES, PPU
+from processor.cpu import CPU
+from processor.translator import CodeWatch
+
+from helpers import ENGINES
+
+import unittest
+
+# The usual routine, copied to HRAM and called from there:
+#   FF80 LD A, 0xC0; LDH (0x46), A; LD A, 40
+#   FF86 DEC A; JR NZ, 0xFF86; RET
+ROUTINE = (0x3e, 0xc0, 0xe0, 0x46, 0x3e, 0x28, 0x3d, 0x20, 0xfd, 0xc9)
+
+def new_cpu(engine='interpreter'):
+    # CALL 0xFF80; LD A, (0xC000); JR -2
+    cpu = CPU(engine=engine)
+    cpu.load(0x0100, bytes([0xcd, 0x80, 0xff, 0xfa, 0x00, 0xc0, 0x18, 0xfe]))
+    cpu.load(0xff80, bytes(ROUTINE))
+    cpu.load(0xc000, bytes(range(1, 161)))
+    cpu.PC, cpu.SP = 0x0100, 0xfffe
+    ppu = PPU(cpu)
+    return cpu, ppu
+
+class DMA_Test(unittest.TestCase):
+    def test_copies_to_oam(self):
+        cpu, ppu = new_cpu()
+        ppu.sprites.update(8)
+
+        cpu.write8(DMA, 0xc0)
+
+        self.assertEqual(bytes(cpu.M[0xfe00:0xfea0]), bytes(range(1, 161)))
+        self.assertEqual(cpu.read8(DMA), 0xc0)
+        self.assertTrue(ppu.sprites.dirty)
+
+    def test_echo_source(self):
+        cpu, ppu = new_cpu()
+
+        cpu.write8(DMA, 0xe0)
+
+        self.assertEqual(bytes(cpu.M[0xfe00:0xfea0]), bytes(range(1, 161)))
+
+    def test_only_page_ff_during_transfer(self):
+        cpu, ppu = new_cpu()
+
+        cpu.write8(DMA, 0xc0)
+
+        self.assertTrue(ppu.dma.active)
+        self.assertEqual(cpu.read8(0xc000), 0xff)
+        cpu.write8(0xc000, 0x55)
+        cpu.write8(0xff90, 0x55)
+        self.assertEqual(cpu.M[0xc000], 0x01)
+        self.assertEqual(cpu.read8(0xff90), 0x55)
+
+        cpu.scheduler.run_due(cpu.cycles + DMA_CYCLES)
+
+        self.assertFalse(ppu.dma.active)
+        self.assertEqual(cpu.read8(0xc000), 0x01)
+        cpu.write8(0xfe00, 0x55)
+        self.assertEqual(cpu.M[0xfe00], 0x55)
+
+    def test_catch_up_draws_first(self):
+        cpu = CPU()
+        cpu.load(0x0000, bytes([0x18, 0xfe]))
+        ppu = PPU(cpu, 'catch-up')
+        cpu.write8(LCDC, 0x93)
+        cpu.run(5 * LINE_CYCLES)
+
+        cpu.write8(DMA, 0xc0)
+
+        self.assertEqual(ppu.drawn, 5 * 160)
+
+    def test_routine_in_hram(self):
+        for engine in ENGINES:
+            cpu, ppu = new_cpu(engine)
+
+            cpu.run(2000)
+
+            self.assertEqual(cpu.A, 0x01)
+            self.assertFalse(ppu.dma.active)
+            self.assertEqual(bytes(cpu.M[0xfe00:0xfea0]), bytes(range(1, 161)))
+
+    def test_keeps_handlers_installed_meanwhile(self):
+        cpu, ppu = new_cpu('translator')
+        cpu.write8(DMA, 0xc0)
+        watch = CodeWatch(cpu.translator, BLOCKED, cpu.M)
+        cpu.bus.write_pages[0xc0] = watch
+        cpu.write8(0xc000, 0x55)
+
+        cpu.scheduler.run_due(cpu.cycles + DMA_CYCLES)
+
+        self.assertIs(cpu.bus.write_pages[0xc0], watch)
+        self.assertIsNone(watch.previous)
+        self.assertEqual(cpu.M[0xc000], 0x01)
+        cpu.write8(0xc000, 0x55)
+        self.assertEqual(cpu.M[0xc000], 0x55)
+
+if __name__ == '__main__':
+    unittest.main()
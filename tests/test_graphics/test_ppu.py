@@ -0,0 +1,354 @@
+import numpy as np
+
+from graphics.ppu import (BGP, DRAW_CYCLES, HEIGHT, LCDC, LINE_CYCLES, LINES, LY, LYC, MODE_DRAW,
+                          MODE_HBLANK, MODE_OAM, MODE_VBLANK, OAM_CYCLES, OBP0, OBP1, PPU, SCX, SCY,
+                          STAT, WX, WY, palette)
+from processor.cpu import CPU, IF, STAT as STAT_INTERRUPT, VBLANK
+
+from helpers import count_instructions
+
+import unittest
+
+def new_ppu(lcdc=0x91):
+    # JR -2 at 0 so the CPU idles while the PPU runs
+    cpu = CPU()
+    cpu.load(0x0000, bytes([0x18, 0xfe]))
+    ppu = PPU(cpu)
+    cpu.write8(LCDC, lcdc)
+    return cpu, ppu
+
+def encode(rows) -> bytes:
+    # rows: lists of 8 colour numbers
+    data = []
+    for row in rows:
+        data.append(sum((c & 1) << (7 - x) for x, c in enumerate(row)))
+        data.append(sum((c >> 1) << (7 - x) for x, c in enumerate(row)))
+    return bytes(data)
+
+def set_tile(cpu, address, rows):
+    cpu.load(address, encode(rows))
+
+def solid(colour):
+    return [[colour] * 8 for _ in range(8)]
+
+class Palette_Test(unittest.TestCase):
+    def test_palette(self):
+        self.assertEqual(list(palette(0xe4)), [0, 1, 2, 3])
+        self.assertEqual(list(palette(0x1b)), [3, 2, 1, 0])
+
+class Timing_Test(unittest.TestCase):
+    def test_modes(self):
+        cpu, ppu = new_ppu()
+
+        for offset, mode in ((0, MODE_OAM), (OAM_CYCLES, MODE_DRAW),
+                             (OAM_CYCLES + DRAW_CYCLES, MODE_HBLANK), (LINE_CYCLES, MODE_OAM)):
+            cpu.run(offset + 4 - cpu.cycles)
+            self.assertEqual(ppu.mode, mode)
+            self.assertEqual(cpu.M[STAT] & 0x03, mode)
+
+    def test_ly(self):
+        cpu, ppu = new_ppu()
+
+        for line in (1, 2, 100, 143, 144, 153):
+            cpu.run(line * LINE_CYCLES + 4 - cpu.cycles)
+            self.assertEqual(cpu.M[LY], line)
+
+        cpu.run(LINES * LINE_CYCLES + 4 - cpu.cycles)
+        self.assertEqual(cpu.M[LY], 0)
+        self.assertEqual(ppu.frames, 1)
+
+    def test_vblank_interrupt(self):
+        cpu, ppu = new_ppu()
+
+        # JR -2 can run up to 12 cycles past the end of a run
+        cpu.run(HEIGHT * LINE_CYCLES - 16)
+        self.assertEqual(cpu.M[IF] & VBLANK, 0)
+
+        cpu.run(32)
+        self.assertEqual(cpu.M[IF] & VBLANK, VBLANK)
+        self.assertEqual(ppu.mode, MODE_VBLANK)
+
+    def test_lyc_interrupt(self):
+        cpu, ppu = new_ppu()
+        cpu.write8(LYC, 10)
+        cpu.write8(STAT, 0x40)
+
+        cpu.run(10 * LINE_CYCLES - 16)
+        self.assertEqual(cpu.M[IF] & STAT_INTERRUPT, 0)
+        self.assertEqual(cpu.M[STAT] & 0x04, 0)
+
+        cpu.run(32)
+        self.assertEqual(cpu.M[IF] & STAT_INTERRUPT, STAT_INTERRUPT)
+        self.assertEqual(cpu.M[STAT] & 0x04, 0x04)
+
+    def test_ly_is_read_only(self):
+        cpu, ppu = new_ppu()
+        cpu.run(3 * LINE_CYCLES)
+
+        cpu.write8(LY, 0x50)
+
+        self.assertEqual(cpu.read8(LY), 3)
+
+    def test_lcd_off(self):
+        cpu, ppu = new_ppu()
+        cpu.run(20 * LINE_CYCLES)
+
+        cpu.write8(LCDC, 0x11)
+        cpu.run(10 * LINE_CYCLES)
+
+        self.assertEqual(cpu.M[LY], 0)
+        self.assertEqual(cpu.M[STAT] & 0x03, 0)
+        self.assertFalse(ppu.event.pending)
+
+        cpu.write8(LCDC, 0x91)
+        cpu.run(LINE_CYCLES + 4)
+        self.assertEqual(cpu.M[LY], 1)
+
+    def test_skipped_frames(self):
+        # Timed and interrupting all the same, but not drawn or handed over
+        for rendering in ('scanline', 'catch-up'):
+            results = []
+            for skip in (False, True):
+                cpu = CPU()
+                cpu.load(0x0000, bytes([0x18, 0xfe]))
+                ppu = PPU(cpu, rendering)
+                cpu.write8(LCDC, 0x91)
+                cpu.write8(BGP, 0xff)
+                finished = []
+                def on_frame(finished=finished, ppu=ppu):
+                    finished.append(ppu.frames)
+                    return np.zeros_like(ppu.frame)
+                ppu.on_frame = on_frame
+                # The first frame started drawing when the LCD went on
+                ppu.skip = skip
+
+                trace = []
+                for _ in range(3 * LINES + HEIGHT // 2):
+                    cpu.run(LINE_CYCLES)
+                    trace.append((cpu.cycles, cpu.M[LY], cpu.M[STAT], cpu.M[IF]))
+                results.append((trace, ppu.frames))
+
+                self.assertEqual(finished, [0] if skip else [0, 1, 2])
+                self.assertEqual(ppu.frame.max(), 0 if skip else 3)
+
+            self.assertEqual(results[0], results[1])
+
+    def test_polling_ly_is_skipped(self):
+        # LDH A, (0x44); CP 0x90; JR NZ, -6; INC B; JR -2
+        program = bytes([0xf0, 0x44, 0xfe, 0x90, 0x20, 0xfa, 0x04, 0x18, 0xfe])
+        results, counts = [], []
+        for detect in (True, False):
+            cpu = CPU()
+            cpu.load(0x0100, program)
+            cpu.PC = 0x0100
+            if not detect:
+                cpu.busy_loops.update(range(0x10000))
+            PPU(cpu)
+            cpu.write8(LCDC, 0x91)
+            count = count_instructions(cpu)
+
+            cpu.run(0x90 * LINE_CYCLES + 100)
+
+            results.append((cpu.cycles, cpu.PC, cpu.B, cpu.M[LY]))
+            counts.append(count[0])
+
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(results[0][2], 1)
+        # Each new LY has to be read by going round the loop again, and
+        # each PPU event stops it part way round
+        self.assertLess(counts[0] * 3, counts[1])
+
+class Render_Test(unittest.TestCase):
+    def setUp(self):
+        self.cpu, self.ppu = new_ppu()
+        self.cpu.M[BGP] = 0xe4
+
+    def test_background(self):
+        cpu, ppu = self.cpu, self.ppu
+        # Tile 1 at map position (1, 0): colour 3 on its top row, 1 below
+        set_tile(cpu, 0x8010, [[3] * 8] + [[1] * 8] * 7)
+        cpu.M[0x9801] = 1
+
+        for ly in range(8):
+            ppu.render_line(ly)
+
+        self.assertTrue((ppu.frame[0, 8:16] == 3).all())
+        self.assertTrue((ppu.frame[1:8, 8:16] == 1).all())
+        self.assertTrue((ppu.frame[0:8, 0:8] == 0).all())
+
+    def test_bgp(self):
+        cpu, ppu = self.cpu, self.ppu
+        set_tile(cpu, 0x8000, solid(1))
+        cpu.M[BGP] = 0x1b
+
+        ppu.render_line(0)
+
+        self.assertTrue((ppu.frame[0] == 2).all())
+
+    def test_scroll_wraps(self):
+        cpu, ppu = self.cpu, self.ppu
+        set_tile(cpu, 0x8010, solid(2))
+        cpu.M[0x9800] = 1
+        cpu.M[SCX] = 252
+        cpu.M[SCY] = 3
+
+        ppu.render_line(0)
+
+        self.assertEqual(list(ppu.frame[0, :12]), [0] * 4 + [2] * 8)
+
+    def test_signed_tile_data(self):
+        cpu, ppu = self.cpu, self.ppu
+        # LCDC bit 4 clear: tile 0x80 is at 0x8800, tile 0 at 0x9000
+        cpu.M[LCDC] = 0x81
+        set_tile(cpu, 0x8800, solid(3))
+        set_tile(cpu, 0x9000, solid(1))
+        cpu.M[0x9800] = 0x80
+
+        ppu.render_line(0)
+
+        self.assertEqual(list(ppu.frame[0, 6:10]), [3, 3, 1, 1])
+
+    def test_background_off(self):
+        cpu, ppu = self.cpu, self.ppu
+        set_tile(cpu, 0x8000, solid(3))
+        cpu.M[LCDC] = 0x90
+
+        ppu.render_line(0)
+
+        self.assertTrue((ppu.frame[0] == 0).all())
+
+    def test_window(self):
+        cpu, ppu = self.cpu, self.ppu
+        # Window map at 0x9C00 uses tile 1
+        cpu.M[LCDC] = 0xf1
+        set_tile(cpu, 0x8010, solid(3))
+        cpu.M[0x9c00:0x9c20] = bytes([1] * 32)
+        cpu.M[WY] = 2
+        cpu.M[WX] = 7 + 100
+
+        for ly in range(4):
+            ppu.render_line(ly)
+
+        self.assertTrue((ppu.frame[:2] == 0).all())
+        self.assertTrue((ppu.frame[2:4, :100] == 0).all())
+        self.assertTrue((ppu.frame[2:4, 100:] == 3).all())
+        self.assertEqual(ppu.window_line, 2)
+
+class Sprites_Test(unittest.TestCase):
+    def setUp(self):
+        self.cpu, self.ppu = new_ppu(lcdc=0x93)
+        self.cpu.M[BGP] = 0xe4
+        self.cpu.M[OBP0] = 0xe4
+        self.cpu.M[OBP1] = 0x1b
+
+    def sprite(self, index, x, y, tile, attributes=0):
+        self.cpu.M[0xfe00 + index * 4:0xfe04 + index * 4] = bytes([y + 16, x + 8, tile, attributes])
+
+    def test_sprite(self):
+        cpu, ppu = self.cpu, self.ppu
+        # Tile 2: left half colour 2, right half transparent
+        set_tile(cpu, 0x8020, [[2, 2, 2, 2, 0, 0, 0, 0]] * 8)
+        set_tile(cpu, 0x8000, solid(1))
+        self.sprite(0, 10, 0, 2)
+
+        ppu.render_line(0)
+
+        self.assertEqual(list(ppu.frame[0, 8:20]), [1, 1, 2, 2, 2, 2, 1, 1, 1, 1, 1, 1])
+
+    def test_flip_and_palette(self):
+        cpu, ppu = self.cpu, self.ppu
+        set_tile(cpu, 0x8020, [[1, 2, 3, 3, 3, 3, 3, 3]] + [[0] * 8] * 7)
+        # X flip, Y flip, OBP1, so line 7 shows the top row reversed
+        self.sprite(0, 0, 0, 2, 0x70)
+
+        ppu.render_line(7)
+
+        self.assertEqual(list(ppu.frame[7, :8]), [0, 0, 0, 0, 0, 0, 1, 2])
+
+    def test_behind_background(self):
+        cpu, ppu = self.cpu, self.ppu
+        set_tile(cpu, 0x8010, [[1, 0] * 4] * 8)
+        cpu.M[0x9800] = 1
+        set_tile(cpu, 0x8020, solid(3))
+        self.sprite(0, 0, 0, 2, 0x80)
+
+        ppu.render_line(0)
+
+        self.assertEqual(list(ppu.frame[0, :8]), [1, 3] * 4)
+
+    def test_behind_background_over_sprite(self):
+        # The winning sprite is behind the background, and the one under it
+        # does not show through where it is hidden
+        cpu, ppu = self.cpu, self.ppu
+        set_tile(cpu, 0x8010, [[1, 0] * 4] * 8)
+        cpu.M[0x9800] = 1
+        set_tile(cpu, 0x8020, solid(3))
+        set_tile(cpu, 0x8030, solid(2))
+        self.sprite(0, 0, 0, 2, 0x80)
+        self.sprite(1, 0, 0, 3)
+
+        ppu.render_line(0)
+
+        self.assertEqual(list(ppu.frame[0, :8]), [1, 3] * 4)
+
+    def test_tall_sprites(self):
+        cpu, ppu = self.cpu, self.ppu
+        cpu.M[LCDC] = 0x97
+        set_tile(cpu, 0x8020, solid(1))
+        set_tile(cpu, 0x8030, solid(2))
+        # Bit 0 of the tile number is ignored
+        self.sprite(0, 0, 0, 3)
+
+        ppu.render_line(4)
+        ppu.render_line(12)
+
+        self.assertEqual(ppu.frame[4, 0], 1)
+        self.assertEqual(ppu.frame[12, 0], 2)
+
+    def test_priority(self):
+        cpu, ppu = self.cpu, self.ppu
+        set_tile(cpu, 0x8010, solid(1))
+        set_tile(cpu, 0x8020, solid(2))
+        set_tile(cpu, 0x8030, solid(3))
+        # The lower X wins, then the lower OAM index
+        self.sprite(0, 4, 0, 1)
+        self.sprite(1, 2, 0, 2)
+        self.sprite(2, 2, 0, 3)
+
+        ppu.render_line(0)
+
+        self.assertEqual(list(ppu.frame[0, :14]), [0, 0] + [2] * 8 + [1] * 2 + [0] * 2)
+
+    def test_ten_per_line(self):
+        cpu, ppu = self.cpu, self.ppu
+        set_tile(cpu, 0x8010, solid(3))
+        for index in range(12):
+            self.sprite(index, index * 8, 0, 1)
+
+        ppu.render_line(0)
+
+        self.assertTrue((ppu.frame[0, :80] == 3).all())
+        self.assertTrue((ppu.frame[0, 80:] == 0).all())
+
+    def test_clipped_at_edges(self):
+        cpu, ppu = self.cpu, self.ppu
+        set_tile(cpu, 0x8010, solid(3))
+        self.sprite(0, -4, 0, 1)
+        self.sprite(1, 156, 0, 1)
+
+        ppu.render_line(0)
+
+        self.assertEqual(list(ppu.frame[0, :6]), [3] * 4 + [0] * 2)
+        self.assertEqual(list(ppu.frame[0, 154:]), [0] * 2 + [3] * 4)
+
+    def test_frame(self):
+        cpu, ppu = self.cpu, self.ppu
+        set_tile(cpu, 0x8000, solid(2))
+
+        cpu.run(LINES * LINE_CYCLES)
+
+        self.assertEqual(ppu.frames, 1)
+        self.assertTrue((ppu.frame == 2).all())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+from hypothesis import given, settings
+from hypothesis.strategies import integers, lists, sampled_from, tuples
+
+import numpy as np
+
+from graphics.sprites import Sprites
+from processor.cpu import CPU
+
+import unittest
+
+def new_sprites():
+    cpu = CPU()
+    sprites = Sprites(cpu.bus, np.frombuffer(cpu.M, dtype=np.uint8))
+    sprites.update(8)
+    return cpu, sprites
+
+def scan(cpu, ly, height):
+    # The sprites on line ly as the hardware finds them, highest priority first
+    found = [i for i in range(40) if cpu.M[0xfe00 + i*4] - 16 <= ly < cpu.M[0xfe00 + i*4] - 16 + height][:10]
+    return sorted(found, key=lambda i: (cpu.M[0xfe01 + i*4], i))
+
+class Sprites_Test(unittest.TestCase):
+    def test_write_rebuilds(self):
+        cpu, sprites = new_sprites()
+        self.assertEqual(list(sprites.lines[0]), [])
+
+        cpu.write8(0xfe04, 16)
+
+        self.assertTrue(sprites.dirty)
+        sprites.update(8)
+        self.assertEqual(list(sprites.lines[0]), [1])
+        self.assertEqual(list(sprites.lines[7]), [1])
+        self.assertEqual(list(sprites.lines[8]), [])
+
+    def test_height_change_rebuilds(self):
+        cpu, sprites = new_sprites()
+        cpu.write8(0xfe00, 16)
+        sprites.update(8)
+
+        sprites.update(16)
+
+        self.assertEqual(list(sprites.lines[15]), [0])
+
+    def test_load_rebuilds(self):
+        cpu, sprites = new_sprites()
+
+        cpu.load(0xfe00, bytes([20, 8, 0, 0]))
+
+        self.assertTrue(sprites.dirty)
+
+    def test_unchanged_is_not_rebuilt(self):
+        cpu, sprites = new_sprites()
+        lines = sprites.lines
+
+        cpu.write8(0xc000, 1)
+        sprites.update(8)
+
+        self.assertIs(sprites.lines, lines)
+
+    @settings(max_examples=50)
+    @given(lists(tuples(integers(0, 39), integers(0, 170), integers(0, 0xff)), max_size=60),
+           sampled_from((8, 16)))
+    def test_matches_scanning(self, placed, height):
+        cpu, sprites = new_sprites()
+        for index, y, x in placed:
+            cpu.write8(0xfe00 + index*4, y)
+            cpu.write8(0xfe01 + index*4, x)
+
+        sprites.update(height)
+
+        for ly in range(144):
+            self.assertEqual(list(sprites.lines[ly]), scan(cpu, ly, height))
+
+if __name__ == '__main__':
+    unittest.main()
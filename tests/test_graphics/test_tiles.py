@@ -0,0 +1,83 @@
+from hypothesis import given, settings
+from hypothesis.strategies import integers, lists, tuples
+
+import numpy as np
+
+from graphics.tiles import DECODE, TILES, TileCache, decode_rows
+from processor.cpu import CPU
+
+import unittest
+
+def new_cache():
+    cpu = CPU()
+    cache = TileCache(cpu.bus, np.frombuffer(cpu.M, dtype=np.uint8))
+    cache.update()
+    return cpu, cache
+
+def decode_all(cpu):
+    data = np.frombuffer(cpu.M, dtype=np.uint8)[0x8000:0x9800].reshape(TILES, 8, 2)
+    return decode_rows(data[..., 0], data[..., 1])
+
+class Decode_Test(unittest.TestCase):
+    @given(integers(0, 0xff), integers(0, 0xff))
+    def test_decode_rows(self, low, high):
+        row = decode_rows(np.uint8(low), np.uint8(high))
+
+        self.assertEqual(list(row), [(low >> (7 - x) & 1) | (high >> (7 - x) & 1) << 1 for x in range(8)])
+        self.assertEqual(list(DECODE[low, high]), list(row))
+
+class TileCache_Test(unittest.TestCase):
+    def test_write_marks_tile(self):
+        cpu, cache = new_cache()
+
+        cpu.write8(0x8012, 0xff)
+        cpu.write8(0x97ff, 0x01)
+
+        self.assertEqual(cache.dirty, {1, 383})
+        self.assertEqual(cpu.M[0x8012], 0xff)
+        cache.update()
+        self.assertEqual(list(cache.tiles[1, 1]), [1] * 8)
+        self.assertEqual(list(cache.tiles[383, 7]), [0] * 7 + [2])
+        self.assertEqual(cache.dirty, set())
+
+    def test_other_writes_ignored(self):
+        cpu, cache = new_cache()
+
+        cpu.write8(0x9800, 0xff)
+        cpu.write8(0x7fff, 0xff)
+
+        self.assertEqual(cache.dirty, set())
+
+    def test_load_marks_range(self):
+        cpu, cache = new_cache()
+
+        cpu.load(0x7ff0, bytes([0xff] * 0x21))
+
+        self.assertEqual(cache.dirty, {0, 1})
+        cache.update()
+        self.assertTrue((cache.tiles[0] == 3).all())
+        self.assertEqual(list(cache.tiles[1, 0]), [1] * 8)
+
+    def test_restore_marks_everything(self):
+        cpu, cache = new_cache()
+        snapshot = bytearray(cpu.snapshot())
+        snapshot[0x8000:0x9800] = bytes([0xaa] * 0x1800)
+
+        cpu.restore(bytes(snapshot))
+        cache.update()
+
+        self.assertTrue((cache.tiles == decode_all(cpu)).all())
+
+    @settings(max_examples=50)
+    @given(lists(tuples(integers(0x8000, 0x97ff), integers(0, 0xff)), max_size=50))
+    def test_matches_full_decode(self, writes):
+        cpu, cache = new_cache()
+
+        for address, value in writes:
+            cpu.write8(address, value)
+        cache.update()
+
+        self.assertTrue((cache.tiles == decode_all(cpu)).all())
+
+if __name__ == '__main__':
+    unittest.main()
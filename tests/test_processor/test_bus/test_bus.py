@@ -0,0 +1,91 @@
+from hypothesis import given
+from hypothesis.strategies import integers
+
+from processor.cpu import CPU
+
+import unittest
+
+class Bus_Test(unittest.TestCase):
+    @given(integers(min_value=0x0000, max_value=0xffff), integers(min_value=0x00, max_value=0xff))
+    def test_read_write8(self, address, value):
+        cpu = CPU()
+
+        cpu.write8(address, value)
+
+        self.assertEqual(cpu.M[address], value)
+        self.assertEqual(cpu.read8(address), value)
+
+    @given(integers(min_value=0x0000, max_value=0xfffe), integers(min_value=0x0000, max_value=0xffff))
+    def test_read_write16(self, address, value):
+        cpu = CPU()
+
+        cpu.write16(address, value)
+
+        self.assertEqual(cpu.M[address], value & 0xff)
+        self.assertEqual(cpu.M[address+1], value >> 8)
+        self.assertEqual(cpu.read16(address), value)
+
+    def test_read_write16_wraps(self):
+        cpu = CPU()
+        cpu.M[0xffff], cpu.M[0x0000] = 0x34, 0x12
+
+        self.assertEqual(cpu.read16(0xffff), 0x1234)
+
+        cpu.write16(0xffff, 0x5678)
+
+        self.assertEqual(cpu.M[0x0000], 0x56)
+        self.assertEqual(cpu.M[0x10000], 0x00)
+
+    def test_rom_is_read_only(self):
+        cpu = CPU()
+        cpu.load(0x0000, bytes([0x31, 0xfe, 0xff]))
+        cpu.bus.map_dmg()
+
+        cpu.write8(0x0000, 0x00)
+        cpu.write8(0x7fff, 0x12)
+
+        self.assertEqual(cpu.read8(0x0000), 0x31)
+        self.assertEqual(cpu.read8(0x7fff), 0x00)
+
+        cpu.write8(0x8000, 0x12)
+        self.assertEqual(cpu.read8(0x8000), 0x12)
+
+    def test_echo_ram(self):
+        cpu = CPU()
+        cpu.bus.map_dmg()
+
+        cpu.write8(0xc123, 0x12)
+        self.assertEqual(cpu.read8(0xe123), 0x12)
+
+        cpu.write8(0xfdff, 0x34)
+        self.assertEqual(cpu.M[0xddff], 0x34)
+
+    def test_io_hook(self):
+        cpu = CPU()
+        written = []
+
+        cpu.bus.io.hook(0xff44, read=lambda: 0x90, write=written.append)
+
+        cpu.write8(0xff44, 0x12)
+        cpu.write8(0xff80, 0x34)
+
+        self.assertEqual(cpu.read8(0xff44), 0x90)
+        self.assertEqual(written, [0x12])
+        self.assertEqual(cpu.read8(0xff80), 0x34)
+        self.assertEqual(cpu.M[0xff44], 0x00)
+
+    def test_map_handler(self):
+        class Register:
+            def __init__(self): self.value = 0
+            def read(self, address): return self.value
+            def write(self, address, value): self.value = value
+
+        cpu = CPU()
+        register = Register()
+        cpu.bus.map(0x2000, 0x4000, register, read=False)
+
+        cpu.write8(0x2100, 0x05)
+
+        self.assertEqual(register.value, 0x05)
+        self.assertEqual(cpu.M[0x2100], 0x00)
+        self.assertEqual(cpu.read8(0x2100), 0x00)
@@ -0,0 +1,116 @@
+from processor.cpu import HALTED, IE, IF, JOYPAD, STOPPED, TIMER
+from processor.timer import TAC, TIMA, Timer
+
+from helpers import ENGINES, count_instructions, new_cpu
+
+import unittest
+
+# EI; HALT
+EI_HALT = (0xfb, 0x76)
+
+class Halt_Test(unittest.TestCase):
+    def test_halt_without_events(self):
+        for engine in ENGINES:
+            cpu = new_cpu(EI_HALT, engine)
+
+            consumed = cpu.run(10000)
+
+            self.assertEqual(cpu.halted, HALTED)
+            self.assertEqual(cpu.PC, 0x0102)
+            self.assertGreaterEqual(consumed, 10000)
+            self.assertEqual(cpu.cycles, consumed)
+
+    def test_halt_skips_to_timer_interrupt(self):
+        # TIMA overflows after 0x10 edges of 16 cycles
+        cpu = new_cpu(EI_HALT)
+        Timer(cpu)
+        cpu.write8(TIMA, 0xf0)
+        cpu.write8(TAC, 0x05)
+        cpu.write8(IE, TIMER)
+        counter = count_instructions(cpu)
+
+        cpu.run_until(lambda cpu: cpu.PC == 0x0050, 10000)
+
+        # EI and HALT only, then straight to the overflow and the vector
+        self.assertEqual(counter[0], 2)
+        self.assertEqual(cpu.halted, 0)
+        self.assertEqual(cpu.read16(cpu.SP), 0x0102)
+        self.assertEqual(cpu.cycles, 0x100 + 20)
+
+    def test_halt_wakes_on_timer_interrupt(self):
+        for engine in ENGINES:
+            cpu = new_cpu(EI_HALT, engine)
+            Timer(cpu)
+            cpu.write8(TIMA, 0xf0)
+            cpu.write8(TAC, 0x05)
+            cpu.write8(IE, TIMER)
+
+            cpu.run(1000)
+
+            self.assertEqual(cpu.halted, 0)
+            self.assertEqual(cpu.PC, 0x0050)
+            self.assertEqual(cpu.read16(cpu.SP), 0x0102)
+            self.assertEqual(cpu.M[IF] & TIMER, 0)
+
+    def test_halt_with_ime_off_continues(self):
+        # DI; HALT; INC B wakes without servicing the interrupt
+        for engine in ENGINES:
+            cpu = new_cpu((0xf3, 0x76, 0x04), engine)
+            Timer(cpu)
+            cpu.write8(TIMA, 0xf0)
+            cpu.write8(TAC, 0x05)
+            cpu.write8(IE, TIMER)
+
+            cpu.run(1000)
+
+            self.assertEqual(cpu.halted, 0)
+            self.assertEqual(cpu.B, 1)
+            self.assertEqual(cpu.PC, 0x0103)
+            self.assertEqual(cpu.SP, 0xfffe)
+            self.assertEqual(cpu.M[IF] & TIMER, TIMER)
+
+    def test_halt_with_interrupt_already_pending(self):
+        # DI; HALT; INC B
+        cpu = new_cpu((0xf3, 0x76, 0x04))
+        cpu.write8(IE, TIMER)
+        cpu.write8(IF, TIMER)
+
+        cpu.run(100)
+
+        self.assertEqual(cpu.halted, 0)
+        self.assertEqual(cpu.B, 1)
+
+    def test_halt_ignores_disabled_interrupts(self):
+        cpu = new_cpu(EI_HALT)
+        cpu.write8(IE, JOYPAD)
+        cpu.write8(IF, TIMER)
+
+        cpu.run(1000)
+
+        self.assertEqual(cpu.halted, HALTED)
+        self.assertEqual(cpu.PC, 0x0102)
+
+    def test_stop_waits_for_joypad(self):
+        # EI; STOP 0
+        for engine in ENGINES:
+            cpu = new_cpu((0xfb, 0x10, 0x00), engine)
+            Timer(cpu)
+            cpu.write8(TAC, 0x05)
+            cpu.write8(IE, TIMER | JOYPAD)
+
+            cpu.run(10000)
+
+            self.assertEqual(cpu.halted, STOPPED)
+            self.assertEqual(cpu.PC, 0x0103)
+
+            # The timer interrupt is pending too and would be serviced first
+            cpu.write8(IE, JOYPAD)
+            cpu.request_interrupt(JOYPAD)
+            cpu.run(100)
+
+            self.assertEqual(cpu.halted, 0)
+            self.assertEqual(cpu.PC, 0x0060)
+            self.assertEqual(cpu.read16(cpu.SP), 0x0103)
+
+if __name__ == '__main__':
+    unittest.main()
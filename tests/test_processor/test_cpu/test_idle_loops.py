@@ -0,0 +1,187 @@
+from hypothesis import given, settings
+from hypothesis.strategies import integers, lists
+
+from processor.cpu import CPU, IE, TIMER
+from processor.idle import analyse
+from processor.timer import Timer
+
+from helpers import ENGINES, count_instructions
+
+import unittest
+
+# Waits for 0xC000 to become 1, then INC B and JR -2 forever
+#   0100 LD A, (0xc000); CP 1; JR NZ, 0x0100; INC B; JR 0x0108
+WAIT_FLAG = (0xfa, 0x00, 0xc0, 0xfe, 0x01, 0x20, 0xf9, 0x04, 0x18, 0xfe)
+
+def new_cpu(program, engine='interpreter', detect=True):
+    cpu = CPU(engine=engine)
+    cpu.load(0x0100, bytes(program))
+    cpu.PC, cpu.SP = 0x0100, 0xfffe
+    if not detect:
+        cpu.busy_loops.update(range(0x10000))
+    return cpu
+
+def state(cpu):
+    return (cpu.cycles, cpu.PC, cpu.A, cpu.B, cpu.F, cpu.SP, cpu.M[0xc000])
+
+def set_flag(cpu, cycle):
+    cpu.scheduler.schedule(cycle, lambda cycle: cpu.M.__setitem__(0xc000, 1))
+
+class Analyse_Test(unittest.TestCase):
+    def loop(self, body, jr=0x20):
+        mem = bytearray(0x10000)
+        mem[0x0200:0x0200 + len(body)] = bytes(body)
+        pc = 0x0200 + len(body)
+        mem[pc:pc+2] = bytes([jr, (-2 - len(body)) & 0xff])
+        return analyse(mem, pc)
+
+    def test_poll_ly(self):
+        # LDH A, (0x44); CP 0x90
+        loop = self.loop([0xf0, 0x44, 0xfe, 0x90])
+
+        self.assertEqual(loop.cycles, 12 + 8 + 12)
+        self.assertEqual(loop.reads, (0xff44,))
+
+    def test_jr_to_itself(self):
+        loop = self.loop([], jr=0x18)
+
+        self.assertEqual(loop.cycles, 12)
+        self.assertEqual(loop.reads, ())
+
+    def test_bit_through_hl(self):
+        # BIT 1, (HL)
+        loop = self.loop([0xcb, 0x4e])
+
+        self.assertEqual(loop.cycles, 12 + 12)
+        self.assertEqual(loop.reads, ('(HL)',))
+
+    def test_not_idle(self):
+        for body in (
+                [0x05],                 # DEC B: counts down
+                [0x2a, 0xb7],           # LD A, (HL+); OR A: moves HL
+                [0xe0, 0x80],           # LDH (0x80), A: writes memory
+                [0x78, 0x46, 0xb7],     # LD A, B; LD B, (HL); OR A: B carried over
+                [0xce, 0x00],           # ADC A, 0: A carried over
+                [0xf3],                 # DI
+                [0xcd, 0x00, 0x02]):    # CALL
+            self.assertIsNone(self.loop(body), body)
+
+    def test_forward_jump(self):
+        mem = bytearray(0x10000)
+        mem[0x0200:0x0202] = bytes([0x20, 0x02])
+
+        self.assertIsNone(analyse(mem, 0x0200))
+
+class IdleLoops_Test(unittest.TestCase):
+    def test_skips_iterations(self):
+        for engine in ENGINES:
+            cpu = new_cpu(WAIT_FLAG, engine)
+            set_flag(cpu, 100000)
+            counter = count_instructions(cpu)
+
+            cpu.run(100100)
+
+            self.assertEqual(cpu.B, 1)
+            self.assertIn(0x0100 + 5, cpu.idle_loops)
+            if engine == 'interpreter':
+                self.assertLess(counter[0], 100)
+
+    def test_keeps_skipping_across_unrelated_events(self):
+        for engine in ENGINES:
+            cpu = new_cpu(WAIT_FLAG, engine)
+            def tick(cycle):
+                cpu.M[0xc001] = (cpu.M[0xc001] + 1) & 0xff
+                cpu.scheduler.schedule(cycle + 100, tick)
+            cpu.scheduler.schedule(100, tick)
+            counter = count_instructions(cpu)
+
+            cpu.run(100000)
+
+            # Each event stops the loop part way round, and that part (at
+            # most its 3 instructions) is executed
+            self.assertEqual(cpu.B, 0)
+            if engine == 'interpreter':
+                self.assertLessEqual(counter[0], 3 * (100000 // 100) + 20)
+
+    @settings(max_examples=50, deadline=None)
+    @given(integers(0, 20000), lists(integers(1, 5000), min_size=1, max_size=8))
+    def test_matches_executing_every_iteration(self, cycle, runs):
+        for engine in ENGINES:
+            fast, slow = new_cpu(WAIT_FLAG, engine), new_cpu(WAIT_FLAG, engine, detect=False)
+            for cpu in (fast, slow):
+                set_flag(cpu, cycle)
+
+            for cycles in runs:
+                self.assertEqual(fast.run(cycles), slow.run(cycles))
+                self.assertEqual(state(fast), state(slow))
+
+    def test_interrupt_in_loop(self):
+        # EI, then wait for the timer handler at 0x0050 to set the flag:
+        #   0050 LD A, 1; LD (0xc000), A; RETI
+        for engine in ENGINES:
+            results = []
+            for detect in (True, False):
+                cpu = new_cpu((0xfb,) + WAIT_FLAG, engine, detect)
+                cpu.load(0x0050, bytes([0x3e, 0x01, 0xea, 0x00, 0xc0, 0xd9]))
+                Timer(cpu)
+                cpu.write8(0xff07, 0x05)
+                cpu.write8(IE, TIMER)
+
+                cpu.run(1000)
+                results.append(state(cpu))
+                cpu.run(10000)
+                results.append(state(cpu))
+
+            self.assertEqual(results[:2], results[2:])
+            self.assertEqual(results[-1][3], 1)
+
+    def test_interrupt_between_writes(self):
+        # A is written twice each time round, so it only holds its
+        # end-of-iteration value at the top. Timer interrupts (just RETI)
+        # land all over the loop, which must never be left:
+        #   0100 EI
+        #   0101 LDH A, (0x80); ADD A, 1; JR Z, 0x0101; INC B; JR -2
+        for engine in ENGINES:
+            results = []
+            for detect in (True, False):
+                cpu = new_cpu((0xfb, 0xf0, 0x80, 0xc6, 0x01, 0x28, 0xfa, 0x04, 0x18, 0xfe),
+                              engine, detect)
+                cpu.M[0xff80] = 0xff
+                cpu.load(0x0050, bytes([0xd9]))
+                Timer(cpu)
+                cpu.write8(0xff07, 0x05)
+                cpu.write8(IE, TIMER)
+
+                for cycles in (1000, 3333, 10007, 50000):
+                    cpu.run(cycles)
+                    results.append(state(cpu))
+
+            self.assertEqual(results[:4], results[4:])
+            self.assertEqual(results[-1][3], 0)
+
+    def test_polling_div_is_not_skipped(self):
+        # LDH A, (0x04); CP 0x10; JR NZ; then INC B; JR -3 counts forever
+        program = (0xf0, 0x04, 0xfe, 0x10, 0x20, 0xfa, 0x04, 0x18, 0xfd)
+        results = []
+        for detect in (True, False):
+            cpu = new_cpu(program, detect=detect)
+            Timer(cpu)
+            counter = count_instructions(cpu)
+
+            cpu.run(5000)
+            results.append((state(cpu), counter[0]))
+
+        self.assertEqual(results[0], results[1])
+        self.assertGreater(results[0][0][3], 0)
+
+    def test_load_forgets_loops(self):
+        cpu = new_cpu(WAIT_FLAG)
+        cpu.run(1000)
+        self.assertTrue(cpu.idle_loops)
+
+        cpu.load(0x0100, bytes(WAIT_FLAG))
+
+        self.assertFalse(cpu.idle_loops)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+from processor.cpu import IE, IF, JOYPAD, TIMER, VBLANK
+from processor.timer import TAC, TIMA, Timer
+
+from helpers import ENGINES, new_cpu
+
+import unittest
+
+# EI; NOP; NOP
+EI_NOPS = (0xfb, 0x00, 0x00)
+
+class Interrupts_Test(unittest.TestCase):
+    def test_ei_is_delayed_by_one_instruction(self):
+        # EI; NOP; NOP with the timer interrupt already pending
+        for engine in ENGINES:
+            cpu = new_cpu(EI_NOPS, engine)
+            cpu.write8(IE, TIMER)
+            cpu.write8(IF, TIMER)
+
+            cpu.run(100)
+
+            self.assertEqual(cpu.PC, 0x0050)
+            self.assertEqual(cpu.read16(cpu.SP), 0x0102)
+            self.assertEqual(cpu.M[IF], 0)
+            self.assertEqual(cpu.ime, 0)
+
+    def test_di_after_ei(self):
+        # EI; DI
+        for engine in ENGINES:
+            cpu = new_cpu((0xfb, 0xf3), engine)
+            cpu.write8(IE, TIMER)
+            cpu.write8(IF, TIMER)
+
+            cpu.run(100)
+
+            self.assertEqual(cpu.SP, 0xfffe)
+            self.assertEqual(cpu.PC, 0x0102)
+            self.assertEqual(cpu.ime, 0)
+
+    def test_priority(self):
+        cpu = new_cpu(EI_NOPS)
+        cpu.write8(IE, 0x1f)
+        cpu.write8(IF, JOYPAD | TIMER | VBLANK)
+
+        cpu.run(100)
+
+        self.assertEqual(cpu.PC, 0x0040)
+        self.assertEqual(cpu.M[IF], JOYPAD | TIMER)
+
+    def test_masked(self):
+        # Requested but not enabled in IE, or IME off
+        cpu = new_cpu(EI_NOPS)
+        cpu.write8(IE, VBLANK)
+        cpu.write8(IF, TIMER)
+        cpu.run(100)
+
+        self.assertEqual(cpu.PC, 0x0103)
+
+        cpu = new_cpu((0x00,))
+        cpu.write8(IE, TIMER)
+        cpu.write8(IF, TIMER)
+        cpu.run(100)
+
+        self.assertEqual(cpu.PC, 0x0101)
+        self.assertEqual(cpu.M[IF], TIMER)
+
+    def test_reti(self):
+        # The VBLANK handler is RETI; the timer is serviced as soon as it returns
+        for engine in ENGINES:
+            cpu = new_cpu(EI_NOPS, engine)
+            cpu.load(0x0040, bytes([0xd9]))
+            cpu.write8(IE, VBLANK | TIMER)
+            cpu.write8(IF, VBLANK | TIMER)
+
+            cpu.run(200)
+
+            self.assertEqual(cpu.PC, 0x0050)
+            self.assertEqual(cpu.read16(cpu.SP), 0x0102)
+            self.assertEqual(cpu.M[IF], 0)
+
+    def test_run_until(self):
+        cpu = new_cpu(EI_NOPS)
+        cpu.write8(IE, TIMER)
+        cpu.write8(IF, TIMER)
+
+        cpu.run_until(lambda cpu: cpu.PC == 0x0050, 100)
+
+        self.assertEqual(cpu.read16(cpu.SP), 0x0102)
+
+    def test_requested_by_timer(self):
+        # TIMA 0xFF at 16 cycles per increment overflows 16 cycles in,
+        # while the CPU sits in its idle loop
+        for engine in ENGINES:
+            cpu = new_cpu(EI_NOPS, engine)
+            Timer(cpu)
+            cpu.write8(IE, TIMER)
+            cpu.write8(TIMA, 0xff)
+            cpu.write8(TAC, 0x05)
+
+            cpu.run_until(lambda cpu: cpu.PC == 0x0050, 1000)
+
+            self.assertEqual(cpu.PC, 0x0050)
+            self.assertLess(cpu.cycles, 16 + 20 + 32 * 12)
+
+    def test_no_check_without_changes(self):
+        # Once checked, nothing is looked at again until IE, IF or IME change
+        cpu = new_cpu((0x00,))
+        cpu.run(100)
+
+        self.assertEqual(cpu._irq, 0)
+
+        cpu.write8(IF, TIMER)
+        self.assertEqual(cpu._irq, 1)
+
+        cpu.run(100)
+        cpu.write8(IF, TIMER)
+        self.assertEqual(cpu._irq, 0)
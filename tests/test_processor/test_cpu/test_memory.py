@@ -0,0 +1,53 @@
+from hypothesis import given
+from hypothesis.strategies import binary, integers
+
+from processor.cpu import CPU
+from processor.memory import MEMORY_SIZE
+
+import unittest
+
+class Memory_Test(unittest.TestCase):
+    def test_default_memory(self):
+        cpu = CPU()
+
+        self.assertIsInstance(cpu.M, bytearray)
+        self.assertEqual(len(cpu.M), MEMORY_SIZE)
+        self.assertFalse(any(cpu.M))
+
+    def test_injected_memory(self):
+        memory = [0x00, 0x01]
+        cpu = CPU(memory)
+
+        self.assertIs(cpu.M, memory)
+
+    @given(integers(min_value=0x0000, max_value=0xff00), binary(min_size=1, max_size=0xff))
+    def test_load(self, address, data):
+        cpu = CPU()
+
+        cpu.load(address, data)
+
+        self.assertEqual(bytes(cpu.M[address:address+len(data)]), data)
+        self.assertEqual(len(cpu.M), MEMORY_SIZE)
+
+    def test_view(self):
+        cpu = CPU()
+        vram = cpu.view('vram')
+
+        self.assertEqual(len(vram), 0x2000)
+
+        vram[0] = 0xff
+        self.assertEqual(cpu.M[0x8000], 0xff)
+
+        cpu.M[0x9fff] = 0x12
+        self.assertEqual(vram[-1], 0x12)
+
+    def test_snapshot_restore(self):
+        cpu = CPU()
+        cpu.M[0xc000] = 0x12
+
+        snapshot = cpu.snapshot()
+        cpu.M[0xc000] = 0x34
+        cpu.restore(snapshot)
+
+        self.assertEqual(cpu.M[0xc000], 0x12)
+        self.assertIsInstance(cpu.M, bytearray)
@@ -0,0 +1,43 @@
+from processor.cpu import CPU
+
+import unittest
+
+class Register_File_Test(unittest.TestCase):
+    def test_no_instance_dict(self):
+        cpu = CPU([])
+
+        self.assertFalse(hasattr(cpu, '__dict__'))
+
+        with self.assertRaises(AttributeError):
+            cpu.FZ = 1
+
+    def test_slots_back_properties(self):
+        cpu = CPU([])
+
+        cpu._b, cpu._c = 0x12, 0x34
+        cpu._h, cpu._l = 0xab, 0xcd
+        cpu._sp, cpu._pc = 0xfffe, 0x0100
+
+        self.assertEqual(cpu.BC, 0x1234)
+        self.assertEqual(cpu.HL, 0xabcd)
+        self.assertEqual(cpu.SP, 0xfffe)
+        self.assertEqual(cpu.PC, 0x0100)
+
+        cpu.DE = 0x5678
+
+        self.assertEqual(cpu._d, 0x56)
+        self.assertEqual(cpu._e, 0x78)
+
+    def test_flag_setters_clear(self):
+        cpu = CPU([])
+        cpu._f = 0xf0
+
+        cpu.F_Z = 0
+        cpu.F_C = 0
+
+        self.assertEqual(cpu._f, 0x60)
+
+        cpu.F_N = 0
+        cpu.F_H = 0
+
+        self.assertEqual(cpu._f, 0x00)
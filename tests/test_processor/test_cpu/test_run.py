@@ -0,0 +1,60 @@
+from hypothesis import given
+from hypothesis.strategies import integers
+
+from processor.cpu import CPU, CYCLES_PER_FRAME
+
+import unittest
+
+class Run_Test(unittest.TestCase):
+    @given(integers(min_value=1, max_value=0x1000))
+    def test_run(self, cycles):
+        cpu = CPU()
+
+        consumed = cpu.run(cycles)
+
+        # NOP sled, 4 cycles per instruction
+        self.assertEqual(consumed, (cycles + 3) // 4 * 4)
+        self.assertEqual(cpu.PC, consumed // 4)
+        self.assertEqual(cpu.cycles, consumed)
+
+    def test_run_overshoot(self):
+        # LD BC, d16 takes 12 cycles
+        cpu = CPU([0x01, 0x00, 0x00, 0x01, 0x00, 0x00])
+
+        consumed = cpu.run(13)
+
+        self.assertEqual(consumed, 24)
+        self.assertEqual(cpu.PC, 6)
+
+    def test_run_frame(self):
+        cpu = CPU()
+
+        first = cpu.run_frame()
+        second = cpu.run_frame()
+
+        self.assertGreaterEqual(first, CYCLES_PER_FRAME)
+        self.assertEqual(cpu.cycles, first + second)
+        self.assertLess(cpu.cycles - 2 * CYCLES_PER_FRAME, 4)
+
+    def test_run_until(self):
+        cpu = CPU()
+
+        consumed = cpu.run_until(lambda cpu: cpu.PC == 0x10, 0x1000)
+
+        self.assertEqual(consumed, 0x40)
+        self.assertEqual(cpu.PC, 0x10)
+
+    def test_run_until_max_cycles(self):
+        cpu = CPU()
+
+        consumed = cpu.run_until(lambda cpu: False, 0x40)
+
+        self.assertEqual(consumed, 0x40)
+        self.assertEqual(cpu.PC, 0x10)
+
+    def test_start(self):
+        cpu = CPU()
+
+        cpu.start(frames=3)
+
+        self.assertEqual(cpu.cycles, 3 * CYCLES_PER_FRAME)
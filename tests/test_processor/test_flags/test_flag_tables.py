@@ -0,0 +1,59 @@
+from hypothesis import given
+from hypothesis.strategies import integers
+
+from processor import flags
+
+import unittest
+
+def f(z, n, h, c):
+    return int(z) << 7 | int(n) << 6 | int(h) << 5 | int(c) << 4
+
+class Flag_Tables_Test(unittest.TestCase):
+    def test_sizes(self):
+        self.assertEqual(len(flags.INC), 0x100)
+        self.assertEqual(len(flags.ADD), 0x10000)
+        self.assertEqual(len(flags.ADC), 0x20000)
+        self.assertEqual(len(flags.DAA), 0x800)
+        self.assertEqual(len(flags.RL), 0x200)
+
+    def test_low_nibble_of_f_is_zero(self):
+        for table in (flags.INC, flags.DEC, flags.ADC, flags.SBC, flags.AND,
+                      flags.XOR, flags.OR, flags.DAA, flags.RR, flags.SWAP):
+            self.assertFalse(any(t & 0x0f for t in table))
+
+    def test_inc_dec(self):
+        for v in range(0x100):
+            r = (v + 1) & 0xff
+            self.assertEqual(flags.INC[v], r << 8 | f(r == 0, 0, (v & 0x0f) == 0x0f, 0))
+            r = (v - 1) & 0xff
+            self.assertEqual(flags.DEC[v], r << 8 | f(r == 0, 1, (v & 0x0f) == 0, 0))
+
+    @given(integers(min_value=0, max_value=0xff), integers(min_value=0, max_value=0xff),
+           integers(min_value=0, max_value=1))
+    def test_adc_sbc(self, a, v, carry):
+        r = a + v + carry
+        self.assertEqual(flags.ADC[carry << 16 | a << 8 | v],
+                         (r & 0xff) << 8 | f(r & 0xff == 0, 0, (a & 0xf) + (v & 0xf) + carry > 0xf, r > 0xff))
+
+        r = a - v - carry
+        self.assertEqual(flags.SBC[carry << 16 | a << 8 | v],
+                         (r & 0xff) << 8 | f(r & 0xff == 0, 1, (a & 0xf) - (v & 0xf) - carry < 0, r < 0))
+
+    @given(integers(min_value=0, max_value=0xff), integers(min_value=0, max_value=0xff))
+    def test_add_sub_match_carry_clear(self, a, v):
+        self.assertEqual(flags.ADD[a << 8 | v], flags.ADC[a << 8 | v])
+        self.assertEqual(flags.SUB[a << 8 | v], flags.SBC[a << 8 | v])
+
+    @given(integers(min_value=0, max_value=0xff), integers(min_value=0, max_value=0xff))
+    def test_logic(self, a, v):
+        self.assertEqual(flags.AND[a << 8 | v], (a & v) << 8 | f((a & v) == 0, 0, 1, 0))
+        self.assertEqual(flags.XOR[a << 8 | v], (a ^ v) << 8 | f((a ^ v) == 0, 0, 0, 0))
+        self.assertEqual(flags.OR[a << 8 | v], (a | v) << 8 | f((a | v) == 0, 0, 0, 0))
+
+    def test_shift_carry_in(self):
+        # RL 0x80 with carry set -> 0x01, carry out
+        self.assertEqual(flags.RL[0x100 | 0x80], 0x01 << 8 | f(0, 0, 0, 1))
+        # RR 0x01 with carry clear -> 0x00, Z and carry out
+        self.assertEqual(flags.RR[0x01], 0x00 << 8 | f(1, 0, 0, 1))
+        # Carry in is ignored by the others
+        self.assertEqual(flags.SRL[0x100 | 0x02], flags.SRL[0x02])
@@ -0,0 +1,91 @@
+from processor.cpu import CPU
+from processor.op_codes import OPS, CB_OPS, UnimplementedOpcode, process, unimplemented, unimplemented_cb
+from processor import operations
+
+import unittest
+
+class Dispatch_Test(unittest.TestCase):
+    def test_table_size(self):
+        self.assertEqual(len(OPS), 0x100)
+        self.assertEqual(len(CB_OPS), 0x100)
+
+    def test_table_entries(self):
+        self.assertIs(OPS[0x00], operations.nop)
+        self.assertIs(OPS[0x08], operations.ld_a16_sp)
+        self.assertIs(OPS[0xaf], operations.xor_a)
+
+    def test_execute_next_instruction(self):
+        cpu = CPU([0x00, 0x04])
+
+        self.assertEqual(cpu.execute_next_instruction(), 4)
+        self.assertEqual(cpu.PC, 1)
+
+        self.assertEqual(cpu.execute_next_instruction(), 4)
+        self.assertEqual(cpu.B, 1)
+        self.assertEqual(cpu.PC, 2)
+
+    def test_process(self):
+        cpu = CPU([0x00])
+
+        self.assertEqual(process(0x00, cpu), 4)
+        self.assertEqual(cpu.PC, 1)
+
+    def test_ld_a16_sp_dispatch(self):
+        cpu = CPU()
+        cpu.M[0:3] = [0x08, 0x00, 0xc0]
+        cpu.SP = 0x1234
+
+        self.assertEqual(cpu.execute_next_instruction(), 20)
+        self.assertEqual(cpu.M[0xc000], 0x34)
+        self.assertEqual(cpu.M[0xc001], 0x12)
+
+    def test_unimplemented(self):
+        cpu = CPU([0xd3])
+
+        with self.assertRaises(UnimplementedOpcode):
+            cpu.execute_next_instruction()
+
+    def test_unused_opcodes(self):
+        unused = [o for o, h in enumerate(OPS) if h is unimplemented]
+
+        self.assertEqual(unused, [0xd3, 0xdb, 0xdd, 0xe3, 0xe4, 0xeb, 0xec, 0xed, 0xf4, 0xfc, 0xfd])
+        self.assertNotIn(unimplemented_cb, CB_OPS)
+
+    def test_cb(self):
+        # SWAP A
+        cpu = CPU([0xcb, 0x37])
+        cpu.A = 0x12
+
+        self.assertEqual(cpu.execute_next_instruction(), 8)
+        self.assertEqual(cpu.A, 0x21)
+        self.assertEqual(cpu.PC, 2)
+
+    def test_operands_wrap(self):
+        # LD BC, 0x1234 at 0xFFFF takes its operand from 0x0000-0x0001
+        cpu = CPU()
+        cpu.M[0xffff] = 0x01
+        cpu.M[0x0000:0x0002] = bytes([0x34, 0x12])
+        cpu.PC = 0xffff
+
+        self.assertEqual(cpu.execute_next_instruction(), 12)
+        self.assertEqual(cpu.BC, 0x1234)
+        self.assertEqual(cpu.PC, 0x0002)
+
+        # SWAP A at 0xFFFF
+        cpu.M[0xffff], cpu.M[0x0000] = 0xcb, 0x37
+        cpu.A, cpu.PC = 0x12, 0xffff
+
+        cpu.execute_next_instruction()
+        self.assertEqual(cpu.A, 0x21)
+        self.assertEqual(cpu.PC, 0x0001)
+
+    def test_cb_through_cpu_table(self):
+        # A swapped cb_ops is used by the interpreter as well
+        cpu = CPU([0xcb, 0x37])
+        called = []
+        cpu.cb_ops = tuple((lambda h: lambda cpu, mem: called.append(h) or h(cpu, mem))(h)
+                           for h in CB_OPS)
+
+        cpu.run(8)
+
+        self.assertEqual(called, [CB_OPS[0x37]])
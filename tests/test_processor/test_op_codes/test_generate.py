@@ -0,0 +1,56 @@
+import os
+import unittest
+
+from processor import generate, opcode_spec, operations
+from processor.op_codes import OPS, CB_OPS, LENGTHS
+
+class Generate_Test(unittest.TestCase):
+    def test_checked_in_module_is_current(self):
+        path = os.path.join(os.path.dirname(operations.__file__), 'operations.py')
+
+        with open(path) as f:
+            self.assertEqual(f.read(), generate.generate(),
+                             'operations.py is stale, run: python -m processor.generate')
+
+    def test_every_spec_entry_dispatched(self):
+        for opcode, (mnemonic, operands, length, cycles, flags) in opcode_spec.BASE.items():
+            if mnemonic == 'PREFIX':
+                continue
+            self.assertEqual(OPS[opcode].__name__, generate.handler_name(mnemonic, operands))
+            self.assertEqual(LENGTHS[opcode], length)
+
+        for opcode, (mnemonic, operands, length, cycles, flags) in opcode_spec.CB.items():
+            self.assertEqual(CB_OPS[opcode].__name__, generate.handler_name(mnemonic, operands))
+
+    def test_handler_names(self):
+        self.assertEqual(generate.handler_name('LD', ('(HL+)', 'A')), 'ld_ahli_a')
+        self.assertEqual(generate.handler_name('LD', ('A', '(HL-)')), 'ld_a_ahld')
+        self.assertEqual(generate.handler_name('LD', ('HL', 'SP+r8')), 'ld_hl_sp_r8')
+        self.assertEqual(generate.handler_name('BIT', ('7', '(HL)')), 'bit_7_ahl')
+        self.assertEqual(generate.handler_name('RST', ('38H',)), 'rst_38h')
+
+    def test_aliases(self):
+        self.assertIs(operations.ld_bc_a, operations.ld_abc_a)
+        self.assertIs(operations.ld_a16_sp, operations.ld_aa16_sp)
+
+    def test_cycles(self):
+        # Unconditional handlers return the spec's cycle count without
+        # touching anything but registers and flat memory
+        from processor.cpu import CPU
+
+        for opcode, (mnemonic, operands, length, cycles, flags) in opcode_spec.BASE.items():
+            if mnemonic in ('PREFIX',) or isinstance(cycles, tuple):
+                continue
+            cpu = CPU()
+            cpu.load(0xc000, bytes([opcode, 0x00, 0xd0]))
+            cpu.PC, cpu.SP = 0xc000, 0xdff0
+
+            self.assertEqual(OPS[opcode](cpu, cpu.M), cycles, hex(opcode))
+
+        for opcode, (mnemonic, operands, length, cycles, flags) in opcode_spec.CB.items():
+            cpu = CPU()
+            cpu.load(0xc000, bytes([0xcb, opcode]))
+            cpu.PC = 0xc000
+
+            self.assertEqual(cpu.execute_next_instruction(), cycles, hex(opcode))
+            self.assertEqual(cpu.PC, 0xc002)
@@ -22,7 +22,7 @@ class DEC_B_Test(unittest.TestCase):
         self.assertEqual(cpu.A, 0)
         self.assertEqual(cpu.F_Z, b-1 & 0xff == 0)
         self.assertEqual(cpu.F_N, 1)
-        self.assertEqual(cpu.F_H, (b & 0x0f) - 1 > 0xff)
+        self.assertEqual(cpu.F_H, (b & 0x0f) == 0)
         self.assertEqual(cpu.F_C, 0)
         
         self.assertEqual(cpu.B, b-1 & 0xff)
@@ -46,14 +46,14 @@ class LD_A16_SP_Test(unittest.TestCase):
         self.assertEqual(cpu.SP, (sp_h << 8) | sp_l)
         
         self.assertEqual(cpu.M[(mem_h << 8) | mem_l], sp_l)        
-        self.assertEqual(cpu.M[((mem_h << 8) | mem_l)+1], sp_h)   
+        self.assertEqual(cpu.M[(((mem_h << 8) | mem_l)+1) & 0xffff], sp_h)   
         
         populated_m_locations = [
             0x00,
             0x01,
             0x02,
             (mem_h << 8) | mem_l,
-            ((mem_h << 8) | mem_l) + 1
+            (((mem_h << 8) | mem_l) + 1) & 0xffff
         ]
         
         x = [m for i,m in enumerate(cpu.M) if i not in populated_m_locations and m != 0x00]
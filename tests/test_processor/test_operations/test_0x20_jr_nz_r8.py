@@ -34,7 +34,7 @@ class JR_NZ_R8_Test(unittest.TestCase):
         self.assertEqual(cpu.DE, 0)
         self.assertEqual(cpu.HL, 0)
         
-        self.assertEqual(cpu.PC, 1)
+        self.assertEqual(cpu.PC, 2)
         self.assertEqual(cpu.SP, 0)
         
         self.assertEqual(cpu.M, [])
@@ -68,7 +68,8 @@ class JR_NZ_R8_Test(unittest.TestCase):
         self.assertEqual(cpu.DE, 0)
         self.assertEqual(cpu.HL, 0)
         
-        self.assertEqual(cpu.PC, r8)
+        # Signed offset, relative to the next instruction
+        self.assertEqual(cpu.PC, (2 + r8 - (r8 & 0x80) * 2) & 0xffff)
         self.assertEqual(cpu.SP, 0)
         
         self.assertEqual(cpu.M, memory)
\ No newline at end of file
@@ -0,0 +1,38 @@
+from hypothesis import given
+from hypothesis.strategies import integers
+
+from processor.cpu import CPU
+
+import unittest
+
+def bcd(n):
+    return (n // 10) << 4 | n % 10
+
+class DAA_Test(unittest.TestCase):
+    @given(integers(min_value=0, max_value=99), integers(min_value=0, max_value=99))
+    def test_daa_add(self, x, y):
+        # ADD A, B; DAA
+        cpu = CPU([0x80, 0x27])
+        cpu.A, cpu.B = bcd(x), bcd(y)
+
+        cpu.execute_next_instruction()
+        cycles = cpu.execute_next_instruction()
+
+        self.assertEqual(cycles, 4)
+        self.assertEqual(cpu.A, bcd((x + y) % 100))
+        self.assertEqual(cpu.F_C, int(x + y > 99))
+        self.assertEqual(cpu.F_Z, int((x + y) % 100 == 0))
+        self.assertEqual(cpu.F_H, 0)
+
+    @given(integers(min_value=0, max_value=99), integers(min_value=0, max_value=99))
+    def test_daa_sub(self, x, y):
+        # SUB B; DAA
+        cpu = CPU([0x90, 0x27])
+        cpu.A, cpu.B = bcd(x), bcd(y)
+
+        cpu.execute_next_instruction()
+        cpu.execute_next_instruction()
+
+        self.assertEqual(cpu.A, bcd((x - y) % 100))
+        self.assertEqual(cpu.F_C, int(x < y))
+        self.assertEqual(cpu.F_N, 1)
@@ -35,7 +35,7 @@ class LD_HL_D16_Test(unittest.TestCase):
         self.assertEqual(cpu.DE, 0)
         self.assertEqual(cpu.HL, 0)
         
-        self.assertEqual(cpu.PC, 1)
+        self.assertEqual(cpu.PC, 2)
         self.assertEqual(cpu.SP, 0)
         
         self.assertEqual(cpu.M, [])
@@ -72,7 +72,8 @@ class LD_HL_D16_Test(unittest.TestCase):
         self.assertEqual(cpu.DE, 0)
         self.assertEqual(cpu.HL, 0)
         
-        self.assertEqual(cpu.PC, pc)
+        # Signed offset, relative to the next instruction
+        self.assertEqual(cpu.PC, (2 + pc - (pc & 0x80) * 2) & 0xffff)
         self.assertEqual(cpu.SP, 0)
         
         self.assertEqual(cpu.M, memory)
\ No newline at end of file
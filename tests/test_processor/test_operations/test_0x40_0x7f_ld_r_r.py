@@ -0,0 +1,82 @@
+from hypothesis import given
+from hypothesis.strategies import integers
+
+from processor.cpu import CPU
+
+import unittest
+
+REGISTERS = ('B', 'C', 'D', 'E', 'H', 'L', None, 'A')
+
+class LD_R_R_Test(unittest.TestCase):
+    @given(
+        integers(min_value=0, max_value=7),
+        integers(min_value=0, max_value=7),
+        integers(min_value=0x00, max_value=0xff)
+    )
+    def test_ld_r_r(self, dst, src, value):
+        if REGISTERS[dst] is None or REGISTERS[src] is None:
+            return
+
+        cpu = CPU([0x40 | dst << 3 | src])
+        setattr(cpu, REGISTERS[src], value)
+
+        cycles = cpu.execute_next_instruction()
+
+        self.assertEqual(cycles, 4)
+        self.assertEqual(getattr(cpu, REGISTERS[dst]), value)
+        self.assertEqual(getattr(cpu, REGISTERS[src]), value)
+        self.assertEqual(cpu._f, 0)
+        self.assertEqual(cpu.PC, 1)
+
+    @given(integers(min_value=0, max_value=7), integers(min_value=0x00, max_value=0xff))
+    def test_ld_r_ahl(self, dst, value):
+        if REGISTERS[dst] is None:
+            return
+
+        cpu = CPU()
+        cpu.M[0x0000] = 0x46 | dst << 3
+        cpu.M[0xc123] = value
+        cpu.HL = 0xc123
+
+        cycles = cpu.execute_next_instruction()
+
+        self.assertEqual(cycles, 8)
+        self.assertEqual(getattr(cpu, REGISTERS[dst]), value)
+        self.assertEqual(cpu.PC, 1)
+
+    @given(integers(min_value=0, max_value=7), integers(min_value=0x00, max_value=0xff))
+    def test_ld_ahl_r(self, src, value):
+        if REGISTERS[src] is None:
+            return
+
+        cpu = CPU()
+        cpu.M[0x0000] = 0x70 | src
+        cpu.HL = 0xc123
+        setattr(cpu, REGISTERS[src], value)
+
+        cycles = cpu.execute_next_instruction()
+
+        self.assertEqual(cycles, 8)
+        self.assertEqual(cpu.M[cpu.HL], getattr(cpu, REGISTERS[src]))
+        self.assertEqual(cpu.PC, 1)
+
+    def test_ld_ahli_a(self):
+        cpu = CPU()
+        cpu.M[0x0000] = 0x22
+        cpu.A, cpu.HL = 0x12, 0xc0ff
+
+        cpu.execute_next_instruction()
+
+        self.assertEqual(cpu.M[0xc0ff], 0x12)
+        self.assertEqual(cpu.HL, 0xc100)
+
+    def test_ld_a_ahld(self):
+        cpu = CPU()
+        cpu.M[0x0000] = 0x3a
+        cpu.M[0xc100] = 0x34
+        cpu.HL = 0xc100
+
+        cpu.execute_next_instruction()
+
+        self.assertEqual(cpu.A, 0x34)
+        self.assertEqual(cpu.HL, 0xc0ff)
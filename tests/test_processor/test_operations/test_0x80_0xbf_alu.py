@@ -0,0 +1,70 @@
+from hypothesis import given
+from hypothesis.strategies import booleans, integers
+
+from processor.cpu import CPU
+
+import unittest
+
+def reference(op, a, v, carry):
+    # Returns (A, Z, N, H, C) after op
+    if op == 0: r, n, h, c = a + v, 0, (a & 0xf) + (v & 0xf) > 0xf, a + v > 0xff
+    if op == 1: r, n, h, c = a + v + carry, 0, (a & 0xf) + (v & 0xf) + carry > 0xf, a + v + carry > 0xff
+    if op in (2, 7): r, n, h, c = a - v, 1, (a & 0xf) < (v & 0xf), a < v
+    if op == 3: r, n, h, c = a - v - carry, 1, (a & 0xf) < (v & 0xf) + carry, a < v + carry
+    if op == 4: r, n, h, c = a & v, 0, 1, 0
+    if op == 5: r, n, h, c = a ^ v, 0, 0, 0
+    if op == 6: r, n, h, c = a | v, 0, 0, 0
+    r &= 0xff
+    return (a if op == 7 else r), int(r == 0), n, int(h), int(c)
+
+class ALU_Test(unittest.TestCase):
+    @given(
+        integers(min_value=0, max_value=7),
+        integers(min_value=0x00, max_value=0xff),
+        integers(min_value=0x00, max_value=0xff),
+        booleans()
+    )
+    def test_alu_b(self, op, a, b, carry):
+        cpu = CPU([0x80 | op << 3])
+        cpu.A, cpu.B, cpu.F_C = a, b, int(carry)
+
+        cycles = cpu.execute_next_instruction()
+
+        self.assertEqual(cycles, 4)
+        self.assertEqual((cpu.A, cpu.F_Z, cpu.F_N, cpu.F_H, cpu.F_C), reference(op, a, b, int(carry)))
+        self.assertEqual(cpu.B, b)
+        self.assertEqual(cpu.PC, 1)
+
+    @given(
+        integers(min_value=0, max_value=7),
+        integers(min_value=0x00, max_value=0xff),
+        integers(min_value=0x00, max_value=0xff),
+        booleans()
+    )
+    def test_alu_ahl(self, op, a, v, carry):
+        cpu = CPU()
+        cpu.M[0x0000] = 0x86 | op << 3
+        cpu.M[0xc000] = v
+        cpu.A, cpu.HL, cpu.F_C = a, 0xc000, int(carry)
+
+        cycles = cpu.execute_next_instruction()
+
+        self.assertEqual(cycles, 8)
+        self.assertEqual((cpu.A, cpu.F_Z, cpu.F_N, cpu.F_H, cpu.F_C), reference(op, a, v, int(carry)))
+        self.assertEqual(cpu.PC, 1)
+
+    @given(
+        integers(min_value=0, max_value=7),
+        integers(min_value=0x00, max_value=0xff),
+        integers(min_value=0x00, max_value=0xff),
+        booleans()
+    )
+    def test_alu_d8(self, op, a, d8, carry):
+        cpu = CPU([0xc6 | op << 3, d8])
+        cpu.A, cpu.F_C = a, int(carry)
+
+        cycles = cpu.execute_next_instruction()
+
+        self.assertEqual(cycles, 8)
+        self.assertEqual((cpu.A, cpu.F_Z, cpu.F_N, cpu.F_H, cpu.F_C), reference(op, a, d8, int(carry)))
+        self.assertEqual(cpu.PC, 2)
@@ -0,0 +1,72 @@
+from hypothesis import given
+from hypothesis.strategies import integers
+
+from processor.cpu import CPU
+
+import unittest
+
+class Stack_Test(unittest.TestCase):
+    @given(integers(min_value=0x0000, max_value=0xffff))
+    def test_push_pop(self, bc):
+        # PUSH BC; POP DE
+        cpu = CPU([0xc5, 0xd1] + [0x00] * 0xfffe)
+        cpu.BC, cpu.SP = bc, 0xfffe
+
+        self.assertEqual(cpu.execute_next_instruction(), 16)
+        self.assertEqual(cpu.SP, 0xfffc)
+        self.assertEqual(cpu.execute_next_instruction(), 12)
+
+        self.assertEqual(cpu.DE, bc)
+        self.assertEqual(cpu.SP, 0xfffe)
+        self.assertEqual(cpu.PC, 2)
+
+    def test_pop_af(self):
+        # The low nibble of F always reads as zero
+        cpu = CPU()
+        cpu.M[0x0000] = 0xf1
+        cpu.M[0xc000:0xc002] = bytes([0xff, 0x12])
+        cpu.SP = 0xc000
+
+        cpu.execute_next_instruction()
+
+        self.assertEqual(cpu.A, 0x12)
+        self.assertEqual(cpu._f, 0xf0)
+
+    def test_call_ret(self):
+        # CALL 0x0010; ...; 0x0010: RET
+        cpu = CPU()
+        cpu.load(0x0000, bytes([0xcd, 0x10, 0x00]))
+        cpu.M[0x0010] = 0xc9
+        cpu.SP = 0xfffe
+
+        self.assertEqual(cpu.execute_next_instruction(), 24)
+        self.assertEqual(cpu.PC, 0x0010)
+        self.assertEqual(cpu.read16(cpu.SP), 0x0003)
+
+        self.assertEqual(cpu.execute_next_instruction(), 16)
+        self.assertEqual(cpu.PC, 0x0003)
+        self.assertEqual(cpu.SP, 0xfffe)
+
+    def test_call_nz_not_taken(self):
+        cpu = CPU([0xc4, 0x10, 0x00])
+        cpu.F_Z = 1
+
+        self.assertEqual(cpu.execute_next_instruction(), 12)
+        self.assertEqual(cpu.PC, 3)
+
+    @given(integers(min_value=0, max_value=7))
+    def test_rst(self, n):
+        cpu = CPU()
+        cpu.M[0x0100] = 0xc7 | n << 3
+        cpu.PC, cpu.SP = 0x0100, 0xfffe
+
+        self.assertEqual(cpu.execute_next_instruction(), 16)
+        self.assertEqual(cpu.PC, n * 8)
+        self.assertEqual(cpu.read16(0xfffc), 0x0101)
+
+    @given(integers(min_value=0x0000, max_value=0xffff))
+    def test_jp_a16(self, address):
+        cpu = CPU([0xc3, address & 0xff, address >> 8])
+
+        self.assertEqual(cpu.execute_next_instruction(), 16)
+        self.assertEqual(cpu.PC, address)
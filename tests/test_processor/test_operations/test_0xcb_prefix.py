@@ -0,0 +1,68 @@
+from hypothesis import given
+from hypothesis.strategies import booleans, integers
+
+from processor.cpu import CPU
+
+import unittest
+
+def reference(op, v, carry):
+    # Returns (result, C) for the rotate and shift group
+    if op == 0: return ((v << 1) | (v >> 7)) & 0xff, v >> 7
+    if op == 1: return (v >> 1) | ((v & 1) << 7), v & 1
+    if op == 2: return ((v << 1) | carry) & 0xff, v >> 7
+    if op == 3: return (v >> 1) | (carry << 7), v & 1
+    if op == 4: return (v << 1) & 0xff, v >> 7
+    if op == 5: return (v >> 1) | (v & 0x80), v & 1
+    if op == 6: return ((v << 4) | (v >> 4)) & 0xff, 0
+    if op == 7: return v >> 1, v & 1
+
+class CB_Test(unittest.TestCase):
+    @given(integers(min_value=0, max_value=7), integers(min_value=0x00, max_value=0xff), booleans())
+    def test_shift_a(self, op, a, carry):
+        cpu = CPU([0xcb, op << 3 | 7])
+        cpu.A, cpu.F_C = a, int(carry)
+
+        cycles = cpu.execute_next_instruction()
+        result, c = reference(op, a, int(carry))
+
+        self.assertEqual(cycles, 8)
+        self.assertEqual(cpu.A, result)
+        self.assertEqual((cpu.F_Z, cpu.F_N, cpu.F_H, cpu.F_C), (int(result == 0), 0, 0, c))
+        self.assertEqual(cpu.PC, 2)
+
+    @given(integers(min_value=0, max_value=7), integers(min_value=0x00, max_value=0xff), booleans())
+    def test_shift_ahl(self, op, v, carry):
+        cpu = CPU()
+        cpu.load(0x0000, bytes([0xcb, op << 3 | 6]))
+        cpu.M[0xc000] = v
+        cpu.HL, cpu.F_C = 0xc000, int(carry)
+
+        cycles = cpu.execute_next_instruction()
+        result, c = reference(op, v, int(carry))
+
+        self.assertEqual(cycles, 16)
+        self.assertEqual(cpu.M[0xc000], result)
+        self.assertEqual(cpu.F_C, c)
+
+    @given(integers(min_value=0, max_value=7), integers(min_value=0x00, max_value=0xff), booleans())
+    def test_bit(self, bit, b, carry):
+        cpu = CPU([0xcb, 0x40 | bit << 3])
+        cpu.B, cpu.F_C = b, int(carry)
+
+        cycles = cpu.execute_next_instruction()
+
+        self.assertEqual(cycles, 8)
+        self.assertEqual((cpu.F_Z, cpu.F_N, cpu.F_H, cpu.F_C), (int(not b >> bit & 1), 0, 1, int(carry)))
+        self.assertEqual(cpu.B, b)
+
+    @given(integers(min_value=0, max_value=7), integers(min_value=0x00, max_value=0xff))
+    def test_res_set(self, bit, e):
+        cpu = CPU([0xcb, 0x83 | bit << 3, 0xcb, 0xc3 | bit << 3])
+        cpu.E = e
+
+        cpu.execute_next_instruction()
+        self.assertEqual(cpu.E, e & ~(1 << bit))
+
+        cpu.execute_next_instruction()
+        self.assertEqual(cpu.E, e | (1 << bit))
+        self.assertEqual(cpu._f, 0)
@@ -0,0 +1,134 @@
+from hypothesis import given
+from hypothesis.strategies import integers, lists
+
+from processor.cpu import CPU
+from processor.scheduler import NEVER, Scheduler
+
+from helpers import ENGINES
+
+import unittest
+
+class Scheduler_Test(unittest.TestCase):
+    @given(lists(integers(min_value=0, max_value=1000), max_size=20))
+    def test_fires_in_cycle_order(self, cycles):
+        scheduler = Scheduler()
+        fired = []
+
+        for cycle in cycles:
+            scheduler.schedule(cycle, fired.append)
+        scheduler.run_due(1000)
+
+        self.assertEqual(fired, sorted(cycles))
+        self.assertEqual(scheduler.next, NEVER)
+
+    def test_only_due_events_fire(self):
+        scheduler = Scheduler()
+        fired = []
+
+        scheduler.schedule(10, fired.append)
+        scheduler.schedule(20, fired.append)
+        scheduler.run_due(15)
+
+        self.assertEqual(fired, [10])
+        self.assertEqual(scheduler.next, 20)
+
+    def test_cancel(self):
+        scheduler = Scheduler()
+        fired = []
+
+        first = scheduler.schedule(10, fired.append)
+        scheduler.schedule(20, fired.append)
+        scheduler.cancel(first)
+
+        self.assertFalse(first.pending)
+        self.assertEqual(scheduler.next, 20)
+
+        scheduler.run_due(100)
+        self.assertEqual(fired, [20])
+
+    def test_reschedule(self):
+        scheduler = Scheduler()
+        fired = []
+
+        event = scheduler.schedule(10, fired.append)
+        scheduler.schedule(20, fired.append)
+        scheduler.reschedule(event, 30)
+
+        self.assertEqual(scheduler.next, 20)
+
+        scheduler.run_due(100)
+        self.assertEqual(fired, [20, 30])
+
+        # Fired events can be scheduled again
+        scheduler.reschedule(event, 110)
+        scheduler.run_due(110)
+        self.assertEqual(fired, [20, 30, 110])
+
+    def test_callback_schedules_due_event(self):
+        scheduler = Scheduler()
+        fired = []
+
+        def first(cycle):
+            fired.append(cycle)
+            scheduler.schedule(cycle + 1, fired.append)
+
+        scheduler.schedule(10, first)
+        scheduler.run_due(20)
+
+        self.assertEqual(fired, [10, 11])
+
+class Scheduled_Run_Test(unittest.TestCase):
+    def test_event_fires_during_run(self):
+        # NOPs, 4 cycles each
+        for engine in ENGINES:
+            cpu = CPU(engine=engine)
+            seen = []
+
+            cpu.scheduler.schedule(102, lambda cycle: seen.append((cycle, cpu.cycles, cpu.PC)))
+            consumed = cpu.run(400)
+
+            if engine == 'interpreter':
+                # Fired right after the instruction that crossed the deadline
+                self.assertEqual(consumed, 400)
+                self.assertEqual(seen, [(102, 104, 26)])
+            else:
+                # Blocks of 32 NOPs can run past the end
+                self.assertEqual(consumed, 512)
+                cycle, now, pc = seen[0]
+                self.assertEqual(cycle, 102)
+                self.assertTrue(102 <= now < 102 + 32 * 4)
+                self.assertEqual(pc, now // 4)
+
+    def test_periodic_event(self):
+        cpu = CPU()
+        fired = []
+
+        def tick(cycle):
+            fired.append(cycle)
+            cpu.scheduler.reschedule(event, cycle + 100)
+
+        event = cpu.scheduler.schedule(100, tick)
+        cpu.run(1000)
+
+        self.assertEqual(fired, [100, 200, 300, 400, 500, 600, 700, 800, 900, 1000])
+
+    def test_event_scheduled_mid_batch(self):
+        # LDH (0x50), A at 0x0010 writes a hooked register, which schedules
+        # an event for the current cycle. It fires straight after the write
+        # instead of waiting for the batch to reach the event at 1000.
+        for engine in ENGINES:
+            cpu = CPU(engine=engine)
+            cpu.load(0x0010, bytes([0xe0, 0x50]))
+            fired = []
+
+            def fire(cycle):
+                fired.append((cycle, cpu.cycles))
+
+            cpu.bus.io.hook(0xff50, write=lambda value: cpu.scheduler.schedule(cpu.cycles, fire))
+            cpu.scheduler.schedule(1000, lambda cycle: None)
+            cpu.run(400)
+
+            self.assertEqual(len(fired), 1)
+            self.assertLess(fired[0][1], 200)
+            if engine == 'interpreter':
+                self.assertEqual(fired, [(16 * 4, 16 * 4 + 12)])
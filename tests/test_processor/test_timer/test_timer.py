@@ -0,0 +1,138 @@
+from hypothesis import given, settings
+from hypothesis.strategies import integers, lists, one_of, tuples, just
+
+from processor.cpu import CPU, IF
+from processor.timer import DIV, TAC, TIMA, TMA, Timer
+
+import unittest
+
+class Reference:
+    # Ticks the internal counter one cycle at a time
+    BITS = (9, 3, 5, 7)
+
+    def __init__(self):
+        self.counter = self.tima = self.tma = self.tac = self.interrupts = 0
+
+    def bit(self):
+        return self.tac & 0x04 and self.counter >> self.BITS[self.tac & 0x03] & 1
+
+    def increment(self):
+        self.tima += 1
+        if self.tima > 0xff:
+            self.tima = self.tma
+            self.interrupts += 1
+
+    def run(self, cycles):
+        for _ in range(cycles):
+            before = self.bit()
+            self.counter = (self.counter + 1) & 0xffff
+            if before and not self.bit():
+                self.increment()
+
+    def write(self, register, value):
+        if register == DIV:
+            if self.bit():
+                self.increment()
+            self.counter = 0
+        elif register == TIMA:
+            self.tima = value
+        elif register == TMA:
+            self.tma = value
+        else:
+            self.tac = value & 0x07
+
+def new_cpu():
+    # NOPs forever, so run() stops exactly on a multiple of 4 cycles
+    cpu = CPU()
+    Timer(cpu)
+    return cpu
+
+def interrupts(cpu):
+    requested = cpu.M[IF] >> 2 & 1
+    cpu.M[IF] = 0
+    return requested
+
+class Timer_Test(unittest.TestCase):
+    def test_div(self):
+        cpu = new_cpu()
+
+        cpu.run(0x400)
+        self.assertEqual(cpu.read8(DIV), 0x04)
+
+        cpu.write8(DIV, 0x99)
+        self.assertEqual(cpu.read8(DIV), 0x00)
+
+        cpu.run(0x100)
+        self.assertEqual(cpu.read8(DIV), 0x01)
+
+    def test_tima_frequencies(self):
+        for tac, period in ((0x04, 1024), (0x05, 16), (0x06, 64), (0x07, 256)):
+            cpu = new_cpu()
+            cpu.write8(TAC, tac)
+
+            cpu.run(period * 10)
+
+            self.assertEqual(cpu.read8(TIMA), 10)
+            self.assertEqual(cpu.read8(TAC), 0xf8 | tac)
+
+    def test_stopped(self):
+        cpu = new_cpu()
+        cpu.write8(TIMA, 0x12)
+        cpu.write8(TAC, 0x01)
+
+        cpu.run(1000)
+
+        self.assertEqual(cpu.read8(TIMA), 0x12)
+
+    def test_overflow_is_one_event(self):
+        # TIMA 0xFE, TMA 0x80, 16-cycle period: overflows at cycle 32 and
+        # every 128 increments after that
+        cpu = new_cpu()
+        cpu.write8(TMA, 0x80)
+        cpu.write8(TIMA, 0xfe)
+        cpu.write8(TAC, 0x05)
+
+        self.assertEqual(cpu.scheduler.next, 32)
+
+        cpu.run(32)
+        self.assertEqual(cpu.read8(TIMA), 0x80)
+        self.assertEqual(interrupts(cpu), 1)
+        self.assertEqual(cpu.scheduler.next, 32 + 128 * 16)
+
+        cpu.run(128 * 16 - 4)
+        self.assertEqual(cpu.read8(TIMA), 0xff)
+        self.assertEqual(interrupts(cpu), 0)
+
+    def test_disabling_cancels_overflow(self):
+        cpu = CPU()
+        timer = Timer(cpu)
+
+        cpu.write8(TAC, 0x05)
+        self.assertTrue(timer.overflow.pending)
+
+        cpu.write8(TAC, 0x00)
+        self.assertFalse(timer.overflow.pending)
+
+    @settings(max_examples=50, deadline=None)
+    @given(lists(one_of(
+        tuples(just('run'), integers(min_value=1, max_value=600)),
+        tuples(integers(min_value=DIV, max_value=TAC), integers(min_value=0, max_value=0xff)),
+    ), max_size=25))
+    def test_matches_cycle_by_cycle_reference(self, steps):
+        cpu, reference = new_cpu(), Reference()
+
+        for register, value in steps:
+            if register == 'run':
+                cpu.run(value * 4)
+                reference.run(value * 4)
+            else:
+                cpu.write8(register, value)
+                reference.write(register, value)
+
+            # IF only records that at least one overflow happened
+            self.assertEqual(interrupts(cpu), int(reference.interrupts > 0))
+            reference.interrupts = 0
+
+            self.assertEqual(cpu.read8(DIV), reference.counter >> 8)
+            self.assertEqual(cpu.read8(TIMA), reference.tima)
+            self.assertEqual(cpu.read8(TMA), reference.tma)
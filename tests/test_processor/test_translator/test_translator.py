@@ -0,0 +1,124 @@
+from processor.cpu import CPU
+
+from helpers import ENGINES
+
+import unittest
+
+# LD BC, 0x1234; INC B; INC C; INC BC; LD (BC), A; LD A, (BC); LD (0xC000), SP;
+# LD DE, 0x0001; LD HL, 0x0000; ADD HL, BC; DEC BC; JR NZ, 0x00
+PROGRAM = bytes([
+    0x01, 0x34, 0x12,
+    0x04,
+    0x0c,
+    0x03,
+    0x02,
+    0x0a,
+    0x08, 0x00, 0xc0,
+    0x11, 0x01, 0x00,
+    0x21, 0x00, 0x00,
+    0x09,
+    0x0b,
+    0x20, 0x00,
+])
+
+def state(cpu):
+    return (cpu.A, cpu.B, cpu.C, cpu.D, cpu.E, cpu.H, cpu.L, cpu._f, cpu.SP, cpu.PC, cpu.snapshot())
+
+class Translator_Test(unittest.TestCase):
+    def test_matches_interpreter(self):
+        interpreter = CPU()
+        translator = CPU(engine='translator')
+
+        for cpu in (interpreter, translator):
+            cpu.load(0x0000, PROGRAM)
+            cpu.SP = 0xfffe
+
+        # One block of the translator against the same cycles interpreted
+        consumed = translator.run(1)
+        interpreter.run(consumed)
+
+        self.assertEqual(translator.cycles, interpreter.cycles)
+        self.assertEqual(state(translator), state(interpreter))
+
+    def test_nop_run(self):
+        # 32 NOPs fill a block without inlining a single statement
+        #   NOP x32; INC B; JR -2
+        program = bytes([0x00] * 32 + [0x04, 0x18, 0xfe])
+        results = []
+        for engine in ENGINES:
+            cpu = CPU(engine=engine)
+            cpu.load(0x0000, program)
+            cpu.run(1000)
+            results.append((cpu.B, cpu.PC))
+
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(results[1], (1, 0x0021))
+        self.assertLessEqual(len(cpu.translator.blocks), 3)
+
+    def test_block(self):
+        cpu = CPU(engine='translator')
+        cpu.load(0x0000, PROGRAM)
+
+        block = cpu.translator.translate(0x0000)
+
+        # Everything up to the branch is inlined, the branch itself is called
+        self.assertEqual(block.source.count('_ops['), 1)
+        self.assertEqual(block(cpu, cpu.M), 116)
+
+    def test_cache(self):
+        cpu = CPU(engine='translator')
+        cpu.load(0x0000, PROGRAM)
+
+        cpu.run(1)
+        block = cpu.translator.blocks[0x0000]
+        cpu.PC = 0x0000
+        cpu.run(1)
+
+        self.assertIs(cpu.translator.blocks[0x0000], block)
+
+    def test_invalidated_by_write(self):
+        cpu = CPU(engine='translator')
+        cpu.load(0xc000, bytes([0x04, 0x04, 0x00]))
+        cpu.PC = 0xc000
+
+        cpu.run(1)
+        self.assertEqual(cpu.B, 2)
+        self.assertIn(0xc000, cpu.translator.blocks)
+
+        # INC B -> INC C
+        cpu.write8(0xc001, 0x0c)
+        self.assertNotIn(0xc000, cpu.translator.blocks)
+
+        cpu.PC = 0xc000
+        cpu.run(1)
+        self.assertEqual(cpu.B, 3)
+        self.assertEqual(cpu.C, 1)
+
+    def test_block_rewrites_itself(self):
+        # The INC (HL) turns the INC B after it, in the same block, into
+        # DEC B before it runs
+        #   C000 LD HL, 0xC004; INC (HL); INC B; JR -2
+        results = []
+        for engine in ENGINES:
+            cpu = CPU(engine=engine)
+            cpu.load(0xc000, bytes([0x21, 0x04, 0xc0, 0x34, 0x04, 0x18, 0xfe]))
+            cpu.PC = 0xc000
+
+            cpu.run(100)
+            results.append((cpu.B, cpu.PC, cpu.cycles, cpu.M[0xc004]))
+
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(results[1][:2], (0xff, 0xc005))
+
+    def test_read_only_pages_not_watched(self):
+        cpu = CPU(engine='translator')
+        cpu.load(0x0000, PROGRAM)
+        cpu.bus.map_dmg()
+
+        cpu.run(1)
+
+        self.assertNotIn(0x00, cpu.translator.watches)
+
+    def test_unknown_engine(self):
+        with self.assertRaises(ValueError):
+            CPU(engine='jit')